@@ -1,29 +1,55 @@
 """Command line interface for readvideo."""
 
 import asyncio
+import re
 import sys
-from typing import Optional, Union
+import traceback
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, List, Optional, Sequence, Tuple, Union
 
 import click
-from rich.console import Console
+from rich.cells import cell_len
+from rich.console import Console, Group
 from rich.panel import Panel
-from rich.table import Table
+from rich.text import Text
 
-from readvideo.utils import is_youtube_url, is_bilibili_url
-from readvideo.platforms.bilibili import BilibiliHandler
-from readvideo.platforms.local import LocalMediaHandler
-from readvideo.platforms.youtube import YouTubeHandler
-from readvideo.user_content.bilibili_user import BilibiliUserHandler
-from readvideo.user_content.twitter import TwitterHandler
-from readvideo.user_content.utils import validate_date_with_range_check
-from readvideo.user_content.youtube_user import YouTubeUserHandler
+from readvideo.core.whisper_wrapper import BACKENDS as WHISPER_BACKENDS
 
-console = Console()
+# Platform and user-content handlers pull in yt-dlp, bilibili-api, httpx and
+# friends, so they are imported inside the command that needs them to keep
+# `--help`, `info` and argument errors fast.
 
+console = Console(highlight=False)
 
-def print_banner():
-    """Print application banner."""
-    banner = """
+# Default model path shared by every command's --whisper-model option
+_DEFAULT_WHISPER_MODEL = "~/.whisper-models/ggml-large-v3.bin"
+
+# --whisper-backend, shared by every transcribing command
+_whisper_backend_option = click.option(
+    "--whisper-backend",
+    type=click.Choice(WHISPER_BACKENDS),
+    default="whisper_cpp",
+    show_default=True,
+    help="Transcription engine: whisper.cpp CLI, or in-process faster-whisper "
+    "(int8 on CPU; --whisper-model then names a model such as large-v3-turbo, "
+    "the default when a ggml file is given)",
+)
+
+# Matches the host part of YouTube and Bilibili URLs (scheme and
+# subdomains such as www., m. or space. are optional)
+_URL_KIND_RE = re.compile(
+    r"(?:https?://)?(?:[\w-]+\.)*"
+    r"(?:(?P<youtube>youtube\.com|youtu\.be)|(?P<bilibili>bilibili\.com|b23\.tv))"
+    r"(?:[/:?#]|$)",
+    re.IGNORECASE,
+)
+
+
+# Markup is parsed once here instead of on every print_banner() call
+_BANNER_PANEL = Panel(
+    Text.from_markup(
+        """
 [bold cyan]ReadVideo[/bold cyan] - Video & Audio Transcription Tool
 
 Supported Platforms:
@@ -31,9 +57,101 @@ Supported Platforms:
   • [blue]Bilibili[/blue] - Auto download and transcribe audio
   • [yellow]Local Files[/yellow] - Support audio and video file transcription
     """
-    console.print(Panel(banner, title="🎬 ReadVideo", border_style="cyan"))
+    ),
+    title="🎬 ReadVideo",
+    border_style="cyan",
+)
+
+
+# Static body of the `info` command, built once at import
+_INFO_EXAMPLES = (
+    "readvideo https://www.youtube.com/watch?v=abc123",
+    "readvideo --auto-detect https://www.youtube.com/watch?v=abc123",
+    "readvideo https://www.bilibili.com/video/BV1234567890",
+    "readvideo ~/Music/podcast.mp3",
+    "readvideo ~/Videos/lecture.mp4 --output-dir ./transcripts",
+)
+_INFO_GROUP = Group(
+    _BANNER_PANEL,
+    Text("\n🚀 Usage examples:", style="bold"),
+    Text("\n".join(f"  {example}" for example in _INFO_EXAMPLES), style="dim"),
+    Text("\n📖 More information:", style="bold"),
+    Text("  GitHub: https://github.com/learnerLj/readvideo", style="dim"),
+)
+
+
+def print_banner():
+    """Print application banner."""
+    console.print(_BANNER_PANEL)
 
 
+def _kv_block(rows: Sequence[Tuple[Union[str, Text], Any]]) -> Text:
+    """Format key/value rows as a two-column block of plain text.
+
+    Keys are padded once to the widest key, so no table layout pass is
+    needed. The layout matches the borderless Table this replaced: one
+    leading space per row and two spaces between the columns. Values are
+    taken literally (no markup).
+
+    Args:
+        rows: (key, value) pairs in display order; a key may be a styled
+            Text, e.g. for section headings, and values are printed with
+            str()
+
+    Returns:
+        Text ready to print
+    """
+    width = max((cell_len(str(key)) for key, _ in rows), default=0)
+    block = Text()
+    for i, (key, value) in enumerate(rows):
+        block.append("\n " if i else " ")
+        if isinstance(key, Text):
+            block.append_text(key)
+        else:
+            block.append(key, style="cyan")
+        block.append(" " * (width - cell_len(str(key)) + 2))
+        block.append("" if value is None else str(value), style="white")
+    return block
+
+
+def _run_async(coro):
+    """Run a coroutine to completion, preferring uvloop when installed.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(coro)
+
+
+class DateType(click.ParamType):
+    """Click parameter type for YYYY-MM-DD dates within the accepted range.
+
+    The value is checked while Click parses the command line, so invalid
+    dates are reported as usage errors before the command body runs.
+    """
+
+    name = "date"
+
+    def convert(self, value, param, ctx):
+        """Validate the date string and return it unchanged."""
+        from readvideo.user_content.utils import validate_date_with_range_check
+
+        is_valid, error_message = validate_date_with_range_check(value)
+        if not is_valid:
+            self.fail(error_message, param, ctx)
+        return value
+
+
+@lru_cache(maxsize=1024)
 def detect_input_type(input_str: str) -> str:
     """Detect the type of input (youtube, bilibili, or local file).
 
@@ -43,48 +161,74 @@ def detect_input_type(input_str: str) -> str:
     Returns:
         Input type: 'youtube', 'bilibili', or 'local'
     """
-    if is_youtube_url(input_str):
-        return "youtube"
-    elif is_bilibili_url(input_str):
-        return "bilibili"
-    else:
+    match = _URL_KIND_RE.match(input_str)
+    if match is None:
         return "local"
+    return "youtube" if match.group("youtube") else "bilibili"
+
+
+_PROCESS_OPTIONS = (
+    click.option(
+        "--auto-detect",
+        is_flag=True,
+        help="Enable automatic language detection (default: Chinese)",
+    ),
+    click.option(
+        "--output-dir",
+        "-o",
+        type=click.Path(),
+        help="Output directory (default: current directory or input file directory)",
+    ),
+    click.option(
+        "--no-cleanup", is_flag=True, help="Do not clean up temporary files"
+    ),
+    click.option(
+        "--no-cache",
+        is_flag=True,
+        help="Ignore cached metadata, audio and transcripts from earlier runs",
+    ),
+    click.option(
+        "--info-only",
+        is_flag=True,
+        help="Show input information only, do not process",
+    ),
+    click.option(
+        "--whisper-model",
+        default=_DEFAULT_WHISPER_MODEL,
+        help="Path to Whisper model file",
+    ),
+    _whisper_backend_option,
+    click.option("--verbose", "-v", is_flag=True, help="Verbose output"),
+)
+
+
+def _process_options(f):
+    """Apply the options shared by the top-level command and `process`.
+
+    Args:
+        f: Command callback to decorate
+
+    Returns:
+        The decorated callback
+    """
+    # Applied in reverse so --help lists them in declaration order
+    for option in reversed(_PROCESS_OPTIONS):
+        f = option(f)
+    return f
 
 
 @click.command()
 @click.argument("input_source", required=True)
-@click.option(
-    "--auto-detect",
-    is_flag=True,
-    help="Enable automatic language detection (default: Chinese)",
-)
-@click.option(
-    "--output-dir",
-    "-o",
-    type=click.Path(),
-    help="Output directory (default: current directory or input file directory)",
-)
-@click.option(
-    "--no-cleanup", is_flag=True, help="Do not clean up temporary files"
-)
-@click.option(
-    "--info-only",
-    is_flag=True,
-    help="Show input information only, do not process",
-)
-@click.option(
-    "--whisper-model",
-    default="~/.whisper-models/ggml-large-v3.bin",
-    help="Path to Whisper model file",
-)
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@_process_options
 def main(
     input_source: str,
     auto_detect: bool,
     output_dir: Optional[str],
     no_cleanup: bool,
+    no_cache: bool,
     info_only: bool,
     whisper_model: str,
+    whisper_backend: str,
     verbose: bool,
 ):
     """ReadVideo - Video and Audio Transcription Tool
@@ -102,8 +246,10 @@ def main(
         auto_detect=auto_detect,
         output_dir=output_dir,
         no_cleanup=no_cleanup,
+        no_cache=no_cache,
         info_only=info_only,
         whisper_model=whisper_model,
+        whisper_backend=whisper_backend,
         verbose=verbose,
         proxy=None,
     )
@@ -118,9 +264,11 @@ def _process_input(
     whisper_model: str,
     verbose: bool,
     proxy: Optional[str] = None,
+    whisper_backend: str = "whisper_cpp",
+    no_cache: bool = False,
 ):
     """Core processing logic extracted from main()"""
-    if not verbose:
+    if not verbose and console.is_terminal:
         print_banner()
 
     # Detect input type
@@ -130,20 +278,35 @@ def _process_input(
         console.print(f"🔍 Detected input type: {input_type}", style="dim")
 
     try:
-        # Initialize appropriate handler
-        handler: Union[YouTubeHandler, BilibiliHandler, LocalMediaHandler]
+        # Initialize appropriate handler. URLs were already validated by
+        # detect_input_type's host match, which is at least as strict as
+        # the handlers' validate_url, so that check is not repeated here.
+        handler: Union[
+            "YouTubeHandler", "BilibiliHandler", "LocalMediaHandler"
+        ]
         if input_type == "youtube":
-            handler = YouTubeHandler(whisper_model, proxy=proxy)
-            if not handler.validate_url(input_source):
-                console.print("❌ Invalid YouTube URL", style="red")
-                sys.exit(1)
+            from readvideo.platforms.youtube import YouTubeHandler
+
+            handler = YouTubeHandler(
+                whisper_model,
+                proxy=proxy,
+                whisper_backend=whisper_backend,
+                use_cache=not no_cache,
+            )
         elif input_type == "bilibili":
-            handler = BilibiliHandler(whisper_model)
-            if not handler.validate_url(input_source):
-                console.print("❌ Invalid Bilibili URL", style="red")
-                sys.exit(1)
+            from readvideo.platforms.bilibili import BilibiliHandler
+
+            handler = BilibiliHandler(
+                whisper_model,
+                whisper_backend=whisper_backend,
+                use_cache=not no_cache,
+            )
         else:  # local file
-            handler = LocalMediaHandler(whisper_model)
+            from readvideo.platforms.local import LocalMediaHandler
+
+            handler = LocalMediaHandler(
+                whisper_model, whisper_backend=whisper_backend
+            )
             if not handler.validate_file(input_source):
                 console.print(
                     f"❌ File not found or format not supported: {input_source}",
@@ -172,11 +335,11 @@ def _process_input(
         console.print("\n⚠️ Operation interrupted by user", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"❌ Processing failed: {e}", style="red")
+        console.print(
+            f"❌ Processing failed: {e}", style="red", markup=False
+        )
         if verbose:
-            import traceback
-
-            console.print(traceback.format_exc(), style="dim")
+            console.print(traceback.format_exc(), style="dim", markup=False)
         sys.exit(1)
 
 
@@ -184,57 +347,57 @@ def show_info(handler, input_source: str, input_type: str):
     """Show information about the input without processing."""
 
     try:
-        if input_type in ["youtube", "bilibili"]:
+        if input_type != "local":
             info = handler.get_video_info(input_source)
 
-            table = Table(show_header=False, box=None)
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="white")
-
-            table.add_row("Platform", info.get("platform", "").title())
-            table.add_row("URL", info.get("url", ""))
+            rows = [
+                ("Platform", info.get("platform", "").title()),
+                ("URL", info.get("url", "")),
+            ]
 
             if input_type == "youtube":
-                table.add_row("Video ID", info.get("video_id", ""))
-                table.add_row(
-                    "Has Transcripts",
-                    "Yes" if info.get("has_transcripts") else "No",
+                rows.append(("Video ID", info.get("video_id", "")))
+                rows.append(
+                    (
+                        "Has Transcripts",
+                        "Yes" if info.get("has_transcripts") else "No",
+                    )
                 )
 
                 transcripts = info.get("available_transcripts", {})
                 if transcripts.get("manual"):
                     languages = [t["language"] for t in transcripts["manual"]]
-                    table.add_row("Manual Subtitles", ", ".join(languages))
+                    rows.append(("Manual Subtitles", ", ".join(languages)))
                 if transcripts.get("generated"):
                     languages = [
                         t["language"] for t in transcripts["generated"]
                     ]
-                    table.add_row("Auto Subtitles", ", ".join(languages))
+                    rows.append(("Auto Subtitles", ", ".join(languages)))
             else:  # bilibili
-                table.add_row("BV ID", info.get("bv_id", ""))
-                table.add_row("Note", info.get("note", ""))
+                rows.append(("BV ID", info.get("bv_id", "")))
+                rows.append(("Note", info.get("note", "")))
 
-            console.print(table)
+            console.print(_kv_block(rows))
 
         else:  # local file
             info = handler.get_file_info(input_source)
 
-            table = Table(show_header=False, box=None)
-            table.add_column("Property", style="cyan")
-            table.add_column("Value", style="white")
-
-            table.add_row("Filename", info["name"])
-            table.add_row("Format", info["extension"].upper())
-            table.add_row("Size", f"{info['size'] / 1024 / 1024:.1f} MB")
-            table.add_row("Type", "Audio" if info["is_audio"] else "Video")
+            rows = [
+                ("Filename", info["name"]),
+                ("Format", info["extension"].upper()),
+                ("Size", f"{info['size'] / 1024 / 1024:.1f} MB"),
+                ("Type", "Audio" if info["is_audio"] else "Video"),
+            ]
 
             if info.get("duration_formatted"):
-                table.add_row("Duration", info["duration_formatted"])
+                rows.append(("Duration", info["duration_formatted"]))
 
-            console.print(table)
+            console.print(_kv_block(rows))
 
     except Exception as e:
-        console.print(f"❌ Failed to get information: {e}", style="red")
+        console.print(
+            f"❌ Failed to get information: {e}", style="red", markup=False
+        )
 
 
 def show_results(result: dict, verbose: bool):
@@ -243,87 +406,75 @@ def show_results(result: dict, verbose: bool):
         console.print("❌ Processing failed", style="red")
         return
 
-    console.print("\n✅ Processing completed!", style="bold green")
-
-    # Create results table
-    table = Table(show_header=False, box=None)
-    table.add_column("Item", style="cyan")
-    table.add_column("Information", style="white")
-
-    table.add_row("Platform", result.get("platform", "").title())
-    table.add_row(
-        "Method",
+    rows = [
+        ("Platform", result.get("platform", "").title()),
         (
-            "Transcript"
-            if result.get("method") == "transcript"
-            else "Audio Transcription"
+            "Method",
+            (
+                "Transcript"
+                if result.get("method") == "transcript"
+                else "Audio Transcription"
+            ),
         ),
-    )
-    # Escape brackets for rich display
-    output_file_display = result.get("output_file", "").replace("[", r"\[").replace("]", r"\]")
-    table.add_row("Output File", output_file_display)
+        ("Output File", result.get("output_file", "")),
+    ]
 
     if result.get("method") == "transcript":
         transcript_info = result.get("transcript_info", {})
-        table.add_row("Subtitle Type", transcript_info.get("type", ""))
-        table.add_row("Language", transcript_info.get("language", ""))
+        rows.append(("Subtitle Type", transcript_info.get("type", "")))
+        rows.append(("Language", transcript_info.get("language", "")))
         if result.get("segment_count"):
-            table.add_row("Segments", str(result["segment_count"]))
+            rows.append(("Segments", str(result["segment_count"])))
     else:
-        table.add_row("Language", result.get("language", ""))
+        rows.append(("Language", result.get("language", "")))
 
-    console.print(table)
+    # Collect everything and render it in a single print
+    items = [
+        Text("\n✅ Processing completed!", style="bold green"),
+        _kv_block(rows),
+    ]
 
-    # Show text preview
+    # Show text preview; it is decoration for interactive use only, the
+    # full transcript is already in the output file
     text = result.get("text", "")
-    if text:
-        preview = text[:200] + "..." if len(text) > 200 else text
-        console.print(f"\n📝 Transcription preview:\n{preview}", style="dim")
+    if text and console.is_terminal:
+        preview = text if len(text) <= 200 else f"{text[:200]}..."
+        items.append(
+            Text(f"\n📝 Transcription preview:\n{preview}", style="dim")
+        )
 
     if verbose and result.get("temp_files"):
-        console.print(
-            f"\n🗑️ Temporary files: {len(result['temp_files'])} cleaned up",
-            style="dim",
+        items.append(
+            Text(
+                f"\n🗑️ Temporary files: {len(result['temp_files'])} cleaned up",
+                style="dim",
+            )
         )
 
+    console.print(Group(*items))
+
 
 def show_supported_formats(handler):
     """Show supported file formats."""
     formats = handler.list_supported_formats()
 
-    console.print("\n📋 Supported file formats:", style="bold")
-
-    table = Table(show_header=False, box=None)
-    table.add_column("Type", style="cyan")
-    table.add_column("Formats", style="white")
-
-    table.add_row("Audio", ", ".join(formats["audio_formats"]))
-    table.add_row("Video", ", ".join(formats["video_formats"]))
-
-    console.print(table)
+    console.print(
+        Group(
+            Text("\n📋 Supported file formats:", style="bold"),
+            _kv_block(
+                [
+                    ("Audio", ", ".join(formats["audio_formats"])),
+                    ("Video", ", ".join(formats["video_formats"])),
+                ]
+            ),
+        )
+    )
 
 
 @click.command()
 def info():
     """Show tool information and usage help."""
-    print_banner()
-
-    console.print("\n🚀 Usage examples:", style="bold")
-    examples = [
-        "readvideo https://www.youtube.com/watch?v=abc123",
-        "readvideo --auto-detect https://www.youtube.com/watch?v=abc123",
-        "readvideo https://www.bilibili.com/video/BV1234567890",
-        "readvideo ~/Music/podcast.mp3",
-        "readvideo ~/Videos/lecture.mp4 --output-dir ./transcripts",
-    ]
-
-    for example in examples:
-        console.print(f"  {example}", style="dim")
-
-    console.print("\n📖 More information:", style="bold")
-    console.print(
-        "  GitHub: https://github.com/learnerLj/readvideo", style="dim"
-    )
+    console.print(_INFO_GROUP)
 
 
 # Create CLI group for multiple commands
@@ -343,31 +494,7 @@ def cli(ctx, proxy):
 # Add single video processing as 'process' command
 @cli.command("process")
 @click.argument("input_source", required=True)
-@click.option(
-    "--auto-detect",
-    is_flag=True,
-    help="Enable automatic language detection (default: Chinese)",
-)
-@click.option(
-    "--output-dir",
-    "-o",
-    type=click.Path(),
-    help="Output directory (default: current directory or input file directory)",
-)
-@click.option(
-    "--no-cleanup", is_flag=True, help="Do not clean up temporary files"
-)
-@click.option(
-    "--info-only",
-    is_flag=True,
-    help="Show input information only, do not process",
-)
-@click.option(
-    "--whisper-model",
-    default="~/.whisper-models/ggml-large-v3.bin",
-    help="Path to Whisper model file",
-)
-@click.option("--verbose", "-v", is_flag=True, help="Verbose output")
+@_process_options
 @click.pass_context
 def process_single(
     ctx,
@@ -375,8 +502,10 @@ def process_single(
     auto_detect,
     output_dir,
     no_cleanup,
+    no_cache,
     info_only,
     whisper_model,
+    whisper_backend,
     verbose,
 ):
     """Process single video, audio file or URL."""
@@ -389,8 +518,10 @@ def process_single(
         auto_detect=auto_detect,
         output_dir=output_dir,
         no_cleanup=no_cleanup,
+        no_cache=no_cache,
         info_only=info_only,
         whisper_model=whisper_model,
+        whisper_backend=whisper_backend,
         verbose=verbose,
         proxy=proxy,
     )
@@ -408,6 +539,7 @@ def process_single(
 )
 @click.option(
     "--start-date",
+    type=DateType(),
     help="Start date for video filtering (YYYY-MM-DD format, e.g., 2024-01-15). "
     "Videos published on or after this date will be included. "
     "Date must be between 2005-01-01 and today.",
@@ -415,15 +547,57 @@ def process_single(
 @click.option(
     "--max-videos", type=int, help="Maximum number of videos to process"
 )
+@click.option(
+    "--batch-size",
+    type=int,
+    default=8,
+    show_default=True,
+    help="Number of videos transcribed per whisper-cli run (model loads once per batch)",
+)
+@click.option(
+    "--pipeline-depth",
+    type=int,
+    default=2,
+    show_default=True,
+    help="Number of batches downloaded ahead while another batch is transcribed",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of whisper-cli processes transcribing batches in parallel "
+    "(each loads its own copy of the model; faster_whisper always uses 1)",
+)
+@click.option(
+    "--download-workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of videos downloaded concurrently within a batch",
+)
 @click.option(
     "--whisper-model",
-    default="~/.whisper-models/ggml-large-v3.bin",
+    default=_DEFAULT_WHISPER_MODEL,
     help="Path to Whisper model file",
 )
+@_whisper_backend_option
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.pass_context
 def user_command(
-    ctx, user_input, output_dir, start_date, max_videos, whisper_model, verbose
+    ctx,
+    user_input,
+    output_dir,
+    start_date,
+    max_videos,
+    batch_size,
+    pipeline_depth,
+    jobs,
+    download_workers,
+    whisper_model,
+    whisper_backend,
+    verbose,
 ):
     """Process all videos from a Bilibili user.
 
@@ -440,27 +614,52 @@ def user_command(
 
     Note: Date must be in YYYY-MM-DD format and between 2005-01-01 and today.
     """
-    if not verbose:
-        print_banner()
+    from readvideo.user_content.bilibili_user import BilibiliUserHandler
 
-    # Validate start date format if provided
-    if start_date:
-        is_valid, error_message = validate_date_with_range_check(start_date)
-        if not is_valid:
-            console.print(f"❌ {error_message}", style="red")
-            sys.exit(1)
+    if not verbose and console.is_terminal:
+        print_banner()
 
     # Validate max_videos
     if max_videos is not None and max_videos <= 0:
         console.print("❌ max-videos must be a positive integer", style="red")
         sys.exit(1)
 
+    if batch_size <= 0:
+        console.print("❌ batch-size must be a positive integer", style="red")
+        sys.exit(1)
+
+    if pipeline_depth <= 0:
+        console.print(
+            "❌ pipeline-depth must be a positive integer", style="red"
+        )
+        sys.exit(1)
+
+    if jobs <= 0:
+        console.print("❌ jobs must be a positive integer", style="red")
+        sys.exit(1)
+
+    if jobs > 1 and whisper_backend == "faster_whisper":
+        # The in-process model serves one batch at a time
+        console.print(
+            "⚠️ faster_whisper transcribes one batch at a time, using --jobs 1",
+            style="yellow",
+        )
+        jobs = 1
+
+    if download_workers <= 0:
+        console.print(
+            "❌ download-workers must be a positive integer", style="red"
+        )
+        sys.exit(1)
+
     try:
         # Get proxy from global context
         proxy = ctx.obj.get('proxy') if ctx.obj else None
         
         # Initialize user handler
-        user_handler = BilibiliUserHandler(whisper_model, proxy=proxy)
+        user_handler = BilibiliUserHandler(
+            whisper_model, proxy=proxy, whisper_backend=whisper_backend
+        )
 
         console.print("🎯 Starting user processing...", style="bold cyan")
         if start_date:
@@ -471,12 +670,16 @@ def user_command(
             console.print(f"🔢 Video limit: {max_videos} videos", style="dim")
 
         # Process user
-        result = asyncio.run(
+        result = _run_async(
             user_handler.process_user(
                 user_input=user_input,
                 output_dir=output_dir,
                 start_date=start_date,
                 max_videos=max_videos,
+                batch_size=batch_size,
+                pipeline_depth=pipeline_depth,
+                jobs=jobs,
+                download_workers=download_workers,
             )
         )
 
@@ -493,88 +696,107 @@ def user_command(
         console.print("\n⚠️ Operation interrupted by user", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"❌ User processing failed: {e}", style="red")
+        console.print(
+            f"❌ User processing failed: {e}", style="red", markup=False
+        )
         if verbose:
-            import traceback
-
-            console.print(traceback.format_exc(), style="dim")
+            console.print(traceback.format_exc(), style="dim", markup=False)
         sys.exit(1)
 
 
-def show_user_results(result: dict, verbose: bool):
-    """Show user processing results."""
-    console.print("\n🎉 User processing completed!", style="bold green")
+_USER_STAT_KEYS = (
+    "total_videos",
+    "processed_videos",
+    "failed_videos",
+    "skipped_videos",
+    "run_success_rate",
+    "overall_completed",
+    "overall_failed",
+    "overall_completion_rate",
+)
+_pick_user_stats = itemgetter(*_USER_STAT_KEYS)
+_USER_STAT_DEFAULTS = dict.fromkeys(_USER_STAT_KEYS, 0)
 
-    # Create results table
-    table = Table(show_header=False, box=None)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="white")
 
+def show_user_results(result: dict, verbose: bool):
+    """Show user processing results."""
     user_info = result.get("user_info", {})
-    stats = result.get("processing_stats", {})
-
-    # User information
-    table.add_row(
-        "User",
-        f"{user_info.get('name', 'Unknown')} (UID: {user_info.get('uid', 'N/A')})",
+    (
+        total_videos,
+        processed_this_run,
+        failed_this_run,
+        skipped_this_run,
+        run_success_rate,
+        overall_completed,
+        overall_failed,
+        overall_completion_rate,
+    ) = _pick_user_stats(
+        {**_USER_STAT_DEFAULTS, **result.get("processing_stats", {})}
     )
-    table.add_row("Followers", f"{user_info.get('follower', 0):,}")
-    table.add_row("", "")  # Empty row for separation
 
-    # Video statistics
-    table.add_row("Total Videos Found", str(stats.get("total_videos", 0)))
+    rows: List[Tuple[Union[str, Text], str]] = [
+        # User information
+        (
+            "User",
+            f"{user_info.get('name', 'Unknown')} (UID: {user_info.get('uid', 'N/A')})",
+        ),
+        ("Followers", f"{user_info.get('follower', 0):,}"),
+        ("", ""),  # Empty row for separation
+        # Video statistics
+        ("Total Videos Found", str(total_videos)),
+    ]
 
     # This run statistics
-    processed_this_run = stats.get("processed_videos", 0)
-    failed_this_run = stats.get("failed_videos", 0)
-    skipped_this_run = stats.get("skipped_videos", 0)
-
     if processed_this_run > 0 or failed_this_run > 0:
-        table.add_row("", "")  # Empty row for separation
-        table.add_row("[bold]This Run:", "")
-        table.add_row("  Processed", str(processed_this_run))
-        table.add_row("  Failed", str(failed_this_run))
+        rows.append(("", ""))  # Empty row for separation
+        rows.append((Text("This Run:", style="bold cyan"), ""))
+        rows.append(("  Processed", str(processed_this_run)))
+        rows.append(("  Failed", str(failed_this_run)))
         if skipped_this_run > 0:
-            table.add_row("  Skipped (already done)", str(skipped_this_run))
+            rows.append(("  Skipped (already done)", str(skipped_this_run)))
 
-        # Show success rate for this run if applicable
-        run_success_rate = stats.get("run_success_rate", 0)
-        if processed_this_run > 0 or failed_this_run > 0:
-            table.add_row("  Success Rate", f"{run_success_rate:.1%}")
+        # Show success rate for this run
+        rows.append(("  Success Rate", f"{run_success_rate:.1%}"))
 
     # Overall statistics
-    overall_completed = stats.get("overall_completed", 0)
-    overall_failed = stats.get("overall_failed", 0)
-    overall_completion_rate = stats.get("overall_completion_rate", 0)
-
     if overall_completed > 0 or overall_failed > 0:
-        table.add_row("", "")  # Empty row for separation
-        table.add_row("[bold]Overall Progress:", "")
-        table.add_row("  Completed", str(overall_completed))
+        rows.append(("", ""))  # Empty row for separation
+        rows.append((Text("Overall Progress:", style="bold cyan"), ""))
+        rows.append(("  Completed", str(overall_completed)))
         if overall_failed > 0:
-            table.add_row("  Failed", str(overall_failed))
-        table.add_row("  Completion Rate", f"{overall_completion_rate:.1%}")
+            rows.append(("  Failed", str(overall_failed)))
+        rows.append(("  Completion Rate", f"{overall_completion_rate:.1%}"))
 
-    console.print(table)
+    items = [
+        Text("\n🎉 User processing completed!", style="bold green"),
+        _kv_block(rows),
+    ]
 
     # Show processing details if verbose
     if verbose and result.get("results"):
-        console.print("\n📋 Processing details (this run):", style="bold")
-        for i, video_result in enumerate(
-            result["results"][:5]
-        ):  # Show first 5
+        items.append(
+            Text("\n📋 Processing details (this run):", style="bold")
+        )
+        for video_result in result["results"][:5]:  # Show first 5
             video_info = video_result.get("video_info", {})
             status = "✅" if video_result.get("success", False) else "❌"
-            console.print(
-                f"  {status} {video_info.get('title', 'Unknown')}", style="dim"
+            items.append(
+                Text(
+                    f"  {status} {video_info.get('title', 'Unknown')}",
+                    style="dim",
+                )
             )
 
         if len(result["results"]) > 5:
-            console.print(
-                f"  ... and {len(result['results']) - 5} more videos",
-                style="dim",
+            items.append(
+                Text(
+                    f"  ... and {len(result['results']) - 5} more videos",
+                    style="dim",
+                )
             )
 
+    console.print(Group(*items))
+
 
 # Add Twitter processing command
 @cli.command("twitter")
@@ -588,11 +810,13 @@ def show_user_results(result: dict, verbose: bool):
 )
 @click.option(
     "--start-date",
+    type=DateType(),
     help="Start date for tweet filtering (YYYY-MM-DD format, e.g., 2024-01-15). "
     "Tweets published on or after this date will be included.",
 )
 @click.option(
     "--end-date",
+    type=DateType(),
     help="End date for tweet filtering (YYYY-MM-DD format, e.g., 2024-12-31). "
     "Tweets published on or before this date will be included.",
 )
@@ -646,35 +870,22 @@ def twitter_command(
 
     Note: Dates must be in YYYY-MM-DD format.
     """
-    if not verbose:
+    from readvideo.user_content.twitter import TwitterHandler
+    from readvideo.user_content.twitter.rss_fetcher import create_client
+
+    if not verbose and console.is_terminal:
         print_banner()
 
     # Clean username (remove @ if present)
     if username.startswith("@"):
         username = username[1:]
 
-    # Validate date formats if provided
-    if start_date:
-        is_valid, error_message = validate_date_with_range_check(start_date)
-        if not is_valid:
-            console.print(f"❌ Start date: {error_message}", style="red")
-            sys.exit(1)
-
-    if end_date:
-        is_valid, error_message = validate_date_with_range_check(end_date)
-        if not is_valid:
-            console.print(f"❌ End date: {error_message}", style="red")
-            sys.exit(1)
-
     # Validate max_pages
     if max_pages <= 0:
         console.print("❌ max-pages must be a positive integer", style="red")
         sys.exit(1)
 
     try:
-        # Initialize Twitter handler
-        twitter_handler = TwitterHandler(nitter_url)
-
         console.print("🐦 Starting Twitter processing...", style="bold cyan")
         if start_date:
             console.print(
@@ -686,18 +897,22 @@ def twitter_command(
             )
         console.print(f"📄 Page limit: {max_pages} pages", style="dim")
 
+        async def _process_user():
+            # One keep-alive client for every page and cursor request
+            async with create_client() as client:
+                twitter_handler = TwitterHandler(nitter_url, client=client)
+                return await twitter_handler.process_user(
+                    username=username,
+                    output_dir=output_dir,
+                    max_pages=max_pages,
+                    exclude_retweets=not include_retweets,
+                    exclude_replies=not include_replies,
+                    start_date=start_date,
+                    end_date=end_date,
+                )
+
         # Process user tweets
-        result = asyncio.run(
-            twitter_handler.process_user(
-                username=username,
-                output_dir=output_dir,
-                max_pages=max_pages,
-                exclude_retweets=not include_retweets,
-                exclude_replies=not include_replies,
-                start_date=start_date,
-                end_date=end_date,
-            )
-        )
+        result = _run_async(_process_user())
 
         if result.get("success", False):
             show_twitter_results(result, verbose)
@@ -712,37 +927,39 @@ def twitter_command(
         console.print("\n⚠️ Operation interrupted by user", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"❌ Twitter processing failed: {e}", style="red")
+        console.print(
+            f"❌ Twitter processing failed: {e}", style="red", markup=False
+        )
         if verbose:
-            import traceback
-
-            console.print(traceback.format_exc(), style="dim")
+            console.print(traceback.format_exc(), style="dim", markup=False)
         sys.exit(1)
 
 
 def show_twitter_results(result: dict, verbose: bool):
     """Show Twitter processing results."""
-    console.print("\n🎉 Twitter processing completed!", style="bold green")
-
-    # Create results table
-    table = Table(show_header=False, box=None)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="white")
-
-    table.add_row("Username", f"@{result.get('username', 'unknown')}")
-    table.add_row("Total Tweets", str(result.get("total_tweets", 0)))
-    table.add_row("Output Directory", result.get("output_dir", ""))
+    rows = [
+        ("Username", f"@{result.get('username', 'unknown')}"),
+        ("Total Tweets", str(result.get("total_tweets", 0))),
+        ("Output Directory", result.get("output_dir", "")),
+    ]
 
     output_files = result.get("output_files", {})
-    if output_files.get("json"):
-        table.add_row("JSON File", output_files["json"])
-    if output_files.get("markdown"):
-        table.add_row("Markdown File", output_files["markdown"])
-
-    console.print(table)
+    for label, key in (("JSON File", "json"), ("Markdown File", "markdown")):
+        path = output_files.get(key)
+        if path:
+            rows.append((label, path))
+
+    items = [
+        Text("\n🎉 Twitter processing completed!", style="bold green"),
+        _kv_block(rows),
+    ]
 
     if verbose:
-        console.print("\n📋 Processing completed successfully", style="dim")
+        items.append(
+            Text("\n📋 Processing completed successfully", style="dim")
+        )
+
+    console.print(Group(*items))
 
 
 # Add YouTube channel processing command
@@ -762,15 +979,56 @@ def show_twitter_results(result: dict, verbose: bool):
     type=int,
     help="Maximum number of videos to process (e.g., --max-videos 50)",
 )
+@click.option(
+    "--batch-size",
+    type=int,
+    default=8,
+    show_default=True,
+    help="Number of videos transcribed per whisper-cli run (model loads once per batch)",
+)
+@click.option(
+    "--pipeline-depth",
+    type=int,
+    default=2,
+    show_default=True,
+    help="Number of batches downloaded ahead while another batch is transcribed",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of whisper-cli processes transcribing batches in parallel "
+    "(each loads its own copy of the model; faster_whisper always uses 1)",
+)
+@click.option(
+    "--download-workers",
+    type=int,
+    default=1,
+    show_default=True,
+    help="Number of videos fetched or downloaded concurrently within a batch",
+)
 @click.option(
     "--whisper-model",
-    default="~/.whisper-models/ggml-large-v3.bin",
+    default=_DEFAULT_WHISPER_MODEL,
     help="Path to whisper model file for transcription",
 )
+@_whisper_backend_option
 @click.option("--verbose", "-v", is_flag=True, help="Verbose output")
 @click.pass_context
 def youtube_channel_command(
-    ctx, channel_input, output_dir, max_videos, whisper_model, verbose
+    ctx,
+    channel_input,
+    output_dir,
+    max_videos,
+    batch_size,
+    pipeline_depth,
+    jobs,
+    download_workers,
+    whisper_model,
+    whisper_backend,
+    verbose,
 ):
     """Process all videos from a YouTube channel.
 
@@ -785,7 +1043,9 @@ def youtube_channel_command(
       --max-videos 10   # Process only the first 10 videos
       --max-videos 100  # Process only the first 100 videos
     """
-    if not verbose:
+    from readvideo.user_content.youtube_user import YouTubeUserHandler
+
+    if not verbose and console.is_terminal:
         print_banner()
 
     # Note: Date filtering removed due to YouTube limitations
@@ -795,12 +1055,42 @@ def youtube_channel_command(
         console.print("❌ max-videos must be a positive integer", style="red")
         sys.exit(1)
 
+    if batch_size <= 0:
+        console.print("❌ batch-size must be a positive integer", style="red")
+        sys.exit(1)
+
+    if pipeline_depth <= 0:
+        console.print(
+            "❌ pipeline-depth must be a positive integer", style="red"
+        )
+        sys.exit(1)
+
+    if jobs <= 0:
+        console.print("❌ jobs must be a positive integer", style="red")
+        sys.exit(1)
+
+    if jobs > 1 and whisper_backend == "faster_whisper":
+        # The in-process model serves one batch at a time
+        console.print(
+            "⚠️ faster_whisper transcribes one batch at a time, using --jobs 1",
+            style="yellow",
+        )
+        jobs = 1
+
+    if download_workers <= 0:
+        console.print(
+            "❌ download-workers must be a positive integer", style="red"
+        )
+        sys.exit(1)
+
     try:
         # Get proxy from global context
         proxy = ctx.obj.get('proxy') if ctx.obj else None
         
         # Initialize YouTube channel handler
-        channel_handler = YouTubeUserHandler(whisper_model, proxy=proxy)
+        channel_handler = YouTubeUserHandler(
+            whisper_model, proxy=proxy, whisper_backend=whisper_backend
+        )
 
         console.print(
             "🎯 Starting YouTube channel processing...", style="bold cyan"
@@ -809,12 +1099,16 @@ def youtube_channel_command(
             console.print(f"🔢 Video limit: {max_videos} videos", style="dim")
 
         # Process channel
-        result = asyncio.run(
+        result = _run_async(
             channel_handler.process_channel(
                 channel_input=channel_input,
                 output_dir=output_dir,
                 start_date=None,  # Date filtering removed
                 max_videos=max_videos,
+                batch_size=batch_size,
+                pipeline_depth=pipeline_depth,
+                jobs=jobs,
+                download_workers=download_workers,
             )
         )
 
@@ -831,64 +1125,69 @@ def youtube_channel_command(
         console.print("\n⚠️ Operation interrupted by user", style="yellow")
         sys.exit(1)
     except Exception as e:
-        console.print(f"❌ Channel processing failed: {e}", style="red")
+        console.print(
+            f"❌ Channel processing failed: {e}", style="red", markup=False
+        )
         if verbose:
-            import traceback
-
-            console.print(traceback.format_exc(), style="dim")
+            console.print(traceback.format_exc(), style="dim", markup=False)
         sys.exit(1)
 
 
-def show_youtube_channel_results(result: dict, verbose: bool):
-    """Show YouTube channel processing results."""
-    console.print(
-        "\n🎉 YouTube channel processing completed!", style="bold green"
-    )
+_CHANNEL_RUN_STAT_ROWS = (
+    ("Attempted This Run", "attempted_this_run"),
+    ("Successful This Run", "successful_this_run"),
+    ("Failed This Run", "failed_this_run"),
+    ("Skipped This Run", "skipped_this_run"),
+    ("Total Completed", "total_completed"),
+)
 
-    # Create results table
-    table = Table(show_header=False, box=None)
-    table.add_column("Metric", style="cyan")
-    table.add_column("Value", style="white")
 
+def show_youtube_channel_results(result: dict, verbose: bool):
+    """Show YouTube channel processing results."""
     channel_info = result.get("channel_info", {})
     run_stats = result.get("run_stats", {})
 
-    table.add_row("Channel", channel_info.get("display_name", "unknown"))
-    table.add_row("Total Videos", str(result.get("total_videos", 0)))
-    table.add_row(
-        "Attempted This Run", str(run_stats.get("attempted_this_run", 0))
-    )
-    table.add_row(
-        "Successful This Run", str(run_stats.get("successful_this_run", 0))
-    )
-    table.add_row("Failed This Run", str(run_stats.get("failed_this_run", 0)))
-    table.add_row(
-        "Skipped This Run", str(run_stats.get("skipped_this_run", 0))
+    rows = [
+        ("Channel", channel_info.get("display_name", "unknown")),
+        ("Total Videos", str(result.get("total_videos", 0))),
+    ]
+    rows.extend(
+        (label, str(run_stats.get(key, 0)))
+        for label, key in _CHANNEL_RUN_STAT_ROWS
     )
-    table.add_row("Total Completed", str(run_stats.get("total_completed", 0)))
-    table.add_row("Output Directory", result.get("output_dir", ""))
+    rows.append(("Output Directory", result.get("output_dir", "")))
 
-    console.print(table)
+    items = [
+        Text("\n🎉 YouTube channel processing completed!", style="bold green"),
+        _kv_block(rows),
+    ]
 
     # Show sample results if available
     results = result.get("results", [])
     successful_results = [r for r in results if r.get("success", False)]
 
     if successful_results and verbose:
-        console.print("\n📋 Recent successful transcripts:", style="bold")
+        items.append(Text("\n📋 Recent successful transcripts:", style="bold"))
         for i, res in enumerate(successful_results[:5]):
             video_info = res.get("video_info", {})
             title = video_info.get("title", "Unknown title")[:50]
-            console.print(f"  {i+1}. {title}...", style="green")
+            items.append(Text(f"  {i+1}. {title}...", style="green"))
 
         if len(successful_results) > 5:
-            console.print(
-                f"  ... and {len(successful_results) - 5} more videos",
-                style="dim",
+            items.append(
+                Text(
+                    f"  ... and {len(successful_results) - 5} more videos",
+                    style="dim",
+                )
             )
 
     if verbose:
-        console.print("\n📋 Processing completed successfully", style="dim")
+        items.append(
+            Text("\n📋 Processing completed successfully", style="dim")
+        )
+
+    # One render and one write to the terminal for the whole summary
+    console.print(Group(*items))
 
 
 if __name__ == "__main__":
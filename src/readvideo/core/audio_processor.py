@@ -1,6 +1,10 @@
 """Audio processing utilities using ffmpeg."""
 
 import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
@@ -10,10 +14,117 @@ from rich.console import Console
 from readvideo.exceptions import AudioProcessingError, DependencyError
 from readvideo.utils import (
     sanitize_filename, validate_file_path, get_file_info, 
-    processing_context, cleanup_file_list
+    processing_context, cleanup_file_list, print_status
 )
 
-console = Console()
+try:
+    from tinytag import TinyTag
+except ImportError:
+    TinyTag = None
+
+console = Console(highlight=False)
+
+_AUDIO_FORMATS = frozenset(
+    {"mp3", "m4a", "wav", "flac", "ogg", "aac", "wma"}
+)
+_VIDEO_FORMATS = frozenset(
+    {"mp4", "mkv", "avi", "mov", "wmv", "flv", "webm", "m4v"}
+)
+_SUPPORTED_FORMATS = _AUDIO_FORMATS | _VIDEO_FORMATS
+
+
+# Resolved once so ffmpeg-python doesn't search PATH on every invocation
+_FFMPEG_BIN = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE_BIN = shutil.which("ffprobe") or "ffprobe"
+
+# Output formats that can hold an AAC stream without re-encoding
+_AAC_FORMATS = frozenset({"m4a", "aac"})
+
+# Containers whose duration tinytag can read without spawning ffprobe
+_TINYTAG_FORMATS = frozenset({"mp3", "m4a", "wav", "flac", "ogg", "aac"})
+
+
+def _read_duration(audio_file: str) -> float:
+    """Read the duration of an audio file in seconds.
+
+    Common audio containers are parsed in-process with tinytag when it is
+    installed; everything else (or anything tinytag cannot read) goes
+    through ffprobe.
+
+    Args:
+        audio_file: Path to audio file
+
+    Returns:
+        Duration in seconds
+    """
+    if TinyTag is not None and (
+        Path(audio_file).suffix.lower().lstrip(".") in _TINYTAG_FORMATS
+    ):
+        try:
+            duration = TinyTag.get(audio_file).duration
+            if duration:
+                return float(duration)
+        except Exception:
+            pass  # Fall back to ffprobe
+
+    try:
+        # Use ffmpeg.probe to get audio file info
+        probe_data = ffmpeg.probe(audio_file, cmd=_FFPROBE_BIN)
+        return float(probe_data["format"]["duration"])
+
+    except ffmpeg.Error as e:
+        error_msg = f"Failed to get audio duration: {e}"
+        if hasattr(e, "stderr") and e.stderr:
+            error_msg += f": {e.stderr.decode('utf-8', errors='ignore')[:200]}"
+        raise AudioProcessingError(error_msg)
+    except (KeyError, ValueError) as e:
+        raise AudioProcessingError(f"Failed to parse audio duration: {e}")
+    except FileNotFoundError:
+        raise DependencyError(
+            "ffprobe not found.",
+            dependency="ffmpeg",
+            install_command="Please install ffmpeg package."
+        )
+
+
+@lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Check once per process whether a working ffmpeg is on PATH."""
+    if not os.path.isabs(_FFMPEG_BIN):
+        return False  # Not found on PATH
+    try:
+        result = subprocess.run(
+            [_FFMPEG_BIN, "-version"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return False
+    return result.returncode == 0
+
+
+@lru_cache(maxsize=256)
+def _cached_audio_codec(
+    media_file: str, mtime_ns: int, size: int
+) -> Optional[str]:
+    """Return the codec of a file's first audio stream, or None if unknown.
+
+    mtime and size are part of the cache key so stale entries are not used.
+    """
+    try:
+        probe_data = ffmpeg.probe(
+            media_file, cmd=_FFPROBE_BIN, select_streams="a:0"
+        )
+        return probe_data["streams"][0]["codec_name"]
+    except (ffmpeg.Error, FileNotFoundError, KeyError, IndexError):
+        return None
+
+
+@lru_cache(maxsize=256)
+def _cached_duration(audio_file: str, mtime_ns: int, size: int) -> float:
+    """Cached _read_duration; mtime and size invalidate stale entries."""
+    return _read_duration(audio_file)
 
 
 class AudioProcessor:
@@ -21,48 +132,14 @@ class AudioProcessor:
 
     def __init__(self):
         """Initialize audio processor."""
-        self.supported_audio_formats = {
-            "mp3",
-            "m4a",
-            "wav",
-            "flac",
-            "ogg",
-            "aac",
-            "wma",
-        }
-        self.supported_video_formats = {
-            "mp4",
-            "mkv",
-            "avi",
-            "mov",
-            "wmv",
-            "flv",
-            "webm",
-            "m4v",
-        }
+        self.supported_audio_formats = _AUDIO_FORMATS
+        self.supported_video_formats = _VIDEO_FORMATS
         self.verify_ffmpeg()
 
     def verify_ffmpeg(self) -> None:
         """Verify that ffmpeg is available."""
-        try:
-            # Simple way to check if ffmpeg is available
-            # Try to run ffmpeg with version flag
-            import subprocess
-
-            result = subprocess.run(
-                ["ffmpeg", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            if result.returncode == 0:
-                return  # ffmpeg is available
-        except (
-            FileNotFoundError,
-            subprocess.TimeoutExpired,
-            subprocess.CalledProcessError,
-        ):
-            pass
+        if _ffmpeg_available():
+            return
 
         console.print(
             "⚠️ Warning: ffmpeg not found. Video processing may be limited.",
@@ -87,7 +164,7 @@ class AudioProcessor:
             file_info.update({
                 "is_audio": extension in self.supported_audio_formats,
                 "is_video": extension in self.supported_video_formats,
-                "is_supported": extension in (self.supported_audio_formats | self.supported_video_formats),
+                "is_supported": extension in _SUPPORTED_FORMATS,
             })
             
             return file_info
@@ -103,6 +180,7 @@ class AudioProcessor:
         video_file: str,
         output_file: Optional[str] = None,
         audio_format: str = "m4a",
+        skip_validation: bool = False,
     ) -> str:
         """Extract audio from video file using ffmpeg.
 
@@ -110,18 +188,21 @@ class AudioProcessor:
             video_file: Path to video file
             output_file: Path for output audio file (optional)
             audio_format: Output audio format
+            skip_validation: Skip the existence and format checks when the
+                caller has already inspected the file
 
         Returns:
             Path to extracted audio file
         """
-        if not os.path.exists(video_file):
-            raise FileNotFoundError(f"Video file not found: {video_file}")
+        if not skip_validation:
+            if not os.path.exists(video_file):
+                raise FileNotFoundError(f"Video file not found: {video_file}")
 
-        file_info = self.get_file_info(video_file)
-        if not file_info["is_video"]:
-            raise AudioProcessingError(
-                f"File is not a supported video format: {video_file}"
-            )
+            file_info = self.get_file_info(video_file)
+            if not file_info["is_video"]:
+                raise AudioProcessingError(
+                    f"File is not a supported video format: {video_file}"
+                )
 
         # Generate output filename if not provided
         if output_file is None:
@@ -130,7 +211,7 @@ class AudioProcessor:
                 video_path.parent / f"{video_path.stem}_temp.{audio_format}"
             )
 
-        console.print("🔄 Extracting audio track...", style="cyan")
+        print_status("🔄 Extracting audio track...", style="cyan")
 
         try:
             # Use ffmpeg-python to extract audio
@@ -140,11 +221,11 @@ class AudioProcessor:
                     output_file, vn=None, acodec="copy"
                 )  # vn=None means no video, copy audio codec
                 .overwrite_output()
-                .run(quiet=True)
+                .run(cmd=_FFMPEG_BIN, quiet=True)
             )
 
             if os.path.exists(output_file):
-                console.print(
+                print_status(
                     f"📁 Audio extraction completed: {os.path.basename(output_file)}",
                     style="green",
                 )
@@ -191,50 +272,26 @@ class AudioProcessor:
         if not os.path.exists(input_file):
             raise FileNotFoundError(f"Audio file not found: {input_file}")
 
-        console.print("🔄 Converting audio format...", style="cyan")
+        print_status("🔄 Converting audio format...", style="cyan")
 
         try:
             # Build ffmpeg-python stream for audio conversion
-            input_stream = ffmpeg.input(input_file)
-
-            # Add format-specific options
-            if target_format == "wav":
-                output_stream = ffmpeg.output(
-                    input_stream,
-                    output_file,
-                    ar=sample_rate,
-                    ac=channels,
-                    acodec="pcm_s16le",
-                )
-            elif target_format == "mp3":
-                output_stream = ffmpeg.output(
-                    input_stream,
-                    output_file,
-                    ar=sample_rate,
-                    ac=channels,
-                    acodec="libmp3lame",
-                    audio_bitrate="128k",
-                )
-            elif target_format == "m4a":
-                output_stream = ffmpeg.output(
-                    input_stream,
-                    output_file,
-                    ar=sample_rate,
-                    ac=channels,
-                    acodec="aac",
-                    audio_bitrate="128k",
-                )
-            else:
-                # Default conversion
-                output_stream = ffmpeg.output(
-                    input_stream, output_file, ar=sample_rate, ac=channels
-                )
+            output_stream = ffmpeg.output(
+                ffmpeg.input(input_file),
+                output_file,
+                **self._output_options(target_format, sample_rate, channels),
+            )
 
             # Run the conversion
-            ffmpeg.run(output_stream, overwrite_output=True, quiet=True)
+            ffmpeg.run(
+                output_stream,
+                cmd=_FFMPEG_BIN,
+                overwrite_output=True,
+                quiet=True,
+            )
 
             if os.path.exists(output_file):
-                console.print(
+                print_status(
                     f"✅ Audio conversion completed: {os.path.basename(output_file)}",
                     style="green",
                 )
@@ -258,11 +315,105 @@ class AudioProcessor:
                 install_command="Please install ffmpeg to convert audio formats."
             )
 
+    def extract_and_convert(
+        self,
+        video_file: str,
+        output_file: str,
+        target_format: str = "wav",
+        sample_rate: int = 16000,
+        channels: int = 1,
+    ) -> str:
+        """Decode a video's audio track straight into the target format.
+
+        Equivalent to extract_audio_from_video followed by
+        convert_audio_format, but done by a single ffmpeg run without an
+        intermediate audio file.
+
+        Args:
+            video_file: Path to video file
+            output_file: Path for output audio file
+            target_format: Target audio format
+            sample_rate: Target sample rate in Hz
+            channels: Number of audio channels (1=mono, 2=stereo)
+
+        Returns:
+            Path to converted audio file
+        """
+        if not os.path.exists(video_file):
+            raise FileNotFoundError(f"Video file not found: {video_file}")
+
+        print_status("🔄 Extracting and converting audio track...", style="cyan")
+
+        try:
+            (
+                ffmpeg.input(video_file)
+                .output(
+                    output_file,
+                    vn=None,
+                    **self._output_options(
+                        target_format, sample_rate, channels
+                    ),
+                )
+                .overwrite_output()
+                .run(cmd=_FFMPEG_BIN, quiet=True)
+            )
+
+            if os.path.exists(output_file):
+                print_status(
+                    f"✅ Audio conversion completed: {os.path.basename(output_file)}",
+                    style="green",
+                )
+                return output_file
+            else:
+                raise AudioProcessingError(
+                    "Audio conversion completed but output file not found"
+                )
+
+        except ffmpeg.Error as e:
+            error_msg = f"ffmpeg failed: {e}"
+            if hasattr(e, "stderr") and e.stderr:
+                error_msg += (
+                    f": {e.stderr.decode('utf-8', errors='ignore')[:300]}"
+                )
+            raise AudioProcessingError(error_msg)
+        except FileNotFoundError:
+            raise DependencyError(
+                "ffmpeg not found.",
+                dependency="ffmpeg",
+                install_command="Please install ffmpeg to extract audio from videos."
+            )
+
+    def _output_options(
+        self, target_format: str, sample_rate: int, channels: int
+    ) -> Dict[str, Any]:
+        """Build ffmpeg output options for the given audio format.
+
+        Args:
+            target_format: Target audio format
+            sample_rate: Target sample rate in Hz
+            channels: Number of audio channels
+
+        Returns:
+            Keyword arguments for ffmpeg.output
+        """
+        options: Dict[str, Any] = {"ar": sample_rate, "ac": channels}
+
+        # Add format-specific options
+        if target_format == "wav":
+            options["acodec"] = "pcm_s16le"
+        elif target_format == "mp3":
+            options.update(acodec="libmp3lame", audio_bitrate="128k")
+        elif target_format == "m4a":
+            options.update(acodec="aac", audio_bitrate="128k")
+
+        return options
+
     def process_media_file(
         self,
         input_file: str,
         target_format: str = "wav",
         output_dir: Optional[str] = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """Process media file (audio/video) for transcription.
 
@@ -270,6 +421,9 @@ class AudioProcessor:
             input_file: Path to input media file
             target_format: Target audio format for transcription
             output_dir: Output directory (optional)
+            stream: Return a running ffmpeg process that writes WAV to its
+                stdout (``process`` key) instead of writing an output file;
+                only supported for the wav target format
 
         Returns:
             Dict containing processing results
@@ -283,6 +437,21 @@ class AudioProcessor:
                 f"Supported video formats: {', '.join(self.supported_video_formats)}"
             )
 
+        if stream:
+            if target_format != "wav":
+                raise AudioProcessingError(
+                    "Streaming is only supported for the wav format"
+                )
+            return {
+                "success": True,
+                "input_file": input_file,
+                "output_file": None,
+                "process": self.stream_audio(input_file),
+                "file_info": file_info,
+                "temp_files": [],
+                "target_format": target_format,
+            }
+
         # Determine output directory
         if output_dir is None:
             output_dir = os.path.dirname(input_file)
@@ -319,21 +488,23 @@ class AudioProcessor:
                     style="cyan",
                 )
 
-                # Extract audio from video
-                temp_audio = os.path.join(output_dir, f"{base_name}_temp.m4a")
-                extracted_audio = self.extract_audio_from_video(
-                    input_file, temp_audio
+                audio_codec = _cached_audio_codec(
+                    input_file, file_info["mtime_ns"], file_info["size"]
                 )
-                temp_files.append(extracted_audio)
-
-                # Convert to target format if needed
-                if target_format != "m4a":
-                    final_audio_file = self.convert_audio_format(
-                        extracted_audio, output_file, target_format
+                if target_format in _AAC_FORMATS and audio_codec == "aac":
+                    # Remux the AAC track as-is, no decode or encode
+                    final_audio_file = self.extract_audio_from_video(
+                        input_file,
+                        output_file,
+                        audio_format=target_format,
+                        skip_validation=True,
                     )
-                    temp_files.append(final_audio_file)
                 else:
-                    final_audio_file = extracted_audio
+                    # Decode and convert in one pass, no intermediate file
+                    final_audio_file = self.extract_and_convert(
+                        input_file, output_file, target_format
+                    )
+                temp_files.append(final_audio_file)
 
             return {
                 "success": True,
@@ -349,24 +520,108 @@ class AudioProcessor:
             self.cleanup_temp_files(temp_files)
             raise AudioProcessingError(f"Media processing failed: {e}")
 
+    def stream_audio(
+        self,
+        input_file: str,
+        sample_rate: int = 16000,
+        channels: int = 1,
+    ) -> subprocess.Popen:
+        """Start ffmpeg decoding a media file to WAV on its stdout.
+
+        Nothing is written to disk; the caller reads ``process.stdout`` until
+        EOF and then calls ``process.wait()``. stderr is not piped, so it
+        can't fill up and stall ffmpeg; only ffmpeg errors reach it.
+
+        Args:
+            input_file: Path to audio or video file
+            sample_rate: Target sample rate in Hz
+            channels: Number of audio channels (1=mono, 2=stereo)
+
+        Returns:
+            The running ffmpeg process
+        """
+        if not os.path.exists(input_file):
+            raise FileNotFoundError(f"Media file not found: {input_file}")
+
+        try:
+            return (
+                ffmpeg.input(input_file)
+                .output(
+                    "pipe:",
+                    format="wav",
+                    vn=None,
+                    **self._output_options("wav", sample_rate, channels),
+                )
+                .global_args("-nostats", "-loglevel", "error")
+                .run_async(cmd=_FFMPEG_BIN, pipe_stdout=True)
+            )
+        except FileNotFoundError:
+            raise DependencyError(
+                "ffmpeg not found.",
+                dependency="ffmpeg",
+                install_command="Please install ffmpeg to decode audio."
+            )
+
+    def process_media_files(
+        self,
+        input_files: List[str],
+        target_format: str = "wav",
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Process several media files concurrently.
+
+        Each file is handled by process_media_file. The work itself runs in
+        ffmpeg child processes, so a thread per file is enough to keep
+        several of them busy at once.
+
+        Args:
+            input_files: Paths to input media files
+            target_format: Target audio format for transcription
+            output_dir: Output directory (optional)
+            max_workers: Maximum concurrent files (default: CPU count)
+
+        Returns:
+            List of result dicts in input order; failed files have
+            ``success`` set to False and an ``error`` message
+        """
+
+        def process_one(input_file: str) -> Dict[str, Any]:
+            try:
+                return self.process_media_file(
+                    input_file, target_format, output_dir
+                )
+            except Exception as e:
+                return {
+                    "success": False,
+                    "input_file": input_file,
+                    "error": str(e),
+                }
+
+        workers = max_workers or os.cpu_count() or 1
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(process_one, input_files))
+
     def cleanup_temp_files(self, file_list: List[str]) -> None:
         """Clean up temporary files.
 
         Args:
             file_list: List of file paths to remove
         """
-        failed_paths = cleanup_file_list(file_list, ignore_errors=True)
-        
+        removed, _ = cleanup_file_list(file_list, ignore_errors=True)
+
         # Log successful cleanups
-        for file_path in file_list:
-            if file_path not in failed_paths and not os.path.exists(file_path):
-                console.print(
-                    f"🗑️ Cleaning temporary file: {os.path.basename(file_path)}",
-                    style="dim",
-                )
+        for file_path in removed:
+            print_status(
+                f"🗑️ Cleaning temporary file: {os.path.basename(file_path)}",
+                style="dim",
+            )
 
     def get_audio_duration(self, audio_file: str) -> float:
-        """Get duration of audio file in seconds using ffmpeg.
+        """Get duration of audio file in seconds.
+
+        Results are cached per file path, modification time and size, so
+        repeated lookups of an unchanged file are free.
 
         Args:
             audio_file: Path to audio file
@@ -375,26 +630,11 @@ class AudioProcessor:
             Duration in seconds
         """
         try:
-            # Use ffmpeg.probe to get audio file info
-            probe_data = ffmpeg.probe(audio_file)
-            duration = float(probe_data["format"]["duration"])
-            return duration
-
-        except ffmpeg.Error as e:
-            error_msg = f"Failed to get audio duration: {e}"
-            if hasattr(e, "stderr") and e.stderr:
-                error_msg += (
-                    f": {e.stderr.decode('utf-8', errors='ignore')[:200]}"
-                )
-            raise AudioProcessingError(error_msg)
-        except (KeyError, ValueError) as e:
-            raise AudioProcessingError(f"Failed to parse audio duration: {e}")
-        except FileNotFoundError:
-            raise DependencyError(
-                "ffprobe not found.",
-                dependency="ffmpeg",
-                install_command="Please install ffmpeg package."
-            )
+            stat = os.stat(audio_file)
+        except OSError:
+            # Let the reader report the missing or unreadable file
+            return _read_duration(audio_file)
+        return _cached_duration(audio_file, stat.st_mtime_ns, stat.st_size)
 
     def validate_audio_for_transcription(self, audio_file: str) -> bool:
         """Validate that audio file is suitable for transcription.
@@ -406,8 +646,12 @@ class AudioProcessor:
             True if audio is valid for transcription
         """
         try:
-            duration = self.get_audio_duration(audio_file)
-            file_size = os.path.getsize(audio_file)
+            # One stat serves both the size check and the duration cache key
+            stat = os.stat(audio_file)
+            duration = _cached_duration(
+                audio_file, stat.st_mtime_ns, stat.st_size
+            )
+            file_size = stat.st_size
 
             # Basic validations
             if duration < 0.1:  # Less than 100ms
@@ -1,16 +1,27 @@
 """Supadata API transcript fetcher for YouTube videos."""
 
+import asyncio
+import itertools
 import json
 import os
 import re
 import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 from rich.console import Console
 
-console = Console()
+from readvideo.utils import parse_json, print_status
+
+console = Console(highlight=False)
+
+_VIDEO_ID_RE = re.compile(
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/"
+    r"|youtube\.com/.*[?&]v=)([a-zA-Z0-9_-]{11})"
+)
 
 
 class SupadataFetchError(Exception):
@@ -43,13 +54,32 @@ class SupadataTranscriptFetcher:
         self.base_url = supadata_config["base_url"]
         self.retry_all_keys = supadata_config.get("retry_all_keys", True)
         self.key_rotation_strategy = supadata_config.get("key_rotation_strategy", "round_robin")
-        self.current_key_index = 0
+        # Query all keys at once instead of one after another (uses quota
+        # on every key that answers)
+        self.parallel_keys = supadata_config.get("parallel_keys", False)
+        # next() on a C-level cycle iterator is atomic, so concurrent
+        # fetches cannot hand out the same position twice
+        self._key_cycle = itertools.cycle(self.api_keys)
+        # Reuse TCP/TLS connections across requests (e.g. a whole channel);
+        # every key talks to the same host, so one small pool is enough
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=max(4, len(self.api_keys)),
+            max_retries=0,  # Retries are handled by rotating API keys
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections."""
+        self.session.close()
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.config_path, 'rb') as f:
+                return parse_json(f.read())
         except FileNotFoundError:
             raise SupadataFetchError(
                 f"Config file not found: {self.config_path}. "
@@ -67,27 +97,15 @@ class SupadataTranscriptFetcher:
         Returns:
             Video ID or None if not found
         """
-        patterns = [
-            r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/embed\/)"
-            r"([a-zA-Z0-9_-]{11})",
-            r"youtube\.com\/.*[?&]v=([a-zA-Z0-9_-]{11})",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
-            if match:
-                return match.group(1)
-                
-        return None
+        match = _VIDEO_ID_RE.search(url)
+        return match.group(1) if match else None
 
     def _get_next_api_key(self) -> str:
         """Get next API key based on rotation strategy."""
         if self.key_rotation_strategy == "random":
             return random.choice(self.api_keys)
         elif self.key_rotation_strategy == "round_robin":
-            key = self.api_keys[self.current_key_index]
-            self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
-            return key
+            return next(self._key_cycle)
         else:
             # Default to first key
             return self.api_keys[0]
@@ -99,7 +117,7 @@ class SupadataTranscriptFetcher:
             'Content-Type': 'application/json'
         }
         
-        response = requests.get(api_url, params=params, headers=headers, timeout=timeout)
+        response = self.session.get(api_url, params=params, headers=headers, timeout=timeout)
         return response
 
     def fetch_transcript_from_url(self, url: str) -> Dict[str, Any]:
@@ -115,8 +133,10 @@ class SupadataTranscriptFetcher:
         
         # Use the transcript endpoint with URL parameter
         api_url = f"{self.base_url}/transcript"
-        params = {'url': url}
-        
+
+        if self.parallel_keys and self.retry_all_keys and len(self.api_keys) > 1:
+            return self._fetch_with_all_keys(api_url, url)
+
         # Try all keys if retry_all_keys is enabled
         keys_to_try = self.api_keys if self.retry_all_keys else [self._get_next_api_key()]
         last_exception = None
@@ -127,50 +147,7 @@ class SupadataTranscriptFetcher:
                 if len(keys_to_try) > 1:
                     console.print(f"🔑 Trying API key {i+1}/{len(keys_to_try)} (...{key_suffix})", style="dim")
                 
-                response = self._try_request_with_key(api_key, api_url, params)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                # Convert Supadata format to our standard format
-                if 'content' in data and data['content']:
-                    # Combine all transcript segments into text
-                    text_segments = []
-                    for segment in data['content']:
-                        if 'text' in segment:
-                            text_segments.append(segment['text'].strip())
-                    
-                    formatted_text = ' '.join(text_segments)
-                    
-                    video_id = self.extract_video_id(url)
-                    
-                    # Try to get title from API response (Supadata doesn't provide title)
-                    title = data.get('title', data.get('video_title', video_id))
-                    
-                    result = {
-                        "success": True,
-                        "text": formatted_text,
-                        "video_id": video_id,
-                        "title": title,  # Add title to result
-                        "transcript_info": {
-                            "type": "supadata_api",
-                            "language": data.get("lang", "unknown"),
-                            "language_code": data.get("lang", "unknown"),
-                            "api_key_suffix": key_suffix,
-                        },
-                        "raw_data": data['content'],
-                        "segment_count": len(data['content']),
-                        "source": "supadata"
-                    }
-                    
-                    console.print(
-                        f"✅ Successfully fetched transcript via Supadata ({len(data['content'])} segments) - Key: ...{key_suffix}",
-                        style="green"
-                    )
-                    
-                    return result
-                else:
-                    raise SupadataFetchError("No transcript content in API response")
+                return self._fetch_with_key(api_key, api_url, url)
                     
             except requests.exceptions.HTTPError as e:
                 last_exception = e
@@ -192,13 +169,152 @@ class SupadataTranscriptFetcher:
                         
             except (requests.exceptions.RequestException, json.JSONDecodeError, Exception) as e:
                 last_exception = e
-                console.print(f"🔄 Error with key (...{key_suffix}): {e}", style="yellow")
+                console.print(f"🔄 Error with key (...{key_suffix}): {e}", style="yellow", markup=False)
                 if not self.retry_all_keys or i == len(keys_to_try) - 1:
                     raise SupadataFetchError(f"All keys failed. Last error: {e}")
         
         # If we get here, all keys failed
         raise SupadataFetchError(f"All {len(keys_to_try)} API keys failed. Last error: {last_exception}")
 
+    def _fetch_with_all_keys(self, api_url: str, url: str) -> Dict[str, Any]:
+        """Request the transcript with every API key at once.
+
+        The first successful response wins and requests that have not
+        started yet are cancelled. Each key that answers counts against
+        its own quota, which is why this mode is opt-in.
+
+        Args:
+            api_url: Supadata transcript endpoint
+            url: YouTube URL
+
+        Returns:
+            Dict containing transcript data and metadata
+        """
+        console.print(f"🔑 Trying {len(self.api_keys)} API keys concurrently", style="dim")
+
+        executor = ThreadPoolExecutor(max_workers=len(self.api_keys))
+        futures = [
+            executor.submit(self._fetch_with_key, api_key, api_url, url)
+            for api_key in self.api_keys
+        ]
+        status_codes: List[Optional[int]] = []
+        last_exception: Optional[Exception] = None
+
+        try:
+            for future in as_completed(futures):
+                try:
+                    return future.result()
+                except requests.exceptions.HTTPError as e:
+                    status_code = (
+                        e.response.status_code if e.response is not None else None
+                    )
+                    if status_code == 404:
+                        # 404 is not key-specific, other keys won't help
+                        raise SupadataFetchError("Video not found or transcript not available.")
+                    status_codes.append(status_code)
+                    last_exception = e
+                except SupadataFetchError:
+                    raise
+                except Exception as e:
+                    last_exception = e
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        if status_codes and all(code == 401 for code in status_codes):
+            raise SupadataFetchError("All API keys invalid. Please check your Supadata API keys in config.")
+        if status_codes and all(code == 429 for code in status_codes):
+            raise SupadataFetchError("Rate limit exceeded for all keys. Please try again later.")
+        raise SupadataFetchError(f"All {len(self.api_keys)} API keys failed. Last error: {last_exception}")
+
+    def _fetch_with_key(self, api_key: str, api_url: str, url: str) -> Dict[str, Any]:
+        """Fetch and convert a transcript using a single API key.
+
+        Args:
+            api_key: Supadata API key
+            api_url: Supadata transcript endpoint
+            url: YouTube URL
+
+        Returns:
+            Dict containing transcript data and metadata
+        """
+        key_suffix = api_key[-8:] if len(api_key) > 8 else api_key
+
+        response = self._try_request_with_key(api_key, api_url, {'url': url})
+        response.raise_for_status()
+        
+        # Decode the raw body directly; skips requests' charset detection
+        data = parse_json(response.content)
+        
+        # Convert Supadata format to our standard format
+        if not data.get('content'):
+            raise SupadataFetchError("No transcript content in API response")
+
+        segments = data['content']
+        segment_count = len(segments)
+
+        # Combine all transcript segments into text
+        formatted_text = ' '.join(
+            segment['text'].strip() for segment in segments if 'text' in segment
+        )
+        
+        video_id = self.extract_video_id(url)
+        
+        # Try to get title from API response (Supadata doesn't provide title)
+        title = data.get('title', data.get('video_title', video_id))
+        
+        result = {
+            "success": True,
+            "text": formatted_text,
+            "video_id": video_id,
+            "title": title,  # Add title to result
+            "transcript_info": {
+                "type": "supadata_api",
+                "language": data.get("lang", "unknown"),
+                "language_code": data.get("lang", "unknown"),
+                "api_key_suffix": key_suffix,
+            },
+            "raw_data": segments,
+            "segment_count": segment_count,
+            "source": "supadata"
+        }
+        
+        console.print(
+            f"✅ Successfully fetched transcript via Supadata ({segment_count} segments) - Key: ...{key_suffix}",
+            style="green"
+        )
+        
+        return result
+
+    async def fetch_many(
+        self, urls: List[str], concurrency: int = 8
+    ) -> List[Union[Dict[str, Any], BaseException]]:
+        """Fetch transcripts for several URLs concurrently.
+
+        Requests run on a thread pool of ``concurrency`` workers, gated by
+        a semaphore of the same size, and share this fetcher's session.
+
+        Args:
+            urls: YouTube URLs
+            concurrency: Maximum number of URLs fetched at once
+
+        Returns:
+            Results in input order; a URL that failed has its exception
+            in place of the result dict
+        """
+        loop = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            async def fetch_one(url: str) -> Dict[str, Any]:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        executor, self.fetch_transcript_from_url, url
+                    )
+
+            return await asyncio.gather(
+                *(fetch_one(url) for url in urls), return_exceptions=True
+            )
+
     def save_transcript(self, transcript_data: Dict[str, Any], output_file: str) -> None:
         """Save transcript to file.
         
@@ -207,13 +323,13 @@ class SupadataTranscriptFetcher:
             output_file: Path to output file
         """
         try:
-            with open(output_file, "w", encoding="utf-8") as f:
-                f.write(transcript_data["text"])
+            # Encode once and hand the whole buffer to a single write
+            Path(output_file).write_bytes(
+                transcript_data["text"].encode("utf-8")
+            )
                 
             key_info = transcript_data.get("transcript_info", {}).get("api_key_suffix", "unknown")
-            # Escape brackets for rich display
-            display_path = output_file.replace("[", r"\[").replace("]", r"\]")
-            console.print(f"✅ Transcript saved via Supadata (key: ...{key_info}): {display_path}", style="green")
+            print_status(f"✅ Transcript saved via Supadata (key: ...{key_info}): {output_file}", style="green")
             
         except Exception as e:
             raise SupadataFetchError(f"Error saving transcript: {e}")
\ No newline at end of file
@@ -14,7 +14,10 @@ from youtube_transcript_api.formatters import TextFormatter
 from readvideo.exceptions import TranscriptFetchError, RetryableTranscriptError
 from readvideo.utils import extract_youtube_video_id
 
-console = Console()
+console = Console(highlight=False)
+
+# m.youtube.com is covered by youtube\.com
+_YOUTUBE_URL_RE = re.compile(r"youtube\.com|youtu\.be", re.IGNORECASE)
 
 
 class YouTubeTranscriptFetcher:
@@ -343,8 +346,4 @@ def is_youtube_url(url: str) -> bool:
     Returns:
         True if it's a YouTube URL
     """
-    youtube_patterns = [r"youtube\.com", r"youtu\.be", r"m\.youtube\.com"]
-
-    return any(
-        re.search(pattern, url, re.IGNORECASE) for pattern in youtube_patterns
-    )
+    return _YOUTUBE_URL_RE.search(url) is not None
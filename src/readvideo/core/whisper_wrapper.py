@@ -1,14 +1,100 @@
 """Wrapper for whisper-cli command line tool."""
 
+import importlib.util
 import os
 import shutil
 import subprocess
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 
-console = Console()
+console = Console(highlight=False)
+
+# Transcription engines understood by WhisperWrapper
+BACKENDS = ("whisper_cpp", "faster_whisper")
+
+# Where transcription runs; "auto" picks CUDA when a GPU is visible
+DEVICES = ("auto", "cpu", "cuda")
+
+# faster-whisper model used when the configured model is a whisper.cpp file.
+# large-v3-turbo keeps large-v3's encoder but has 4 decoder layers instead
+# of 32, and unlike the distil-* models it is multilingual (Chinese works).
+_DEFAULT_FASTER_WHISPER_MODEL = "large-v3-turbo"
+
+# Converted faster-whisper models are downloaded next to the ggml models
+_MODEL_DIR = "~/.whisper-models"
+
+# The shared models run with num_workers=1; callers on other threads
+# (e.g. pipelined batch jobs) take turns loading and using one model
+_INFERENCE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _find_executable(name: str) -> Optional[str]:
+    """shutil.which, looked up once per process for each name."""
+    return shutil.which(name)
+
+
+def _resolve_device(
+    device: str, compute_type: Optional[str]
+) -> Tuple[str, str]:
+    """Turn a device setting into a CTranslate2 (device, compute_type).
+
+    Args:
+        device: 'auto', 'cpu' or 'cuda'
+        compute_type: Explicit CTranslate2 compute type, or None for
+            float16 on CUDA and int8 on CPU
+
+    Returns:
+        Tuple of (device, compute_type)
+    """
+    if device == "auto":
+        import ctranslate2
+
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+    if compute_type is None:
+        compute_type = "float16" if device == "cuda" else "int8"
+    return device, compute_type
+
+
+@lru_cache(maxsize=2)
+def _load_faster_whisper(
+    model: str, batch_size: int, device: str, compute_type: str
+):
+    """Load a faster-whisper model once per process.
+
+    Every WhisperWrapper with the same model and batch size shares the
+    instance, so creating more handlers does not load the weights again.
+    With batch_size > 1 the model is wrapped in a BatchedInferencePipeline,
+    which splits the audio on VAD boundaries and pads the chunks into one
+    batch per encoder/decoder call.
+
+    Args:
+        model: faster-whisper model name or CTranslate2 model directory
+        batch_size: Number of speech chunks decoded per forward pass
+        device: CTranslate2 device ('cpu' or 'cuda')
+        compute_type: CTranslate2 compute type (e.g. 'int8', 'float16')
+
+    Returns:
+        faster_whisper.WhisperModel or BatchedInferencePipeline
+    """
+    from faster_whisper import BatchedInferencePipeline, WhisperModel
+
+    whisper_model = WhisperModel(
+        model,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 0,
+        num_workers=1,
+        download_root=os.path.expanduser(_MODEL_DIR),
+    )
+    if batch_size > 1:
+        return BatchedInferencePipeline(model=whisper_model)
+    return whisper_model
 
 
 class WhisperCliError(Exception):
@@ -24,25 +110,78 @@ class WhisperWrapper:
         self,
         model_path: str = "~/.whisper-models/ggml-large-v3.bin",
         whisper_cli_path: str = "whisper-cli",
+        backend: str = "whisper_cpp",
+        batch_size: int = 8,
+        device: str = "auto",
+        compute_type: Optional[str] = None,
     ):
         """Initialize WhisperWrapper.
 
         Args:
-            model_path: Path to the whisper model file
+            model_path: Path to the whisper model file; for the
+                faster_whisper backend a model name (e.g. 'large-v3-turbo',
+                'large-v3', or the English-only 'distil-large-v3') or a
+                CTranslate2 model directory
             whisper_cli_path: Path to whisper-cli executable
+            backend: 'whisper_cpp' (whisper-cli subprocess) or
+                'faster_whisper' (in-process CTranslate2, int8 on CPU);
+                falls back to whisper_cpp if faster-whisper is missing
+            batch_size: Number of speech chunks faster-whisper decodes in
+                one forward pass; 1 disables batched inference
+            device: 'auto', 'cpu' or 'cuda'. faster-whisper runs on the
+                chosen device; whisper.cpp uses whatever GPU support it was
+                built with unless this is 'cpu'
+            compute_type: faster-whisper compute type; defaults to float16
+                on CUDA and int8 on CPU
         """
+        if backend not in BACKENDS:
+            raise WhisperCliError(
+                f"Unknown backend '{backend}'. Choose from: {', '.join(BACKENDS)}"
+            )
+        if device not in DEVICES:
+            raise WhisperCliError(
+                f"Unknown device '{device}'. Choose from: {', '.join(DEVICES)}"
+            )
+        if (
+            backend == "faster_whisper"
+            and importlib.util.find_spec("faster_whisper") is None
+        ):
+            console.print(
+                "⚠️ faster-whisper not installed, using whisper.cpp instead",
+                style="yellow",
+            )
+            backend = "whisper_cpp"
+
+        self.backend = backend
         self.model_path = os.path.expanduser(model_path)
         self.whisper_cli_path = whisper_cli_path
-        self.verify_whisper_cli()
-        self.verify_model()
+        self.batch_size = max(1, batch_size)
+        self.device = device
+        self.compute_type = compute_type
+
+        if self.backend == "whisper_cpp":
+            self.verify_whisper_cli()
+            self.verify_model()
+
+    @property
+    def accepts_compressed(self) -> bool:
+        """Whether compressed audio (m4a, mp3, ...) can be passed as is.
+
+        faster-whisper decodes and resamples any input in-process with
+        PyAV; whisper-cli is always given 16 kHz WAV.
+        """
+        return self.backend == "faster_whisper"
 
     def verify_whisper_cli(self) -> None:
         """Verify that whisper-cli is available in PATH."""
-        if not shutil.which(self.whisper_cli_path):
+        resolved = _find_executable(self.whisper_cli_path)
+        if not resolved:
             raise WhisperCliError(
                 f"whisper-cli not found at '{self.whisper_cli_path}'. "
                 "Please ensure whisper.cpp is installed and whisper-cli is in PATH."
             )
+        # Run the resolved path so each transcription skips the PATH search
+        self.whisper_cli_path = resolved
 
     def verify_model(self) -> None:
         """Verify that the model file exists."""
@@ -75,7 +214,221 @@ class WhisperWrapper:
         if not os.path.exists(audio_file):
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
 
-        # Build command
+        if self.backend == "faster_whisper":
+            if not silent:
+                console.print("🎙️ Transcribing audio...", style="cyan")
+                self._print_language_info(language, auto_detect)
+            return self._transcribe_in_process(
+                audio_file, language, auto_detect, output_dir
+            )
+
+        cmd = self._build_command([audio_file], language, auto_detect, output_dir)
+
+        if not silent:
+            console.print("🎙️ Transcribing audio...", style="cyan")
+            self._print_language_info(language, auto_detect)
+
+        started = time.time()
+        try:
+            self._run(cmd, silent)
+        except subprocess.CalledProcessError as e:
+            error_msg = f"whisper-cli failed with exit code {e.returncode}"
+            if e.stderr:
+                error_msg += f": {e.stderr}"
+            raise WhisperCliError(error_msg)
+
+        return self._read_result(
+            audio_file, language, auto_detect, output_dir, started
+        )
+
+    def transcribe_batch(
+        self,
+        audio_files: List[str],
+        language: Optional[str] = "zh",
+        auto_detect: bool = False,
+        output_dir: Optional[str] = None,
+        silent: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe several audio files with a single whisper-cli run.
+
+        whisper-cli accepts multiple inputs per invocation, so the model is
+        loaded once for the whole batch instead of once per file. If the
+        batched run fails, files without fresh output are retried one by one.
+        With the faster_whisper backend the model is already resident, so
+        the files are simply transcribed in turn.
+
+        Args:
+            audio_files: Paths to audio files to transcribe
+            language: Language code (e.g., 'zh', 'en') or None for auto-detect
+            auto_detect: Whether to use auto language detection
+            output_dir: Directory to save output files (default: same as input)
+            silent: Whether to suppress detailed output (for batch processing)
+
+        Returns:
+            List of result dicts in input order; failed files have
+            ``success`` set to False and an ``error`` message
+        """
+        results: Dict[int, Dict[str, Any]] = {}
+        pending = []
+        for i, audio_file in enumerate(audio_files):
+            if os.path.exists(audio_file):
+                pending.append(i)
+            else:
+                results[i] = self._failed_result(
+                    audio_file, f"Audio file not found: {audio_file}"
+                )
+
+        if pending and self.backend == "faster_whisper":
+            # The model stays loaded between files, so no batching needed
+            for i in pending:
+                try:
+                    results[i] = self.transcribe(
+                        audio_files[i],
+                        language=language,
+                        auto_detect=auto_detect,
+                        output_dir=output_dir,
+                        silent=True,
+                    )
+                except (WhisperCliError, FileNotFoundError) as e:
+                    results[i] = self._failed_result(audio_files[i], str(e))
+        elif pending:
+            cmd = self._build_command(
+                [audio_files[i] for i in pending],
+                language,
+                auto_detect,
+                output_dir,
+            )
+
+            if not silent:
+                console.print(
+                    f"🎙️ Transcribing {len(pending)} audio files in one batch...",
+                    style="cyan",
+                )
+                self._print_language_info(language, auto_detect)
+
+            started = time.time()
+            try:
+                self._run(cmd, silent)
+            except subprocess.CalledProcessError:
+                console.print(
+                    "⚠️ Batch transcription failed, retrying files individually",
+                    style="yellow",
+                )
+
+            for i in pending:
+                audio_file = audio_files[i]
+                try:
+                    results[i] = self._read_result(
+                        audio_file, language, auto_detect, output_dir, started
+                    )
+                except WhisperCliError:
+                    try:
+                        results[i] = self.transcribe(
+                            audio_file,
+                            language=language,
+                            auto_detect=auto_detect,
+                            output_dir=output_dir,
+                            silent=True,
+                        )
+                    except (WhisperCliError, FileNotFoundError) as e:
+                        results[i] = self._failed_result(audio_file, str(e))
+
+        return [results[i] for i in range(len(audio_files))]
+
+    def _load_model(self):
+        """Return the shared faster-whisper model for this configuration.
+
+        Returns:
+            faster_whisper.WhisperModel or BatchedInferencePipeline
+        """
+        # A whisper.cpp ggml file can't be loaded by CTranslate2
+        model = self.model_path
+        if model.endswith(".bin"):
+            model = _DEFAULT_FASTER_WHISPER_MODEL
+        return _load_faster_whisper(
+            model,
+            self.batch_size,
+            *_resolve_device(self.device, self.compute_type),
+        )
+
+    def _transcribe_in_process(
+        self,
+        audio_file: str,
+        language: Optional[str],
+        auto_detect: bool,
+        output_dir: Optional[str],
+    ) -> Dict[str, Any]:
+        """Transcribe with faster-whisper and write the same text file
+        whisper-cli would.
+
+        Args:
+            audio_file: Path to audio file to transcribe
+            language: Language code or None
+            auto_detect: Whether to use auto language detection
+            output_dir: Directory to save output files (default: same as input)
+
+        Returns:
+            Dict containing transcription results and metadata
+        """
+        try:
+            options: Dict[str, Any] = {}
+            if self.batch_size > 1:
+                options["batch_size"] = self.batch_size
+            with _INFERENCE_LOCK:
+                # Loaded under the lock: lru_cache does not merge concurrent
+                # misses, so parallel jobs would each load their own copy
+                model = self._load_model()
+                segments, _ = model.transcribe(
+                    audio_file,
+                    language=None if auto_detect else language,
+                    vad_filter=True,
+                    beam_size=1,
+                    **options,
+                )
+                # segments is lazy; decoding happens while it is consumed
+                transcription_text = "\n".join(
+                    segment.text.strip() for segment in segments
+                ).strip()
+        except Exception as e:
+            raise WhisperCliError(f"faster-whisper failed: {e}")
+
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+            output_txt_file = os.path.join(
+                output_dir, f"{Path(audio_file).stem}.txt"
+            )
+        else:
+            output_txt_file = f"{audio_file}.txt"
+
+        with open(output_txt_file, "w", encoding="utf-8") as f:
+            f.write(transcription_text)
+
+        return {
+            "success": True,
+            "text": transcription_text,
+            "output_file": output_txt_file,
+            "language": language if not auto_detect else "auto",
+            "audio_file": audio_file,
+        }
+
+    def _build_command(
+        self,
+        audio_files: List[str],
+        language: Optional[str],
+        auto_detect: bool,
+        output_dir: Optional[str],
+    ) -> List[str]:
+        """Build the whisper-cli command line for one or more inputs.
+
+        Args:
+            audio_files: Input audio files
+            language: Language code or None
+            auto_detect: Whether to use auto language detection
+            output_dir: Output directory for text files, if any
+
+        Returns:
+            Command as a list of arguments
+        """
         cmd = [
             self.whisper_cli_path,
             "-m",
@@ -83,76 +436,111 @@ class WhisperWrapper:
             "-otxt",  # output text file
         ]
 
+        if self.device == "cpu":
+            cmd.append("-ng")  # no GPU
+
         # Add language parameter
         if not auto_detect and language:
             cmd.extend(["-l", language])
 
-        # Add output directory if specified
+        # Add one output path per input if an output directory is specified
         if output_dir:
             os.makedirs(output_dir, exist_ok=True)
-            output_file = os.path.join(output_dir, Path(audio_file).stem)
-            cmd.extend(["-of", output_file])
+            for audio_file in audio_files:
+                output_file = os.path.join(output_dir, Path(audio_file).stem)
+                cmd.extend(["-of", output_file])
 
-        cmd.append(audio_file)
+        cmd.extend(audio_files)
+        return cmd
 
-        if not silent:
-            console.print("🎙️ Transcribing audio...", style="cyan")
-            if auto_detect:
-                console.print(
-                    "🔍 Using automatic language detection...", style="yellow"
-                )
-            else:
-                lang_name = {"zh": "Chinese", "en": "English"}.get(
-                    language or "unknown", language or "unknown"
-                )
-                console.print(
-                    f"🌍 Using {lang_name} language recognition...",
-                    style="yellow",
-                )
+    def _print_language_info(
+        self, language: Optional[str], auto_detect: bool
+    ) -> None:
+        """Print which language mode is used for transcription."""
+        if auto_detect:
+            console.print(
+                "🔍 Using automatic language detection...", style="yellow"
+            )
+        else:
+            lang_name = {"zh": "Chinese", "en": "English"}.get(
+                language or "unknown", language or "unknown"
+            )
+            console.print(
+                f"🌍 Using {lang_name} language recognition...",
+                style="yellow",
+            )
 
-        try:
-            # Run whisper-cli with appropriate output control
-            if silent:
-                # Silent mode: capture all output to avoid cluttering during batch
-                subprocess.run(cmd, check=True, capture_output=True, text=True)
-            else:
-                # Single video mode: allow normal output for user to see progress
-                subprocess.run(cmd, check=True, text=True)
+    def _run(self, cmd: List[str], silent: bool) -> None:
+        """Run whisper-cli with appropriate output control.
 
-            # Find output text file
-            output_txt_file = self._find_output_file(audio_file, output_dir)
+        Args:
+            cmd: Command to run
+            silent: Whether to capture output instead of streaming it
+        """
+        if silent:
+            # Silent mode: capture all output to avoid cluttering during batch
+            subprocess.run(cmd, check=True, capture_output=True, text=True)
+        else:
+            # Single video mode: allow normal output for user to see progress
+            subprocess.run(cmd, check=True, text=True)
+
+    def _read_result(
+        self,
+        audio_file: str,
+        language: Optional[str],
+        auto_detect: bool,
+        output_dir: Optional[str],
+        started: float,
+    ) -> Dict[str, Any]:
+        """Read the transcription written by whisper-cli for one input.
 
-            if not output_txt_file or not os.path.exists(output_txt_file):
-                raise WhisperCliError(
-                    "Transcription completed but output file not found"
-                )
+        Args:
+            audio_file: Transcribed audio file
+            language: Language code used
+            auto_detect: Whether auto language detection was used
+            output_dir: Output directory if specified
+            started: time.time() before whisper-cli ran; older files are
+                leftovers from earlier runs and are not accepted
 
-            # Read transcription text
-            with open(output_txt_file, "r", encoding="utf-8") as f:
-                transcription_text = f.read().strip()
+        Returns:
+            Dict containing transcription results and metadata
+        """
+        output_txt_file = self._find_output_file(
+            audio_file, output_dir, started
+        )
 
-            return {
-                "success": True,
-                "text": transcription_text,
-                "output_file": output_txt_file,
-                "language": language if not auto_detect else "auto",
-                "audio_file": audio_file,
-            }
+        if not output_txt_file or not os.path.exists(output_txt_file):
+            raise WhisperCliError(
+                "Transcription completed but output file not found"
+            )
 
-        except subprocess.CalledProcessError as e:
-            error_msg = f"whisper-cli failed with exit code {e.returncode}"
-            if e.stderr:
-                error_msg += f": {e.stderr}"
-            raise WhisperCliError(error_msg)
+        with open(output_txt_file, "r", encoding="utf-8") as f:
+            transcription_text = f.read().strip()
+
+        return {
+            "success": True,
+            "text": transcription_text,
+            "output_file": output_txt_file,
+            "language": language if not auto_detect else "auto",
+            "audio_file": audio_file,
+        }
+
+    def _failed_result(self, audio_file: str, error: str) -> Dict[str, Any]:
+        """Build the result entry for a file that could not be transcribed."""
+        return {"success": False, "error": error, "audio_file": audio_file}
 
     def _find_output_file(
-        self, audio_file: str, output_dir: Optional[str] = None
+        self,
+        audio_file: str,
+        output_dir: Optional[str] = None,
+        started: Optional[float] = None,
     ) -> Optional[str]:
         """Find the output text file generated by whisper-cli.
 
         Args:
             audio_file: Original audio file path
             output_dir: Output directory if specified
+            started: Ignore files last modified before this time
 
         Returns:
             Path to output text file or None if not found
@@ -178,7 +566,11 @@ class WhisperWrapper:
         )
 
         for path in possible_paths:
-            if os.path.exists(path):
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                continue
+            if started is None or mtime >= started:
                 return path
 
         return None
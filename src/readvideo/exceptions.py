@@ -1,15 +1,25 @@
 """Simple exceptions for ReadVideo application."""
 
+from functools import lru_cache
 from typing import Any, Optional
 
 
+@lru_cache(maxsize=None)
+def _processing_error_code(processing_type: str) -> str:
+    """Build (once per type) the error code for a processing type."""
+    return f"RV_PROCESSING_{processing_type.upper()}"
+
+
 class ReadVideoError(Exception):
     """Base exception for ReadVideo application."""
+
+    error_code = "RV_ERROR"
     
-    def __init__(self, message: str, error_code: str = "RV_ERROR", context: Optional[dict] = None):
+    def __init__(self, message: str, error_code: Optional[str] = None, context: Optional[dict] = None):
         super().__init__(message)
-        self.error_code = error_code
-        self.context = context or {}
+        if error_code is not None:
+            self.error_code = error_code
+        self.context = context if context is not None else {}
 
 
 class ValidationError(ReadVideoError):
@@ -25,23 +35,31 @@ class ValidationError(ReadVideoError):
 
 class NetworkError(ReadVideoError):
     """Exception for network-related failures."""
+
+    error_code = "RV_NETWORK_ERROR"
     
     def __init__(self, message: str, status_code: Optional[int] = None):
         super().__init__(
             message,
-            error_code="RV_NETWORK_ERROR",
-            context={"status_code": status_code} if status_code else {}
+            context={"status_code": status_code} if status_code is not None else None
         )
 
 
 class ProcessingError(ReadVideoError):
     """Exception for processing failures (transcription, audio, etc)."""
     
-    def __init__(self, message: str, processing_type: str = "unknown"):
+    def __init__(self, message: str, processing_type: str = "unknown", **details: Any):
+        """Initialize the error.
+
+        Args:
+            message: Error message
+            processing_type: Kind of processing that failed
+            **details: Extra context, e.g. dependency or file_path
+        """
         super().__init__(
             message,
-            error_code=f"RV_PROCESSING_{processing_type.upper()}",
-            context={"processing_type": processing_type}
+            error_code=_processing_error_code(processing_type),
+            context={"processing_type": processing_type, **details}
         )
 
 
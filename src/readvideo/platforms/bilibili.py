@@ -1,29 +1,175 @@
 """Bilibili platform handler."""
 
+import hashlib
+import importlib.util
+import itertools
 import logging
 import os
 import re
+import shutil
 import subprocess
-import tempfile
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
+import ffmpeg
 from rich.console import Console
 
 from readvideo.core.audio_processor import AudioProcessor
 from readvideo.exceptions import AudioProcessingError, ValidationError, DependencyError
 from readvideo.utils import (
-    sanitize_filename, extract_bilibili_video_id, detect_file_format,
-    managed_temp_directory, cleanup_file_list
+    sanitize_filename, extract_bilibili_video_id, detect_audio_format,
+    managed_temp_directory, cleanup_file_list, move_file, parse_json,
+    write_json, print_status
 )
 from readvideo.core.whisper_wrapper import WhisperWrapper
 
-console = Console()
+try:
+    import av
+except ImportError:
+    av = None
+
+console = Console(highlight=False)
 logger = logging.getLogger(__name__)
 
+_BILIBILI_URL_RE = re.compile(r"bilibili\.com|b23\.tv", re.IGNORECASE)
+_AUDIO_EXTENSIONS = frozenset({".m4a", ".mp3", ".aac", ".wav", ".flac", ".ogg"})
+
+
+@lru_cache(maxsize=1)
+def _bbdown_available() -> bool:
+    """Check once per process whether BBDown is on PATH."""
+    return shutil.which("BBDown") is not None
+
+
+@lru_cache(maxsize=1)
+def _ytdlp_available() -> bool:
+    """Check once per process whether the yt-dlp library is importable.
+
+    find_spec locates the package without executing it; yt-dlp is only
+    imported if a download actually falls back to it.
+    """
+    if importlib.util.find_spec("yt_dlp") is not None:
+        logger.debug("yt-dlp Python library available")
+        return True
+    logger.debug("yt-dlp Python library not available")
+    return False
+
+
+def _move_to_unique_path(src: str, output_dir: str) -> str:
+    """Move a download into output_dir without overwriting another file.
 
-# Use the common utility function from utils
-# detect_audio_format is now available as detect_file_format in utils
+    A free name is claimed with an exclusive create (O_EXCL), so concurrent
+    downloads with the same name (threads or processes) each get their
+    own; move_file then moves the file over the placeholder, copying
+    only if the temp directory is on another filesystem.
+
+    Args:
+        src: Downloaded file
+        output_dir: Output directory
+
+    Returns:
+        Final path of the file
+    """
+    base, ext = os.path.splitext(os.path.basename(src))
+    # Join once; each retry only formats the suffix
+    stem = os.path.join(output_dir, base)
+    for counter in itertools.count():
+        final_path = f"{stem}{ext}" if counter == 0 else f"{stem}_{counter}{ext}"
+        try:
+            fd = os.open(final_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        break
+    try:
+        move_file(src, final_path)
+    except BaseException:
+        # Release the claimed name instead of leaving an empty placeholder
+        Path(final_path).unlink(missing_ok=True)
+        raise
+    return final_path
+
+
+def _is_whisper_wav(file_path: str) -> bool:
+    """Check whether a file is already 16 kHz mono 16-bit PCM WAV.
+
+    Only the RIFF header is read, so this costs no ffprobe call.
+    """
+    if Path(file_path).suffix.lower() != ".wav":
+        return False
+    try:
+        with wave.open(file_path, "rb") as wav:
+            return (
+                wav.getframerate() == 16000
+                and wav.getnchannels() == 1
+                and wav.getsampwidth() == 2
+            )
+    except (wave.Error, EOFError, OSError):
+        return False
+
+
+def _run_with_log_tail(
+    cmd: List[str], cwd: Optional[str] = None, tail: int = 20
+) -> str:
+    """Run a command, streaming its output and keeping only the last lines.
+
+    Unlike capture_output=True, memory stays bounded no matter how much a
+    long download logs.
+
+    Args:
+        cmd: Command and arguments
+        cwd: Working directory for the command
+        tail: Number of lines kept per stream
+
+    Returns:
+        The last ``tail`` lines of stdout
+
+    Raises:
+        subprocess.CalledProcessError: If the command exits non-zero; its
+            output and stderr hold the kept lines
+    """
+    stdout_lines: deque = deque(maxlen=tail)
+    stderr_lines: deque = deque(maxlen=tail)
+
+    with subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace",
+        bufsize=1,
+    ) as process:
+        assert process.stdout is not None and process.stderr is not None
+        # Drain stderr on a helper thread so neither pipe fills up and blocks
+        stderr_reader = threading.Thread(
+            target=stderr_lines.extend, args=(process.stderr,), daemon=True
+        )
+        stderr_reader.start()
+        stdout_lines.extend(process.stdout)
+        stderr_reader.join()
+        returncode = process.wait()
+
+    stdout_text = "".join(stdout_lines)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, cmd, output=stdout_text, stderr="".join(stderr_lines)
+        )
+    return stdout_text
 
 
 def validate_audio_with_ffprobe(
@@ -37,9 +183,10 @@ def validate_audio_with_ffprobe(
     Returns:
         Tuple of (is_valid, duration_seconds)
     """
-    try:
-        import ffmpeg
+    if av is not None:
+        return _validate_audio_with_pyav(file_path)
 
+    try:
         # Use ffmpeg.probe to get file info
         probe_data = ffmpeg.probe(file_path)
 
@@ -67,31 +214,87 @@ def validate_audio_with_ffprobe(
         return False, None
 
 
+def _validate_audio_with_pyav(
+    file_path: str,
+) -> Tuple[bool, Optional[float]]:
+    """validate_audio_with_ffprobe using libavformat in-process.
+
+    Args:
+        file_path: Path to audio file
+
+    Returns:
+        Tuple of (is_valid, duration_seconds)
+    """
+    try:
+        container = av.open(file_path, metadata_errors="ignore")
+    except Exception as e:
+        logger.debug(f"PyAV validation failed for {file_path}: {e}")
+        return False, None
+
+    try:
+        audio_streams = container.streams.audio
+        if not audio_streams:
+            return False, None
+
+        # Container duration is in av.time_base units
+        if container.duration is not None:
+            duration = container.duration / av.time_base
+        elif audio_streams[0].duration is not None:
+            stream = audio_streams[0]
+            duration = float(stream.duration * stream.time_base)
+        else:
+            return True, None
+
+        if duration < 0.1:  # Less than 100ms
+            return False, None
+        return True, duration
+    except Exception as e:
+        logger.debug(f"PyAV validation failed for {file_path}: {e}")
+        return False, None
+    finally:
+        container.close()
+
+
 class BilibiliHandler:
     """Handler for processing Bilibili videos."""
 
     def __init__(
         self, 
         whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin",
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        whisper_backend: str = "whisper_cpp",
+        device: str = "auto",
+        compute_type: Optional[str] = None,
+        use_cache: bool = True,
     ):
         """Initialize Bilibili handler.
 
         Args:
             whisper_model_path: Path to whisper model for transcription
             proxy: Proxy URL for BBDown and yt-dlp
+            whisper_backend: Transcription backend ('whisper_cpp' or
+                'faster_whisper')
+            device: Transcription device ('auto', 'cpu' or 'cuda')
+            compute_type: faster-whisper compute type, e.g. 'float16';
+                None picks one for the device
+            use_cache: Whether to reuse audio and transcripts recorded by
+                earlier runs in the output directory
         """
         self.audio_processor = AudioProcessor()
-        self.whisper_wrapper = WhisperWrapper(whisper_model_path)
+        self.whisper_wrapper = WhisperWrapper(
+            whisper_model_path,
+            backend=whisper_backend,
+            device=device,
+            compute_type=compute_type,
+        )
         self.proxy = proxy
+        self.use_cache = use_cache
         self.verify_bbdown()
         self._ytdlp_available = self._check_ytdlp_availability()
 
     def verify_bbdown(self) -> None:
         """Verify that BBDown is available."""
-        import shutil
-
-        if not shutil.which("BBDown"):
+        if not _bbdown_available():
             console.print(
                 "⚠️ Warning: BBDown not found. Bilibili processing may not work.",
                 style="yellow",
@@ -103,14 +306,7 @@ class BilibiliHandler:
         Returns:
             True if yt-dlp is available, False otherwise
         """
-        try:
-            import yt_dlp  # noqa: F401
-
-            logger.debug("yt-dlp Python library available")
-            return True
-        except ImportError:
-            logger.debug("yt-dlp Python library not available")
-            return False
+        return _ytdlp_available()
 
     def _is_ytdlp_available(self) -> bool:
         """Check if yt-dlp is available for use.
@@ -129,12 +325,8 @@ class BilibiliHandler:
         Returns:
             True if valid Bilibili URL
         """
-        bilibili_patterns = [r"bilibili\.com", r"b23\.tv", r"m\.bilibili\.com"]
-
-        return any(
-            re.search(pattern, url, re.IGNORECASE)
-            for pattern in bilibili_patterns
-        )
+        # m.bilibili.com is covered by bilibili\.com
+        return _BILIBILI_URL_RE.search(url) is not None
 
     def extract_bv_id(self, url: str) -> Optional[str]:
         """Extract BV ID from Bilibili URL.
@@ -204,7 +396,7 @@ class BilibiliHandler:
         if not self.validate_url(url):
             raise ValueError(f"Invalid Bilibili URL: {url}")
 
-        console.print(f"🎬 Processing Bilibili video: {url}", style="cyan")
+        print_status(f"🎬 Processing Bilibili video: {url}", "cyan", silent)
 
         # Set up output directory
         if output_dir is None:
@@ -212,20 +404,16 @@ class BilibiliHandler:
         else:
             os.makedirs(output_dir, exist_ok=True)
 
-        temp_files = []
+        cached = self._load_cached_result(url, output_dir, auto_detect)
+        if cached is not None:
+            return cached
+
+        temp_files: List[str] = []
 
         try:
-            # Download audio using BBDown
-            console.print(
-                "🎬 Downloading audio from Bilibili...", style="cyan"
+            audio_file, wav_file = self._prepare_audio(
+                url, output_dir, temp_files
             )
-            audio_file = self._download_audio(url, output_dir)
-            temp_files.append(audio_file)
-
-            # Convert to WAV for whisper
-            console.print("🔄 Converting audio format...", style="cyan")
-            wav_file = self._convert_to_wav(audio_file, output_dir)
-            temp_files.append(wav_file)
 
             # Transcribe with whisper-cli
             language = None if auto_detect else "zh"
@@ -237,47 +425,479 @@ class BilibiliHandler:
                 silent=silent,
             )
 
-            # Use the audio filename format for final output (keeps title and BV ID)
-            bv_id = self.extract_bv_id(url) or "bilibili_video"
-
-            if hasattr(result, "get") and result.get("audio_file"):
-                audio_filename = os.path.basename(result["audio_file"])
-                # Change extension from .m4a/.wav to .txt
-                base_name = os.path.splitext(audio_filename)[0]
-                final_output = os.path.join(output_dir, f"{base_name}.txt")
-            else:
-                # Fallback to BV ID only
-                final_output = os.path.join(output_dir, f"{bv_id}.txt")
-
-            # Copy transcription to final location
-            if (
-                os.path.exists(result["output_file"])
-                and result["output_file"] != final_output
-            ):
-                os.rename(result["output_file"], final_output)
-                result["output_file"] = final_output
-
-            return {
-                "success": True,
-                "method": "transcription",
-                "platform": "bilibili",
-                "url": url,
-                "bv_id": bv_id,
-                "output_file": final_output,
-                "text": result["text"],
-                "language": result["language"],
-                "audio_file": audio_file,
-                "temp_files": temp_files if not cleanup else [],
-            }
+            return self._finalize_transcription(
+                url,
+                audio_file,
+                result,
+                output_dir,
+                cleanup,
+                temp_files,
+                auto_detect,
+            )
 
-        except Exception:
-            if cleanup:
-                self.audio_processor.cleanup_temp_files(temp_files)
-            raise
         finally:
             if cleanup:
                 self.audio_processor.cleanup_temp_files(temp_files)
 
+    def process_batch(
+        self,
+        urls: List[str],
+        auto_detect: bool = False,
+        output_dir: Optional[str] = None,
+        cleanup: bool = True,
+        silent: bool = False,
+        max_workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Process several Bilibili videos with one whisper-cli run.
+
+        Every video is downloaded and converted first; the resulting WAV
+        files are then transcribed together so the whisper model is loaded
+        once per batch.
+
+        Args:
+            urls: Bilibili video URLs
+            auto_detect: Whether to use auto language detection for whisper
+            output_dir: Output directory for files
+            cleanup: Whether to clean up temporary files
+            silent: Whether to suppress detailed output (for batch processing)
+            max_workers: Number of concurrent downloads
+
+        Returns:
+            List of result dicts in input order; failed videos have
+            ``success`` set to False and an ``error`` message
+        """
+        if output_dir is None:
+            output_dir = os.getcwd()
+        items = self.prepare_batch(
+            urls,
+            output_dir,
+            max_workers=max_workers,
+            silent=silent,
+            auto_detect=auto_detect,
+        )
+        return self.transcribe_prepared(
+            items,
+            auto_detect=auto_detect,
+            output_dir=output_dir,
+            cleanup=cleanup,
+            silent=silent,
+        )
+
+    def prepare_batch(
+        self,
+        urls: List[str],
+        output_dir: str,
+        max_workers: int = 1,
+        silent: bool = False,
+        auto_detect: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Download and convert audio for several Bilibili videos.
+
+        This is the first half of process_batch. It does no transcription,
+        so it can run while a previous batch is being transcribed.
+
+        Args:
+            urls: Bilibili video URLs
+            output_dir: Output directory for files
+            max_workers: Number of concurrent downloads; each one runs in its
+                own temporary directory
+            silent: Whether to log progress instead of printing it
+            auto_detect: Language setting the batch will be transcribed
+                with; only earlier transcripts made the same way are reused
+
+        Returns:
+            One item per URL for transcribe_prepared(); items that already
+            failed carry their final ``result``
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        items: List[Dict[str, Any]] = []
+        # Downloads are network-bound and conversions are ffmpeg-bound, so
+        # a finished download is converted while later ones are in flight.
+        # The default of one download at a time keeps request rates low.
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_workers)
+        ) as downloader, ThreadPoolExecutor(max_workers=1) as converter:
+            downloads = []
+            for url in urls:
+                item: Dict[str, Any] = {
+                    "url": url,
+                    "result": None,
+                    "temp_files": [],
+                }
+                items.append(item)
+                try:
+                    if not self.validate_url(url):
+                        raise ValueError(f"Invalid Bilibili URL: {url}")
+                    cached = self._load_cached_result(
+                        url, output_dir, auto_detect
+                    )
+                    if cached is not None:
+                        item["result"] = cached
+                        continue
+                except Exception as e:
+                    item["result"] = {
+                        "success": False,
+                        "error": str(e),
+                        "url": url,
+                    }
+                    continue
+                print_status(f"🎬 Processing Bilibili video: {url}", "cyan", silent)
+                downloads.append(
+                    (
+                        item,
+                        downloader.submit(
+                            self._download_audio, url, output_dir
+                        ),
+                    )
+                )
+
+            conversions = []
+            for item, future in downloads:
+                try:
+                    audio_file = future.result()
+                except Exception as e:
+                    item["result"] = {
+                        "success": False,
+                        "error": str(e),
+                        "url": item["url"],
+                    }
+                    continue
+                item["temp_files"].extend(
+                    self._downloaded_files(item["url"], audio_file, output_dir)
+                )
+                item["audio_file"] = audio_file
+                if self.whisper_wrapper.accepts_compressed:
+                    # The backend decodes the download itself
+                    item["wav_file"] = audio_file
+                    continue
+                conversions.append(
+                    (
+                        item,
+                        converter.submit(
+                            self._convert_to_wav, audio_file, output_dir
+                        ),
+                    )
+                )
+
+            for item, future in conversions:
+                try:
+                    item["wav_file"] = future.result()
+                    item["temp_files"].append(item["wav_file"])
+                except Exception as e:
+                    item["result"] = {
+                        "success": False,
+                        "error": str(e),
+                        "url": item["url"],
+                    }
+
+        for item in items:
+            if item["result"] is not None:
+                self.audio_processor.cleanup_temp_files(item["temp_files"])
+
+        return items
+
+    def transcribe_prepared(
+        self,
+        items: List[Dict[str, Any]],
+        auto_detect: bool = False,
+        output_dir: Optional[str] = None,
+        cleanup: bool = True,
+        silent: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe items from prepare_batch() with one whisper-cli run.
+
+        Args:
+            items: Items returned by prepare_batch()
+            auto_detect: Whether to use auto language detection for whisper
+            output_dir: Output directory for files
+            cleanup: Whether to clean up temporary files
+            silent: Whether to suppress whisper-cli output
+
+        Returns:
+            List of result dicts in item order; failed videos have
+            ``success`` set to False and an ``error`` message
+        """
+        if output_dir is None:
+            output_dir = os.getcwd()
+
+        pending = [item for item in items if item["result"] is None]
+        if pending:
+            language = None if auto_detect else "zh"
+            transcriptions = self.whisper_wrapper.transcribe_batch(
+                [item["wav_file"] for item in pending],
+                language=language,
+                auto_detect=auto_detect,
+                output_dir=output_dir,
+                silent=silent,
+            )
+
+            for item, result in zip(pending, transcriptions):
+                try:
+                    if not result["success"]:
+                        raise AudioProcessingError(result["error"])
+                    item["result"] = self._finalize_transcription(
+                        item["url"],
+                        item["audio_file"],
+                        result,
+                        output_dir,
+                        cleanup,
+                        item["temp_files"],
+                        auto_detect,
+                    )
+                except Exception as e:
+                    item["result"] = {
+                        "success": False,
+                        "error": str(e),
+                        "url": item["url"],
+                    }
+                finally:
+                    if cleanup:
+                        self.audio_processor.cleanup_temp_files(
+                            item["temp_files"]
+                        )
+
+        return [item["result"] for item in items]
+
+    def _prepare_audio(
+        self, url: str, output_dir: str, temp_files: List[str]
+    ) -> Tuple[str, str]:
+        """Download audio and convert it to WAV for whisper.
+
+        Backends that decode compressed audio themselves get the download
+        as is.
+
+        Args:
+            url: Bilibili video URL
+            output_dir: Output directory
+            temp_files: List that collects created temporary files
+
+        Returns:
+            Tuple of (downloaded audio file, file to transcribe)
+        """
+        # Download audio using BBDown
+        print_status("🎬 Downloading audio from Bilibili...", "cyan")
+        audio_file = self._download_audio(url, output_dir)
+        temp_files.extend(self._downloaded_files(url, audio_file, output_dir))
+        if self.whisper_wrapper.accepts_compressed:
+            return audio_file, audio_file
+
+        # Convert to WAV for whisper
+        print_status("🔄 Converting audio format...", "cyan")
+        wav_file = self._convert_to_wav(audio_file, output_dir)
+        temp_files.append(wav_file)
+
+        return audio_file, wav_file
+
+    def _finalize_transcription(
+        self,
+        url: str,
+        audio_file: str,
+        result: Dict[str, Any],
+        output_dir: str,
+        cleanup: bool,
+        temp_files: List[str],
+        auto_detect: bool = False,
+    ) -> Dict[str, Any]:
+        """Move the whisper output into place and build the result dict.
+
+        Args:
+            url: Bilibili video URL
+            audio_file: Downloaded audio file
+            result: Transcription result from WhisperWrapper
+            output_dir: Output directory
+            cleanup: Whether temporary files will be cleaned up
+            temp_files: Temporary files created for this video
+            auto_detect: Whether language auto detection was used
+
+        Returns:
+            Dict containing processing results
+        """
+        # Use the audio filename format for final output (keeps title and BV ID)
+        extracted_bv_id = self.extract_bv_id(url)
+        bv_id = extracted_bv_id or "bilibili_video"
+
+        if hasattr(result, "get") and result.get("audio_file"):
+            audio_filename = os.path.basename(result["audio_file"])
+            # Change extension from .m4a/.wav to .txt
+            base_name = os.path.splitext(audio_filename)[0]
+            final_output = os.path.join(output_dir, f"{base_name}.txt")
+        else:
+            # Fallback to BV ID only
+            final_output = os.path.join(output_dir, f"{bv_id}.txt")
+
+        # Copy transcription to final location
+        if (
+            os.path.exists(result["output_file"])
+            and result["output_file"] != final_output
+        ):
+            move_file(result["output_file"], final_output)
+            result["output_file"] = final_output
+
+        if extracted_bv_id:
+            # Without a BV ID there is nothing to key the entry on
+            self._store_cache_entry(
+                extracted_bv_id, final_output, output_dir, auto_detect
+            )
+
+        return {
+            "success": True,
+            "method": "transcription",
+            "platform": "bilibili",
+            "url": url,
+            "bv_id": bv_id,
+            "output_file": final_output,
+            "text": result["text"],
+            "language": result["language"],
+            "audio_file": audio_file,
+            "temp_files": temp_files if not cleanup else [],
+        }
+
+    def _cache_entry_path(self, bv_id: str, output_dir: str) -> str:
+        """Path of the sidecar recording a finished transcript for bv_id."""
+        return os.path.join(output_dir, f".{bv_id}.sha256.json")
+
+    def _cache_settings(self, auto_detect: bool) -> Dict[str, str]:
+        """Settings a cached transcript must have been made with."""
+        return {
+            "backend": self.whisper_wrapper.backend,
+            "model": self.whisper_wrapper.model_path,
+            "language": "auto" if auto_detect else "zh",
+        }
+
+    def _load_cached_result(
+        self, url: str, output_dir: str, auto_detect: bool = False
+    ) -> Optional[Dict[str, Any]]:
+        """Return the result of an earlier run for this video, if intact.
+
+        The transcript only counts when it was made with the same backend,
+        model and language setting, and its SHA-256 still matches the
+        sidecar written after it, so partial or edited files are redone.
+
+        Args:
+            url: Bilibili video URL
+            output_dir: Output directory of the earlier run
+            auto_detect: Whether language auto detection is requested
+
+        Returns:
+            Result dict with ``cached`` set, or None on a cache miss
+        """
+        bv_id = self.extract_bv_id(url)
+        if not bv_id or not self.use_cache:
+            return None
+
+        try:
+            entry = parse_json(
+                Path(self._cache_entry_path(bv_id, output_dir)).read_bytes()
+            )
+            output_file = os.path.join(output_dir, entry["output_file"])
+            data = Path(output_file).read_bytes()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        settings = self._cache_settings(auto_detect)
+        if any(entry.get(key) != value for key, value in settings.items()):
+            return None
+        if hashlib.sha256(data).hexdigest() != entry.get("sha256"):
+            return None
+
+        print_status(f"⏭️ Using existing transcript: {output_file}", "dim")
+        return {
+            "success": True,
+            "cached": True,
+            "method": "transcription",
+            "platform": "bilibili",
+            "url": url,
+            "bv_id": bv_id,
+            "output_file": output_file,
+            "text": data.decode("utf-8"),
+            "language": settings["language"],
+            "audio_file": None,
+            "temp_files": [],
+        }
+
+    def _store_cache_entry(
+        self,
+        bv_id: str,
+        output_file: str,
+        output_dir: str,
+        auto_detect: bool,
+    ) -> None:
+        """Record a finished transcript so later runs can reuse it.
+
+        Args:
+            bv_id: Bilibili BV ID
+            output_file: Final transcript path
+            output_dir: Output directory
+            auto_detect: Whether language auto detection was used
+        """
+        try:
+            write_json(
+                {
+                    "output_file": os.path.basename(output_file),
+                    "sha256": hashlib.sha256(
+                        Path(output_file).read_bytes()
+                    ).hexdigest(),
+                    **self._cache_settings(auto_detect),
+                },
+                self._cache_entry_path(bv_id, output_dir),
+            )
+        except OSError as e:
+            # A missing entry only means the video is transcribed again
+            logger.debug(f"Failed to write cache entry for {bv_id}: {e}")
+
+    def _run_downloader(
+        self,
+        tool: str,
+        download_fn: Callable[[str], None],
+        output_dir: str,
+    ) -> str:
+        """Run a downloader in an isolated directory and keep its audio.
+
+        Args:
+            tool: Downloader name, used for the temp directory and messages
+            download_fn: Downloads the audio into the directory it is given
+            output_dir: Output directory
+
+        Returns:
+            Path to downloaded audio file in output_dir
+        """
+        # Create temporary isolated directory for this download; it is
+        # removed on exit even if the download fails
+        prefix = tool.lower().replace("-", "") + "_"
+        with managed_temp_directory(
+            prefix=prefix, dir=output_dir
+        ) as temp_download_dir:
+            logger.debug(
+                f"Created temporary download directory: {temp_download_dir}"
+            )
+
+            download_fn(temp_download_dir)
+
+            # Find and validate downloaded audio files
+            audio_file = self._select_best_audio_file(
+                self._find_audio_candidates(temp_download_dir, tool=tool)
+            )
+
+            if audio_file is None:
+                # List all files for debugging
+                all_files = []
+                for root, dirs, files in os.walk(temp_download_dir):
+                    for file in files:
+                        all_files.append(os.path.join(root, file))
+                logger.error(f"All files found: {all_files}")
+
+                raise AudioProcessingError(
+                    f"No valid audio file found after {tool} download. "
+                    f"Found {len(all_files)} files: {all_files[:5]}"
+                )
+
+            # Move file to output directory
+            final_path = _move_to_unique_path(audio_file, output_dir)
+            logger.info(
+                f"✅ Downloaded with {tool}: {os.path.basename(final_path)}"
+            )
+            return final_path
+
     def _download_with_ytdlp(self, url: str, output_dir: str) -> str:
         """Download audio using yt-dlp as backup method.
 
@@ -288,15 +908,14 @@ class BilibiliHandler:
         Returns:
             Path to downloaded audio file
         """
-        # Create temporary isolated directory for this download
-        temp_download_dir = tempfile.mkdtemp(prefix="ytdlp_", dir=output_dir)
-        logger.debug(
-            f"Created temporary download directory: {temp_download_dir}"
-        )
-
         try:
             import yt_dlp
+        except ImportError:
+            raise AudioProcessingError(
+                "yt-dlp library not found. Please install: uv add yt-dlp"
+            )
 
+        def download(temp_download_dir: str) -> None:
             # Configure yt-dlp options
             ydl_opts = {
                 "format": "bestaudio/best",
@@ -308,6 +927,16 @@ class BilibiliHandler:
                 "noplaylist": True,
             }
 
+            if not self.whisper_wrapper.accepts_compressed:
+                # Let yt-dlp's own ffmpeg pass write whisper-ready WAV so
+                # _convert_to_wav has nothing left to do
+                ydl_opts["postprocessors"] = [
+                    {"key": "FFmpegExtractAudio", "preferredcodec": "wav"}
+                ]
+                ydl_opts["postprocessor_args"] = {
+                    "extractaudio": ["-ar", "16000", "-ac", "1"]
+                }
+
             # Add proxy support if configured
             if self.proxy:
                 ydl_opts["proxy"] = self.proxy
@@ -320,67 +949,12 @@ class BilibiliHandler:
             logger.info("🔄 Attempting download with yt-dlp Python library...")
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                # Download the audio
                 ydl.extract_info(url, download=True)
 
-                # Download completed successfully
-
-                # Find and validate downloaded audio files
-                audio_candidates = self._find_audio_candidates(
-                    temp_download_dir, tool="yt-dlp"
-                )
-
-                if not audio_candidates:
-                    # List all files for debugging
-                    all_files = os.listdir(temp_download_dir)
-                    raise AudioProcessingError(
-                        f"No valid audio file found after yt-dlp download. "
-                        f"Files in temp dir: {all_files}"
-                    )
-
-                # Select the best audio file using enhanced validation
-                audio_file = self._select_best_audio_file(audio_candidates)
-
-                # Move file to output directory
-                final_path = os.path.join(
-                    output_dir, os.path.basename(audio_file)
-                )
-                if os.path.exists(final_path):
-                    # Generate unique name if file exists
-                    base, ext = os.path.splitext(os.path.basename(audio_file))
-                    counter = 1
-                    while os.path.exists(final_path):
-                        final_path = os.path.join(
-                            output_dir, f"{base}_{counter}{ext}"
-                        )
-                        counter += 1
-
-                os.rename(audio_file, final_path)
-                logger.info(
-                    f"✅ Downloaded with yt-dlp: {os.path.basename(final_path)}"
-                )
-                return final_path
-
-        except ImportError:
-            raise AudioProcessingError(
-                "yt-dlp library not found. Please install: uv add yt-dlp"
-            )
+        try:
+            return self._run_downloader("yt-dlp", download, output_dir)
         except Exception as e:
             raise AudioProcessingError(f"yt-dlp download failed: {str(e)}")
-        finally:
-            # Clean up temporary directory
-            try:
-                import shutil
-
-                if os.path.exists(temp_download_dir):
-                    shutil.rmtree(temp_download_dir)
-                    logger.debug(
-                        f"Cleaned up temp directory: {temp_download_dir}"
-                    )
-            except Exception as cleanup_e:
-                logger.warning(
-                    f"Failed to cleanup temp directory: {cleanup_e}"
-                )
 
     def _download_with_bbdown(self, url: str, output_dir: str) -> str:
         """Download audio from Bilibili using BBDown.
@@ -392,159 +966,173 @@ class BilibiliHandler:
         Returns:
             Path to downloaded audio file
         """
-        # Create temporary isolated directory for this download
-        temp_download_dir = tempfile.mkdtemp(prefix="bbdown_", dir=output_dir)
-        logger.debug(
-            f"Created temporary download directory: {temp_download_dir}"
-        )
+        # Build BBDown command (BBDown uses system cookies automatically)
+        cmd = ["BBDown", "--audio-only", url]
 
-        try:
-            # Build BBDown command (BBDown uses system cookies automatically)
-            cmd = ["BBDown", "--audio-only", url]
-            
-            # Note: BBDown doesn't have direct proxy support via command line
-            # For proxy usage, users need to configure system-level proxy
-            # or use tools like proxychains
-
-            # Set temporary directory as working directory
-            original_dir = os.getcwd()
-            os.chdir(temp_download_dir)
-
-            try:
-                # Run BBDown and capture output for debugging
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, check=True
-                )
-                logger.debug(f"BBDown stdout: {result.stdout[:500]}...")
+        # Note: BBDown doesn't have direct proxy support via command line
+        # For proxy usage, users need to configure system-level proxy
+        # or use tools like proxychains
 
-                # Find and validate downloaded audio files
-                audio_candidates = self._find_audio_candidates(
-                    temp_download_dir, tool="bbdown"
-                )
-
-                if not audio_candidates:
-                    # List all files for debugging
-                    all_files = []
-                    for root, dirs, files in os.walk(temp_download_dir):
-                        for file in files:
-                            all_files.append(os.path.join(root, file))
-                    logger.error(f"All files found: {all_files}")
-
-                    raise AudioProcessingError(
-                        f"No valid audio file found after BBDown download. "
-                        f"Found {len(all_files)} files: {all_files[:5]}"
-                    )
-
-                # Select the best audio file using enhanced validation
-                audio_file = self._select_best_audio_file(audio_candidates)
-
-                # Move file to output directory
-                final_path = os.path.join(
-                    output_dir, os.path.basename(audio_file)
-                )
-                if os.path.exists(final_path):
-                    # Generate unique name if file exists
-                    base, ext = os.path.splitext(os.path.basename(audio_file))
-                    counter = 1
-                    while os.path.exists(final_path):
-                        final_path = os.path.join(
-                            output_dir, f"{base}_{counter}{ext}"
-                        )
-                        counter += 1
-
-                os.rename(audio_file, final_path)
-                logger.info(
-                    f"✅ Downloaded with BBDown: {os.path.basename(final_path)}"
-                )
-                return final_path
-
-            finally:
-                os.chdir(original_dir)
+        def download(temp_download_dir: str) -> None:
+            # Run BBDown inside the temporary directory and capture output
+            # for debugging
+            stdout_tail = _run_with_log_tail(cmd, cwd=temp_download_dir)
+            logger.debug(f"BBDown stdout (tail): {stdout_tail[-500:]}")
 
+        try:
+            return self._run_downloader("BBDown", download, output_dir)
         except subprocess.CalledProcessError as e:
             error_msg = f"BBDown failed with exit code {e.returncode}"
             if e.stdout:
-                error_msg += f"\nStdout: {e.stdout[:300]}..."
+                error_msg += f"\nStdout: ...{e.stdout[-300:]}"
             if e.stderr:
-                error_msg += f"\nStderr: {e.stderr[:300]}..."
+                error_msg += f"\nStderr: ...{e.stderr[-300:]}"
             raise AudioProcessingError(error_msg)
         except FileNotFoundError:
             raise AudioProcessingError(
                 "BBDown not found. Please install BBDown to download from Bilibili."
             )
-        finally:
-            # Clean up temporary directory
-            try:
-                import shutil
-
-                if os.path.exists(temp_download_dir):
-                    shutil.rmtree(temp_download_dir)
-                    logger.debug(
-                        f"Cleaned up temp directory: {temp_download_dir}"
-                    )
-            except Exception as cleanup_e:
-                logger.warning(
-                    f"Failed to cleanup temp directory: {cleanup_e}"
-                )
 
     def _download_audio(self, url: str, output_dir: str) -> str:
-        """Download audio from Bilibili with fallback support."""
+        """Download audio from Bilibili with fallback support.
+
+        Audio kept from an earlier run (``--no-cleanup`` or an interrupted
+        transcription) is reused instead of being downloaded again.
+        """
+        bv_id = self.extract_bv_id(url)
+        if bv_id:
+            cached_audio = self._load_cached_audio(bv_id, output_dir)
+            if cached_audio:
+                return cached_audio
+
         # Try BBDown first
         try:
-            return self._download_with_bbdown(url, output_dir)
+            audio_file = self._download_with_bbdown(url, output_dir)
         except AudioProcessingError as e:
-            # Clean up BBDown residual files/directories
-            self._cleanup_bbdown_residuals(output_dir)
+            # BBDown ran in its own temp directory, which is already gone
 
             # Try yt-dlp as backup
             if self._is_ytdlp_available():
                 logger.warning(f"BBDown failed, trying yt-dlp: {e}")
-                return self._download_with_ytdlp(url, output_dir)
+                audio_file = self._download_with_ytdlp(url, output_dir)
             else:
                 raise AudioProcessingError(f"{e} | Try: pip install yt-dlp")
 
-    def _cleanup_bbdown_residuals(self, output_dir: str) -> None:
-        """Clean up BBDown residual files and directories after failure."""
-        import shutil
+        if bv_id:
+            self._store_audio_entry(bv_id, audio_file, output_dir)
+        return audio_file
+
+    def _audio_entry_path(self, bv_id: str, output_dir: str) -> str:
+        """Path of the sidecar recording the downloaded audio for bv_id."""
+        return os.path.join(output_dir, f".{bv_id}.audio.json")
+
+    def _downloaded_files(
+        self, url: str, audio_file: str, output_dir: str
+    ) -> List[str]:
+        """Downloaded audio plus its sidecar, so cleanup removes both."""
+        bv_id = self.extract_bv_id(url)
+        if not bv_id:
+            return [audio_file]
+        return [audio_file, self._audio_entry_path(bv_id, output_dir)]
 
+    def _load_cached_audio(self, bv_id: str, output_dir: str) -> Optional[str]:
+        """Return audio downloaded by an earlier run, if still intact.
+
+        The file must have the size and mtime recorded at download time
+        and still pass ffprobe validation.
+
+        Args:
+            bv_id: Bilibili BV ID
+            output_dir: Output directory of the earlier run
+
+        Returns:
+            Path to the audio file, or None on a cache miss
+        """
+        if not self.use_cache:
+            return None
         try:
-            # BBDown creates numbered subdirectories (e.g., 115032964796336/)
-            for item in os.listdir(output_dir):
-                item_path = os.path.join(output_dir, item)
-                # Check if it's a directory with only digits in the name
-                if os.path.isdir(item_path) and item.isdigit():
-                    logger.debug(
-                        f"Cleaning up BBDown residual directory: {item_path}"
-                    )
-                    shutil.rmtree(item_path)
-        except Exception as e:
-            # Don't fail the whole process if cleanup fails
-            logger.debug(f"Failed to cleanup BBDown residuals: {e}")
+            entry = parse_json(
+                Path(self._audio_entry_path(bv_id, output_dir)).read_bytes()
+            )
+            audio_file = os.path.join(output_dir, entry["audio_file"])
+            stat = os.stat(audio_file)
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        if (stat.st_size, stat.st_mtime_ns) != (
+            entry.get("size"),
+            entry.get("mtime_ns"),
+        ):
+            return None
+        if not validate_audio_with_ffprobe(audio_file)[0]:
+            return None
+
+        print_status(
+            f"⏭️ Using existing audio: {os.path.basename(audio_file)}", "dim"
+        )
+        return audio_file
+
+    def _store_audio_entry(
+        self, bv_id: str, audio_file: str, output_dir: str
+    ) -> None:
+        """Record a downloaded audio file so later runs can reuse it.
+
+        Args:
+            bv_id: Bilibili BV ID
+            audio_file: Path of the downloaded audio in output_dir
+            output_dir: Output directory
+        """
+        try:
+            stat = os.stat(audio_file)
+            write_json(
+                {
+                    "audio_file": os.path.basename(audio_file),
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                },
+                self._audio_entry_path(bv_id, output_dir),
+            )
+        except OSError as e:
+            # A missing entry only means the audio is downloaded again
+            logger.debug(f"Failed to write audio entry for {bv_id}: {e}")
 
     def _find_audio_candidates(
         self, search_dir: str, tool: str = "unknown"
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[Dict[str, Any]]:
         """Find and analyze potential audio files with enhanced validation.
 
+        Candidates are analyzed lazily, so a consumer that stops at the
+        first valid file never sniffs the rest.
+
         Args:
             search_dir: Directory to search in
             tool: Name of the download tool used (for logging)
 
-        Returns:
-            List of audio file candidates with metadata
+        Yields:
+            Audio file candidates with metadata
         """
-        audio_extensions = [".m4a", ".mp3", ".aac", ".wav", ".flac", ".ogg"]
-        candidates = []
+        pending = deque([search_dir])
 
-        for root, dirs, files in os.walk(search_dir):
-            for file in files:
-                if any(file.lower().endswith(ext) for ext in audio_extensions):
-                    file_path = os.path.join(root, file)
+        while pending:
+            with os.scandir(pending.popleft()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                        continue
+                    if (
+                        not entry.is_file(follow_symlinks=False)
+                        or os.path.splitext(entry.name)[1].lower()
+                        not in _AUDIO_EXTENSIONS
+                    ):
+                        continue
+
+                    file = entry.name
+                    file_path = entry.path
 
                     # Basic file info
                     try:
-                        file_size = os.path.getsize(file_path)
-                        mtime = os.path.getmtime(file_path)
+                        file_stat = entry.stat(follow_symlinks=False)
+                        file_size = file_stat.st_size
+                        mtime = file_stat.st_mtime
 
                         # Skip obviously invalid files
                         if file_size < 1000:  # Less than 1KB
@@ -554,7 +1142,7 @@ class BilibiliHandler:
                             continue
 
                         # Detect format and validate content
-                        detected_format = detect_file_format(file_path)
+                        detected_format = detect_audio_format(file_path)
                         is_valid = detected_format != "unknown"
 
                         candidate = {
@@ -567,7 +1155,6 @@ class BilibiliHandler:
                             "tool": tool,
                         }
 
-                        candidates.append(candidate)
                         logger.debug(
                             f"Found candidate: {file} (size: {file_size}, format: {detected_format}, valid: {is_valid})"
                         )
@@ -576,23 +1163,26 @@ class BilibiliHandler:
                         logger.warning(f"Failed to analyze {file}: {e}")
                         continue
 
-        logger.info(f"Found {len(candidates)} audio candidates from {tool}")
-        return candidates
+                    yield candidate
 
-    def _select_best_audio_file(self, candidates: List[Dict[str, Any]]) -> str:
+    def _select_best_audio_file(
+        self, candidates: Iterable[Dict[str, Any]]
+    ) -> Optional[str]:
         """Select the first valid audio file from candidates.
 
+        Iteration stops at the first valid file, so lazily produced
+        candidates after it are never analyzed.
+
         Args:
-            candidates: List of audio file candidates with metadata
+            candidates: Audio file candidates with metadata
 
         Returns:
-            Path to a valid audio file
+            Path to a valid audio file, or None if there were no candidates
 
         Raises:
-            AudioProcessingError: If no valid audio files found
+            AudioProcessingError: If no candidate is valid audio
         """
-        if not candidates:
-            raise AudioProcessingError("No audio file candidates provided")
+        checked = []
 
         # Find the first file with valid audio format
         for candidate in candidates:
@@ -602,17 +1192,21 @@ class BilibiliHandler:
                     f"(format: {candidate['detected_format']}, size: {candidate['size']} bytes)"
                 )
                 return str(candidate["path"])
+            checked.append(candidate)
+
+        if not checked:
+            return None
 
         # If no valid format found, provide detailed error
         error_details = []
-        for candidate in candidates[:3]:  # Show top 3 for debugging
+        for candidate in checked[:3]:  # Show top 3 for debugging
             error_details.append(
                 f"{candidate['filename']}: {candidate['detected_format'] or 'unknown format'} "
                 f"({candidate['size']} bytes)"
             )
 
         raise AudioProcessingError(
-            f"No valid audio files found among {len(candidates)} candidates. "
+            f"No valid audio files found among {len(checked)} candidates. "
             f"Files checked: {'; '.join(error_details)}. This usually means the download "
             f"was blocked by anti-bot protection."
         )
@@ -625,8 +1219,12 @@ class BilibiliHandler:
             output_dir: Output directory
 
         Returns:
-            Path to converted WAV file
+            Path to converted WAV file; audio_file itself if it already is
+            16 kHz mono 16-bit WAV
         """
+        if _is_whisper_wav(audio_file):
+            return audio_file
+
         basename = Path(audio_file).stem
         wav_file = os.path.join(output_dir, f"{basename}.wav")
 
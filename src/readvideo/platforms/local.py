@@ -7,23 +7,30 @@ from rich.console import Console
 
 from readvideo.core.audio_processor import AudioProcessingError, AudioProcessor
 from readvideo.core.whisper_wrapper import WhisperWrapper
+from readvideo.utils import move_file
 
-console = Console()
+console = Console(highlight=False)
 
 
 class LocalMediaHandler:
     """Handler for processing local audio and video files."""
 
     def __init__(
-        self, whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin"
+        self,
+        whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin",
+        whisper_backend: str = "whisper_cpp",
     ):
         """Initialize local media handler.
 
         Args:
             whisper_model_path: Path to whisper model for transcription
+            whisper_backend: Transcription backend ('whisper_cpp' or
+                'faster_whisper')
         """
         self.audio_processor = AudioProcessor()
-        self.whisper_wrapper = WhisperWrapper(whisper_model_path)
+        self.whisper_wrapper = WhisperWrapper(
+            whisper_model_path, backend=whisper_backend
+        )
 
     def validate_file(self, file_path: str) -> bool:
         """Validate that file exists and is a supported media format.
@@ -105,10 +112,6 @@ class LocalMediaHandler:
                     f"Unsupported file format: {file_info['extension']}"
                 )
 
-        except Exception:
-            if cleanup:
-                self.audio_processor.cleanup_temp_files(temp_files)
-            raise
         finally:
             if cleanup and temp_files:
                 self.audio_processor.cleanup_temp_files(temp_files)
@@ -199,7 +202,7 @@ class LocalMediaHandler:
             os.path.exists(result["output_file"])
             and result["output_file"] != final_output
         ):
-            os.rename(result["output_file"], final_output)
+            move_file(result["output_file"], final_output)
             result["output_file"] = final_output
 
         return {
@@ -241,17 +244,10 @@ class LocalMediaHandler:
             f"🎬 Processing video file: {file_info['name']}", style="cyan"
         )
 
-        # Extract audio from video
-        temp_audio = os.path.join(output_dir, f"{file_info['stem']}_temp.m4a")
-        extracted_audio = self.audio_processor.extract_audio_from_video(
-            file_path, temp_audio
-        )
-        temp_files.append(extracted_audio)
-
-        # Convert to WAV for whisper
+        # Extract the audio track straight to WAV for whisper
         wav_file = os.path.join(output_dir, f"{file_info['stem']}.wav")
-        wav_audio = self.audio_processor.convert_audio_format(
-            extracted_audio,
+        wav_audio = self.audio_processor.extract_and_convert(
+            file_path,
             wav_file,
             target_format="wav",
             sample_rate=16000,
@@ -276,7 +272,7 @@ class LocalMediaHandler:
             os.path.exists(result["output_file"])
             and result["output_file"] != final_output
         ):
-            os.rename(result["output_file"], final_output)
+            move_file(result["output_file"], final_output)
             result["output_file"] = final_output
 
         return {
@@ -289,7 +285,7 @@ class LocalMediaHandler:
             "text": result["text"],
             "language": result["language"],
             "file_info": file_info,
-            "extracted_audio": extracted_audio,
+            "extracted_audio": wav_audio,
             "temp_files": temp_files if not cleanup else [],
         }
 
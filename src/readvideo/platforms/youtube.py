@@ -2,23 +2,33 @@
 
 import os
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from rich.console import Console
 from tenacity import RetryError
 
 from readvideo.core.audio_processor import AudioProcessor
 from readvideo.exceptions import AudioProcessingError
-from readvideo.utils import sanitize_filename, extract_youtube_video_id
+from readvideo.utils import (
+    sanitize_filename, extract_youtube_video_id, move_file, parse_json,
+    write_json, managed_temp_directory
+)
 from readvideo.core.transcript_fetcher import (TranscriptFetchError,
                                        YouTubeTranscriptFetcher,
                                        is_youtube_url)
-from readvideo.core.supadata_fetcher import (SupadataFetchError, 
-                                     SupadataTranscriptFetcher)
+from readvideo.core.supadata_fetcher import SupadataTranscriptFetcher
 from readvideo.core.whisper_wrapper import WhisperWrapper
 
-console = Console()
+console = Console(highlight=False)
+
+# yt-dlp --dump-json results, one file per video ID
+_METADATA_CACHE_DIR = os.path.expanduser("~/.cache/readvideo/metadata")
+_METADATA_TTL = 24 * 60 * 60  # seconds
+# How long a finished youtube-transcript-api result waits for Supadata
+_SUPADATA_GRACE = 0.1  # seconds
 
 
 class YouTubeHandler:
@@ -29,6 +39,8 @@ class YouTubeHandler:
         whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin",
         prefer_cookies: bool = True,
         proxy: Optional[str] = None,
+        whisper_backend: str = "whisper_cpp",
+        use_cache: bool = True,
     ):
         """Initialize YouTube handler.
 
@@ -36,6 +48,9 @@ class YouTubeHandler:
             whisper_model_path: Path to whisper model for fallback transcription
             prefer_cookies: Whether to use browser cookies for yt-dlp video download
             proxy: Proxy URL for both transcript API and yt-dlp
+            whisper_backend: Transcription backend ('whisper_cpp' or
+                'faster_whisper')
+            use_cache: Whether to reuse cached yt-dlp video metadata
         """
         # Setup proxy configuration
         proxies = None
@@ -47,9 +62,14 @@ class YouTubeHandler:
         # Note: No cookies for transcript API to avoid account ban risk  
         self.transcript_fetcher = YouTubeTranscriptFetcher(proxies=proxies)
         self.audio_processor = AudioProcessor()
-        self.whisper_wrapper = WhisperWrapper(whisper_model_path)
+        self.whisper_wrapper = WhisperWrapper(
+            whisper_model_path, backend=whisper_backend
+        )
         self.prefer_cookies = prefer_cookies  # Only for yt-dlp downloads
         self.proxy = proxy  # Store proxy for yt-dlp usage
+        self.use_cache = use_cache
+        # yt-dlp metadata already fetched by this handler, keyed by URL
+        self._video_json: Dict[str, Dict[str, Any]] = {}
 
     def validate_url(self, url: str) -> bool:
         """Validate that URL is a YouTube URL.
@@ -118,41 +138,15 @@ class YouTubeHandler:
         # Define language preference
         languages = ["zh", "zh-Hans", "zh-Hant", "en"]
 
-        # Try Supadata API first, fallback to youtube-transcript-api
-        transcript_data = None
-        transcript_source = None
-        
-        try:
-            console.print("🚀 Trying Supadata API first...", style="cyan")
-            transcript_data = self.supadata_fetcher.fetch_transcript_from_url(url)
-            transcript_source = "supadata"
-        except SupadataFetchError as e:
-            console.print(f"⚠️ Supadata failed: {e}", style="yellow")
-            console.print("🔄 Falling back to youtube-transcript-api...", style="cyan")
-            try:
-                transcript_data = self.transcript_fetcher.fetch_transcript_from_url(
-                    url, languages=languages, prefer_manual=True
-                )
-                transcript_source = "youtube-transcript-api"
-            except TranscriptFetchError as fallback_error:
-                console.print(f"❌ Both transcript methods failed. Supadata: {e}, YouTube API: {fallback_error}", style="red")
-                raise TranscriptFetchError(f"All transcript methods failed. Last error: {fallback_error}")
+        transcript_data, transcript_source = self._fetch_transcript(
+            url, languages
+        )
 
         # Generate output filename with title
         video_id = transcript_data.get("video_id") or extract_youtube_video_id(url)
-        
-        # Get video title: priority is Supadata API > yt-dlp fallback
-        video_title = transcript_data.get("title")
-        if not video_title or video_title == video_id:
-            video_title = self._get_video_title(url, video_id or "unknown")
-        
-        safe_title = self._sanitize_filename(video_title)
-        
-        # Use unified format: if title == video_id, use [video_id].txt format
-        if safe_title == video_id:
-            output_file = os.path.join(output_dir, f"[{video_id}].txt")
-        else:
-            output_file = os.path.join(output_dir, f"{safe_title} [{video_id}].txt")
+        output_file = self._output_path(
+            url, output_dir, video_id or "unknown", transcript_data.get("title")
+        )
 
         # Save transcript using appropriate fetcher
         if transcript_source == "supadata":
@@ -173,6 +167,68 @@ class YouTubeHandler:
             "segment_count": transcript_data["segment_count"],
         }
 
+    def _fetch_transcript(
+        self, url: str, languages: List[str]
+    ) -> Tuple[Dict[str, Any], str]:
+        """Fetch a transcript from Supadata and youtube-transcript-api at once.
+
+        Both sources are queried concurrently so a slow or failing Supadata
+        call no longer delays the fallback. Supadata stays preferred: when
+        youtube-transcript-api answers first, Supadata gets a short grace
+        period before its result is used instead.
+
+        Args:
+            url: YouTube video URL
+            languages: Preferred languages for youtube-transcript-api
+
+        Returns:
+            Tuple of (transcript data, source name)
+        """
+        console.print(
+            "🚀 Trying Supadata API and youtube-transcript-api...", style="cyan"
+        )
+
+        executor = ThreadPoolExecutor(max_workers=2)
+        supadata = executor.submit(
+            self.supadata_fetcher.fetch_transcript_from_url, url
+        )
+        youtube_api = executor.submit(
+            self.transcript_fetcher.fetch_transcript_from_url,
+            url,
+            languages=languages,
+            prefer_manual=True,
+        )
+
+        try:
+            for future in as_completed((supadata, youtube_api)):
+                if future.exception() is not None:
+                    continue
+                if future is supadata:
+                    return supadata.result(), "supadata"
+                try:
+                    return (
+                        supadata.result(timeout=_SUPADATA_GRACE),
+                        "supadata",
+                    )
+                except Exception:
+                    return youtube_api.result(), "youtube-transcript-api"
+        finally:
+            # The loser may still be running; don't wait for it
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        supadata_error = supadata.exception()
+        fallback_error = youtube_api.exception()
+        console.print(
+            f"❌ Both transcript methods failed. Supadata: {supadata_error}, "
+            f"YouTube API: {fallback_error}",
+            style="red",
+            markup=False,
+        )
+        raise TranscriptFetchError(
+            f"All transcript methods failed. Supadata: {supadata_error}, "
+            f"YouTube API: {fallback_error}"
+        )
+
     def _process_with_audio_transcription(
         self, url: str, auto_detect: bool, output_dir: str, cleanup: bool
     ) -> Dict[str, Any]:
@@ -187,22 +243,12 @@ class YouTubeHandler:
         Returns:
             Dict containing transcription results
         """
-        temp_files = []
+        temp_files: List[str] = []
 
         try:
-            # Download audio using yt-dlp
-            console.print("🎬 Downloading audio from YouTube...", style="cyan")
-            console.print(
-                "💡 Tip: Audio extraction may take a few minutes, please be patient",
-                style="dim",
+            audio_file, wav_file = self._prepare_audio(
+                url, output_dir, temp_files
             )
-            audio_file = self._download_audio(url, output_dir)
-            console.print("✅ Audio download completed", style="green")
-            temp_files.append(audio_file)
-
-            # Convert to WAV for whisper
-            wav_file = self._convert_to_wav(audio_file, output_dir)
-            temp_files.append(wav_file)
 
             # Transcribe with whisper-cli
             language = None if auto_detect else "zh"
@@ -213,46 +259,257 @@ class YouTubeHandler:
                 output_dir=output_dir,
             )
 
-            # Extract video ID and title for naming
-            video_id = extract_youtube_video_id(url) or "unknown"
-            video_title = self._get_video_title(url, video_id)
-            safe_title = self._sanitize_filename(video_title)
-            
-            # Use unified format: if title == video_id, use [video_id].txt format
-            if safe_title == video_id:
-                final_output = os.path.join(output_dir, f"[{video_id}].txt")
-            else:
-                final_output = os.path.join(output_dir, f"{safe_title} [{video_id}].txt")
-
-            # Copy transcription to final location
-            if (
-                os.path.exists(result["output_file"])
-                and result["output_file"] != final_output
-            ):
-                os.rename(result["output_file"], final_output)
-                result["output_file"] = final_output
-
-            return {
-                "success": True,
-                "method": "transcription",
-                "platform": "youtube",
-                "url": url,
-                "video_id": video_id,
-                "output_file": final_output,
-                "text": result["text"],
-                "language": result["language"],
-                "audio_file": audio_file,
-                "temp_files": temp_files if not cleanup else [],
-            }
+            return self._finalize_audio_transcription(
+                url, audio_file, result, output_dir, cleanup, temp_files
+            )
 
-        except Exception:
-            if cleanup:
-                self.audio_processor.cleanup_temp_files(temp_files)
-            raise
         finally:
             if cleanup:
                 self.audio_processor.cleanup_temp_files(temp_files)
 
+    def process_batch(
+        self,
+        urls: List[str],
+        auto_detect: bool = False,
+        output_dir: Optional[str] = None,
+        cleanup: bool = True,
+        silent: bool = False,
+        max_workers: int = 1,
+    ) -> List[Dict[str, Any]]:
+        """Process several YouTube videos, batching audio transcription.
+
+        Transcripts are tried first for every video as in process(); only
+        the videos without one are downloaded and then transcribed together
+        in a single whisper-cli run, so the model is loaded once per batch.
+
+        Args:
+            urls: YouTube video URLs
+            auto_detect: Whether to use auto language detection for whisper
+            output_dir: Output directory for files
+            cleanup: Whether to clean up temporary files
+            silent: Whether to suppress whisper-cli output
+            max_workers: Number of videos prepared concurrently
+
+        Returns:
+            List of result dicts in input order; failed videos have
+            ``success`` set to False and an ``error`` message
+        """
+        if output_dir is None:
+            output_dir = os.getcwd()
+        items = self.prepare_batch(urls, output_dir, max_workers=max_workers)
+        return self.transcribe_prepared(
+            items,
+            auto_detect=auto_detect,
+            output_dir=output_dir,
+            cleanup=cleanup,
+            silent=silent,
+        )
+
+    def prepare_batch(
+        self, urls: List[str], output_dir: str, max_workers: int = 1
+    ) -> List[Dict[str, Any]]:
+        """Fetch transcripts or download audio for several YouTube videos.
+
+        This is the first half of process_batch. Videos with a transcript
+        are finished here; the rest only get their audio downloaded and
+        converted, so this can run while a previous batch is transcribed.
+
+        Args:
+            urls: YouTube video URLs
+            output_dir: Output directory for files
+            max_workers: Number of videos prepared concurrently; the default
+                of one keeps request rates low
+
+        Returns:
+            One item per URL for transcribe_prepared(); finished or failed
+            items carry their final ``result``
+        """
+        os.makedirs(output_dir, exist_ok=True)
+
+        # Transcript lookups and downloads are network-bound, so several
+        # videos can be in flight while earlier ones convert
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            return list(
+                executor.map(
+                    lambda url: self._prepare_item(url, output_dir), urls
+                )
+            )
+
+    def _prepare_item(self, url: str, output_dir: str) -> Dict[str, Any]:
+        """Fetch the transcript or prepare audio for one batch video.
+
+        Args:
+            url: YouTube video URL
+            output_dir: Output directory for files
+
+        Returns:
+            Item for transcribe_prepared(); finished or failed items carry
+            their final ``result``
+        """
+        item: Dict[str, Any] = {"url": url, "result": None}
+        temp_files: List[str] = []
+        try:
+            if not self.validate_url(url):
+                raise ValueError(f"Invalid YouTube URL: {url}")
+            console.print(f"🎬 Processing YouTube video: {url}", style="cyan")
+            try:
+                item["result"] = self._process_with_transcript(url, output_dir)
+                return item
+            except (TranscriptFetchError, RetryError) as e:
+                console.print(
+                    f"📝 No existing subtitles, using audio transcription: {e}",
+                    style="yellow",
+                )
+            audio_file, wav_file = self._prepare_audio(
+                url, output_dir, temp_files
+            )
+            item.update(
+                audio_file=audio_file,
+                wav_file=wav_file,
+                temp_files=temp_files,
+            )
+        except Exception as e:
+            self.audio_processor.cleanup_temp_files(temp_files)
+            item["result"] = {"success": False, "error": str(e), "url": url}
+        return item
+
+    def transcribe_prepared(
+        self,
+        items: List[Dict[str, Any]],
+        auto_detect: bool = False,
+        output_dir: Optional[str] = None,
+        cleanup: bool = True,
+        silent: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe items from prepare_batch() with one whisper-cli run.
+
+        Args:
+            items: Items returned by prepare_batch()
+            auto_detect: Whether to use auto language detection for whisper
+            output_dir: Output directory for files
+            cleanup: Whether to clean up temporary files
+            silent: Whether to suppress whisper-cli output
+
+        Returns:
+            List of result dicts in item order; failed videos have
+            ``success`` set to False and an ``error`` message
+        """
+        if output_dir is None:
+            output_dir = os.getcwd()
+
+        pending = [item for item in items if item["result"] is None]
+        if pending:
+            language = None if auto_detect else "zh"
+            transcriptions = self.whisper_wrapper.transcribe_batch(
+                [item["wav_file"] for item in pending],
+                language=language,
+                auto_detect=auto_detect,
+                output_dir=output_dir,
+                silent=silent,
+            )
+
+            for item, result in zip(pending, transcriptions):
+                try:
+                    if not result["success"]:
+                        raise AudioProcessingError(result["error"])
+                    item["result"] = self._finalize_audio_transcription(
+                        item["url"],
+                        item["audio_file"],
+                        result,
+                        output_dir,
+                        cleanup,
+                        item["temp_files"],
+                    )
+                except Exception as e:
+                    item["result"] = {
+                        "success": False,
+                        "error": str(e),
+                        "url": item["url"],
+                    }
+                finally:
+                    if cleanup:
+                        self.audio_processor.cleanup_temp_files(
+                            item["temp_files"]
+                        )
+
+        return [item["result"] for item in items]
+
+    def _prepare_audio(
+        self, url: str, output_dir: str, temp_files: List[str]
+    ) -> Tuple[str, str]:
+        """Download audio and convert it to WAV for whisper.
+
+        Args:
+            url: YouTube video URL
+            output_dir: Output directory
+            temp_files: List that collects created temporary files
+
+        Returns:
+            Tuple of (downloaded audio file, WAV file)
+        """
+        # Download audio using yt-dlp
+        console.print("🎬 Downloading audio from YouTube...", style="cyan")
+        console.print(
+            "💡 Tip: Audio extraction may take a few minutes, please be patient",
+            style="dim",
+        )
+        audio_file = self._download_audio(url, output_dir)
+        console.print("✅ Audio download completed", style="green")
+        temp_files.append(audio_file)
+
+        # Convert to WAV for whisper
+        wav_file = self._convert_to_wav(audio_file, output_dir)
+        temp_files.append(wav_file)
+
+        return audio_file, wav_file
+
+    def _finalize_audio_transcription(
+        self,
+        url: str,
+        audio_file: str,
+        result: Dict[str, Any],
+        output_dir: str,
+        cleanup: bool,
+        temp_files: List[str],
+    ) -> Dict[str, Any]:
+        """Move the whisper output into place and build the result dict.
+
+        Args:
+            url: YouTube video URL
+            audio_file: Downloaded audio file
+            result: Transcription result from WhisperWrapper
+            output_dir: Output directory
+            cleanup: Whether temporary files will be cleaned up
+            temp_files: Temporary files created for this video
+
+        Returns:
+            Dict containing transcription results
+        """
+        # Extract video ID and title for naming
+        video_id = extract_youtube_video_id(url) or "unknown"
+        final_output = self._output_path(url, output_dir, video_id)
+
+        # Copy transcription to final location
+        if (
+            os.path.exists(result["output_file"])
+            and result["output_file"] != final_output
+        ):
+            move_file(result["output_file"], final_output)
+            result["output_file"] = final_output
+
+        return {
+            "success": True,
+            "method": "transcription",
+            "platform": "youtube",
+            "url": url,
+            "video_id": video_id,
+            "output_file": final_output,
+            "text": result["text"],
+            "language": result["language"],
+            "audio_file": audio_file,
+            "temp_files": temp_files if not cleanup else [],
+        }
+
     def _download_audio(self, url: str, output_dir: str) -> str:
         """Download audio from YouTube using yt-dlp.
 
@@ -283,27 +540,31 @@ class YouTubeHandler:
             if self.proxy:
                 cmd.extend(["--proxy", self.proxy])
 
-            # Set output directory
-            original_dir = os.getcwd()
-            os.chdir(output_dir)
+            cmd.append(url)
 
-            try:
-                cmd.append(url)
-                subprocess.run(cmd, check=True)
+            # Download into a private temp directory so concurrent batch
+            # downloads can't pick up each other's files, then move the
+            # audio into the output directory (same filesystem, a rename)
+            with managed_temp_directory(
+                prefix="ytdlp_", dir=output_dir
+            ) as temp_download_dir:
+                subprocess.run(cmd, check=True, cwd=temp_download_dir)
 
                 # Find downloaded file (yt-dlp creates files with ] in name)
-                m4a_files = [f for f in os.listdir(".") if f.endswith("].m4a")]
+                m4a_files = [
+                    f for f in os.listdir(temp_download_dir)
+                    if f.endswith("].m4a")
+                ]
                 if not m4a_files:
                     raise AudioProcessingError(
                         "No audio file found after download"
                     )
 
-                # Get the most recent file
-                audio_file = max(m4a_files, key=os.path.getctime)
-                return os.path.join(output_dir, audio_file)
-
-            finally:
-                os.chdir(original_dir)
+                audio_file = os.path.join(output_dir, m4a_files[0])
+                move_file(
+                    os.path.join(temp_download_dir, m4a_files[0]), audio_file
+                )
+                return audio_file
 
         except subprocess.CalledProcessError as e:
             raise AudioProcessingError(f"yt-dlp failed: {e}")
@@ -379,6 +640,36 @@ class YouTubeHandler:
                 },
             }
 
+    def _output_path(
+        self,
+        url: str,
+        output_dir: str,
+        video_id: str,
+        title: Optional[str] = None,
+    ) -> str:
+        """Build the transcript path for a video from its title.
+
+        Args:
+            url: YouTube video URL
+            output_dir: Output directory
+            video_id: Video ID
+            title: Title already known from a transcript API; looked up
+                with yt-dlp when missing
+
+        Returns:
+            ``"<title> [<video_id>].txt"`` in output_dir, or
+            ``"[<video_id>].txt"`` when no title is available
+        """
+        # Title priority is the transcript API, then yt-dlp metadata
+        if not title or title == video_id:
+            title = self._get_video_title(url, video_id)
+        safe_title = self._sanitize_filename(title)
+
+        # Use unified format: if title == video_id, use [video_id].txt format
+        if safe_title == video_id:
+            return os.path.join(output_dir, f"[{video_id}].txt")
+        return os.path.join(output_dir, f"{safe_title} [{video_id}].txt")
+
     def _get_video_title(self, url: str, video_id: str) -> str:
         """Get video title using yt-dlp.
         
@@ -390,56 +681,90 @@ class YouTubeHandler:
             Video title or video_id if title cannot be retrieved
         """
         try:
-            import subprocess
-            import json
-            
-            cmd = ["yt-dlp", "--dump-json", "--no-download"]
-            
-            # Add proxy if configured
-            if self.proxy:
-                cmd.extend(["--proxy", self.proxy])
-            
-            # Try using browser cookies to bypass YouTube restrictions
+            info = self._fetch_video_json(url)
+        except Exception as e:
+            console.print(f"⚠️ Error getting title for {video_id}: {e}", style="yellow")
+            return video_id
+
+        if info is None:
+            console.print(f"⚠️ Could not get title for {video_id}", style="yellow")
+            return video_id
+        return info.get("title", video_id)
+
+    def _fetch_video_json(self, url: str) -> Optional[Dict[str, Any]]:
+        """Get the yt-dlp ``--dump-json`` metadata for a video.
+
+        Results are kept on disk under ~/.cache/readvideo/metadata for a
+        day, keyed by video ID, so re-runs skip the yt-dlp launch and
+        network round-trip. With ``use_cache`` off the entry is refetched
+        and overwritten. Either way a URL is fetched at most once per
+        handler.
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Parsed metadata, or None if yt-dlp could not fetch it
+        """
+        if url in self._video_json:
+            return self._video_json[url]
+
+        video_id = extract_youtube_video_id(url)
+        cache_file = (
+            os.path.join(_METADATA_CACHE_DIR, f"{video_id}.json")
+            if video_id
+            else None
+        )
+
+        if cache_file and self.use_cache:
             try:
-                # First try with Chrome cookies
-                cmd_with_cookies = cmd + ["--cookies-from-browser", "chrome", url]
-                result = subprocess.run(
-                    cmd_with_cookies, 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=15
-                )
-                
-                if result.returncode == 0:
-                    info = json.loads(result.stdout)
-                    title = info.get("title", video_id)
-                    if title != video_id:
-                        console.print(f"✅ Got title via cookies: {title}", style="green")
-                        return title
-                    
-            except Exception:
-                # If cookies fail, try without cookies
-                pass
-            
-            # Fallback: try without cookies
-            cmd.append(url)
+                if time.time() - os.path.getmtime(cache_file) < _METADATA_TTL:
+                    info = parse_json(Path(cache_file).read_bytes())
+                    self._video_json[url] = info
+                    return info
+            except (OSError, ValueError):
+                pass  # Missing or corrupt entry; fetch again
+
+        cmd = ["yt-dlp", "--dump-json", "--no-download"]
+
+        # Add proxy if configured
+        if self.proxy:
+            cmd.extend(["--proxy", self.proxy])
+
+        info = None
+        # Try using browser cookies to bypass YouTube restrictions
+        try:
+            # First try with Chrome cookies
             result = subprocess.run(
-                cmd, 
-                capture_output=True, 
-                text=True, 
-                timeout=10
+                cmd + ["--cookies-from-browser", "chrome", url],
+                capture_output=True,
+                text=True,
+                timeout=15,
             )
-            
             if result.returncode == 0:
-                info = json.loads(result.stdout)
-                return info.get("title", video_id)
-            else:
-                console.print(f"⚠️ Could not get title for {video_id}", style="yellow")
-                return video_id
-                
-        except Exception as e:
-            console.print(f"⚠️ Error getting title for {video_id}: {e}", style="yellow")
-            return video_id
+                info = parse_json(result.stdout)
+        except Exception:
+            # If cookies fail, try without cookies
+            pass
+
+        if info is None:
+            # Fallback: try without cookies
+            result = subprocess.run(
+                cmd + [url], capture_output=True, text=True, timeout=10
+            )
+            if result.returncode != 0:
+                return None
+            info = parse_json(result.stdout)
+
+        if cache_file:
+            try:
+                os.makedirs(_METADATA_CACHE_DIR, exist_ok=True)
+                write_json(info, cache_file)
+            except OSError:
+                pass  # A missing entry only means the next run refetches
+
+        self._video_json[url] = info
+        return info
 
     def _sanitize_filename(self, filename: str, max_length: int = 100) -> str:
         """Sanitize filename to be safe for filesystem.
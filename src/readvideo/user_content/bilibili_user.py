@@ -11,8 +11,11 @@ from rich.console import Console
 from rich.progress import Progress
 
 from readvideo.platforms.bilibili import BilibiliHandler
+from readvideo.user_content.utils import (compact_video_result,
+                                          pipeline_batches)
+from readvideo.utils import write_json
 
-console = Console()
+console = Console(highlight=False)
 
 
 class BilibiliUserHandler:
@@ -21,17 +24,22 @@ class BilibiliUserHandler:
     def __init__(
         self, 
         whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin",
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        whisper_backend: str = "whisper_cpp",
     ):
         """Initialize user handler.
 
         Args:
             whisper_model_path: Path to whisper model for transcription
             proxy: Proxy URL for network requests
+            whisper_backend: Transcription backend ('whisper_cpp' or
+                'faster_whisper')
         """
         self.whisper_model_path = whisper_model_path
         self.proxy = proxy
-        self.bilibili_handler = BilibiliHandler(whisper_model_path, proxy=proxy)
+        self.bilibili_handler = BilibiliHandler(
+            whisper_model_path, proxy=proxy, whisper_backend=whisper_backend
+        )
 
     def extract_uid(self, user_input: str) -> int:
         """Extract UID from URL or direct UID input.
@@ -245,8 +253,7 @@ class BilibiliUserHandler:
             "generated_at": datetime.now().isoformat(),
         }
 
-        with open(video_list_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(data, video_list_file)
 
         console.print(
             f"💾 Saved video list to: {video_list_file}", style="dim"
@@ -331,8 +338,7 @@ class BilibiliUserHandler:
 
         status["last_update"] = datetime.now().isoformat()
 
-        with open(status_file, "w", encoding="utf-8") as f:
-            json.dump(status, f, ensure_ascii=False, indent=2)
+        write_json(status, status_file)
 
     async def process_user(
         self,
@@ -340,6 +346,10 @@ class BilibiliUserHandler:
         output_dir: str,
         start_date: Optional[str] = None,
         max_videos: Optional[int] = None,
+        batch_size: int = 8,
+        pipeline_depth: int = 2,
+        jobs: int = 1,
+        download_workers: int = 1,
     ) -> Dict[str, Any]:
         """Process all videos from a user asynchronously.
 
@@ -348,6 +358,13 @@ class BilibiliUserHandler:
             output_dir: Output directory (required)
             start_date: Start date filter (YYYY-MM-DD)
             max_videos: Maximum number of videos to process
+            batch_size: Number of videos transcribed per whisper-cli run
+            pipeline_depth: Number of prepared batches buffered ahead of
+                transcription
+            jobs: Number of batches transcribed concurrently, each by its
+                own whisper-cli process
+            download_workers: Number of videos downloaded concurrently
+                within a batch
 
         Returns:
             Processing results summary
@@ -400,78 +417,108 @@ class BilibiliUserHandler:
                     "[cyan]Processing videos...", total=len(videos)
                 )
 
+                pending = []
                 for i, video in enumerate(videos):
-                    bvid = video["bvid"]
-
                     # Skip if already processed
-                    if bvid in status["completed"]:
+                    if video["bvid"] in status["completed"]:
                         console.print(
                             f"⏭️ Skipping already processed: {video['title']}",
                             style="dim",
+                            markup=False,
                         )
                         skipped_this_run += 1
                         progress.update(task, advance=1)
-                        continue
-
-                    attempted_this_run += 1
-
-                    try:
+                    else:
+                        pending.append((i, video))
+
+                # Transcribe in batches so whisper loads its model once per
+                # batch, downloading the next batches while one is transcribed
+                transcripts_dir = os.path.join(user_dir, "transcripts")
+                batches = [
+                    pending[start:start + batch_size]
+                    for start in range(0, len(pending), batch_size)
+                ]
+
+                def prepare(batch):
+                    for i, video in batch:
                         console.print(
-                            f"\n🎬 Processing ({i+1}/{len(videos)}): {video['title']}",
+                            f"\n🎬 Preparing ({i+1}/{len(videos)}): {video['title']}",
                             style="cyan",
+                            markup=False,
                         )
+                    return self.bilibili_handler.prepare_batch(
+                        [video["video_url"] for _, video in batch],
+                        transcripts_dir,
+                        max_workers=download_workers,
+                        silent=True,
+                    )
 
-                        # Process video using existing handler with silent mode
-                        video_url = video["video_url"]
-                        result = self.bilibili_handler.process(
-                            video_url,
-                            output_dir=os.path.join(user_dir, "transcripts"),
-                            cleanup=True,
-                            silent=True,  # Use silent mode for batch processing
-                            video_info=video,  # Pass video info for better file naming
-                        )
-
-                        result["video_info"] = video
-                        results.append(result)
-
-                        # Add to completed and remove from failed if it was there
-                        if bvid not in status["completed"]:
-                            status["completed"].append(bvid)
-                        if bvid in status["failed"]:
-                            status["failed"].remove(bvid)
-
-                        successful_this_run += 1
-
-                        console.print(
-                            f"✅ Completed: {video['title']}", style="green"
-                        )
+                def transcribe(items):
+                    return self.bilibili_handler.transcribe_prepared(
+                        items,
+                        output_dir=transcripts_dir,
+                        cleanup=True,
+                        silent=True,  # Use silent mode for batch processing
+                    )
 
-                    except Exception as e:
-                        console.print(
-                            f"❌ Failed to process {video['title']}: {e}",
-                            style="red",
-                        )
+                async for batch, batch_results in pipeline_batches(
+                    batches,
+                    prepare,
+                    transcribe,
+                    depth=pipeline_depth,
+                    jobs=jobs,
+                ):
+                    attempted_this_run += len(batch)
+
+                    for (_, video), result in zip(batch, batch_results):
+                        bvid = video["bvid"]
+
+                        if result.get("success", False):
+                            results.append(compact_video_result(result, video))
+
+                            # Add to completed and remove from failed if it was there
+                            if bvid not in status["completed"]:
+                                status["completed"].append(bvid)
+                            if bvid in status["failed"]:
+                                status["failed"].remove(bvid)
+
+                            successful_this_run += 1
+
+                            console.print(
+                                f"✅ Completed: {video['title']}",
+                                style="green",
+                                markup=False,
+                            )
+                        else:
+                            console.print(
+                                f"❌ Failed to process {video['title']}: "
+                                f"{result.get('error')}",
+                                style="red",
+                                markup=False,
+                            )
+
+                            # Add to failed only if not already completed
+                            if (
+                                bvid not in status["completed"]
+                                and bvid not in status["failed"]
+                            ):
+                                status["failed"].append(bvid)
+
+                            failed_this_run += 1
+
+                            results.append(
+                                {
+                                    "success": False,
+                                    "error": result.get("error"),
+                                    "video_info": video,
+                                }
+                            )
 
-                        # Add to failed only if not already completed
-                        if (
-                            bvid not in status["completed"]
-                            and bvid not in status["failed"]
-                        ):
-                            status["failed"].append(bvid)
-
-                        failed_this_run += 1
-
-                        results.append(
-                            {
-                                "success": False,
-                                "error": str(e),
-                                "video_info": video,
-                            }
-                        )
+                        progress.update(task, advance=1)
 
-                    # Save status after each video
-                    self.save_processing_status(user_dir, status)
-                    progress.update(task, advance=1)
+                        # Save status after each video so an interruption
+                        # keeps every result already recorded
+                        self.save_processing_status(user_dir, status)
 
             # Calculate statistics
             run_stats = {
@@ -582,8 +629,7 @@ class BilibiliUserHandler:
 
         # Save summary to file
         summary_file = os.path.join(user_dir, "user_summary.json")
-        with open(summary_file, "w", encoding="utf-8") as f:
-            json.dump(summary, f, ensure_ascii=False, indent=2)
+        write_json(summary, summary_file)
 
         console.print(f"📊 Summary saved to: {summary_file}", style="dim")
 
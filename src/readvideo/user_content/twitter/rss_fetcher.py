@@ -9,33 +9,54 @@ import defusedxml.ElementTree as ET
 import httpx
 from rich.console import Console
 
-console = Console()
+console = Console(highlight=False)
 logger = logging.getLogger(__name__)
 
 
+def create_client() -> httpx.AsyncClient:
+    """Create an HTTP client configured for Nitter requests.
+
+    The client keeps connections alive between requests, so a single
+    instance can be shared by every fetch in a run.
+
+    Returns:
+        Configured httpx.AsyncClient
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(15.0),
+        limits=httpx.Limits(
+            max_connections=100, max_keepalive_connections=8
+        ),
+        headers={
+            "User-Agent": (
+                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+                "AppleWebKit/537.36 (KHTML, like Gecko) "
+                "Chrome/91.0.4472.124 Safari/537.36"
+            ),
+            "Accept": "application/rss+xml, application/xml, text/xml",
+            "Accept-Language": "en-US,en;q=0.9",
+            "Connection": "keep-alive",
+        },
+    )
+
+
 class RSSFetcher:
     """RSS API client with pagination support."""
 
-    def __init__(self, nitter_url: str = "http://10.144.0.3:42853"):
+    def __init__(
+        self,
+        nitter_url: str = "http://10.144.0.3:42853",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize RSS fetcher.
 
         Args:
             nitter_url: Base URL of the Nitter instance
+            client: Shared HTTP client; one is created (and owned) when omitted
         """
         self.nitter_url = nitter_url.rstrip("/")
-        self.client = httpx.AsyncClient(
-            timeout=httpx.Timeout(15.0),
-            headers={
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/91.0.4472.124 Safari/537.36"
-                ),
-                "Accept": "application/rss+xml, application/xml, text/xml",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Connection": "keep-alive",
-            },
-        )
+        self._owns_client = client is None
+        self.client = client if client is not None else create_client()
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -43,7 +64,8 @@ class RSSFetcher:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self.client.aclose()
+        if self._owns_client:
+            await self.client.aclose()
 
     async def get_cursor_from_html(self, username: str) -> Optional[str]:
         """Get first cursor from HTML page for pagination.
@@ -70,6 +92,60 @@ class RSSFetcher:
             logger.error(f"Failed to get cursor: {e}")
             return None
 
+    async def _fetch_next_cursor(
+        self, username: str, cursor: str
+    ) -> Optional[str]:
+        """Get the cursor that follows ``cursor`` from its HTML page.
+
+        Args:
+            username: Twitter username
+            cursor: Current pagination cursor
+
+        Returns:
+            Next cursor, or None when the timeline end is reached or the
+            cursor page cannot be fetched
+        """
+        try:
+            html_url = f"{self.nitter_url}/{username}?cursor={cursor}"
+            response = await self.client.get(html_url)
+            response.raise_for_status()
+
+            if not response.text:
+                logger.info(
+                    "✅ Empty response for cursor page, fetching complete"
+                )
+                return None
+
+            cursor_match = re.search(r'href="\?cursor=([^"]*)"', response.text)
+
+            if not cursor_match:
+                logger.info("✅ No more cursors found, fetching complete")
+                return None
+
+            new_cursor = cursor_match.group(1)
+            if new_cursor == cursor:  # Ensure cursor changed
+                logger.info("✅ Cursor unchanged, reached last page")
+                return None
+
+            logger.debug(f"🔑 Next cursor: {new_cursor[:50]}...")
+            return new_cursor
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code == 404:
+                logger.info(
+                    "✅ Cursor page not found (404), reached end of timeline"
+                )
+            else:
+                logger.warning(
+                    f"⚠️  HTTP error getting cursor: {e.response.status_code}"
+                )
+            return None
+        except Exception as e:
+            error_type = type(e).__name__
+            logger.warning(f"⚠️  Failed to get next cursor: {error_type}: {e}")
+            logger.info("✅ Stopping pagination due to cursor error")
+            return None
+
     async def fetch_rss_page(
         self,
         username: str,
@@ -225,10 +301,14 @@ class RSSFetcher:
         seen_tweet_ids = set()
         page_num = 1
 
-        # Get first page (no cursor)
+        # Get first page (no cursor) together with the first pagination
+        # cursor; the two requests are independent
         update_progress(f"📄 Page {page_num} (first page)")
-        tweets, success = await self.fetch_rss_page(
-            username, None, exclude_retweets, exclude_replies
+        (tweets, success), cursor = await asyncio.gather(
+            self.fetch_rss_page(
+                username, None, exclude_retweets, exclude_replies
+            ),
+            self.get_cursor_from_html(username),
         )
 
         if not success or not tweets:
@@ -244,8 +324,6 @@ class RSSFetcher:
         all_tweets.extend(tweets)
         update_progress(f"📊 Total tweets: {len(all_tweets)}")
 
-        # Get first cursor for pagination
-        cursor = await self.get_cursor_from_html(username)
         if not cursor:
             logger.warning(
                 "❌ No pagination cursor found, returning first page only"
@@ -268,8 +346,13 @@ class RSSFetcher:
                 )
                 await asyncio.sleep(wait_time)
 
-            tweets, success = await self.fetch_rss_page(
-                username, cursor, exclude_retweets, exclude_replies
+            # The RSS page and the HTML page holding the next cursor are
+            # both keyed on the current cursor, so fetch them concurrently
+            (tweets, success), next_cursor = await asyncio.gather(
+                self.fetch_rss_page(
+                    username, cursor, exclude_retweets, exclude_replies
+                ),
+                self._fetch_next_cursor(username, cursor),
             )
 
             if not success:
@@ -321,52 +404,9 @@ class RSSFetcher:
                 f"📊 Total tweets: {len(all_tweets)} (+{len(new_tweets)} new)"
             )
 
-            # Get next page cursor
-            try:
-                html_url = f"{self.nitter_url}/{username}?cursor={cursor}"
-                response = await self.client.get(html_url)
-                response.raise_for_status()
-
-                if not response.text:
-                    logger.info(
-                        "✅ Empty response for cursor page, fetching complete"
-                    )
-                    break
-
-                cursor_match = re.search(
-                    r'href="\?cursor=([^"]*)"', response.text
-                )
-
-                if cursor_match:
-                    new_cursor = cursor_match.group(1)
-                    if new_cursor != cursor:  # Ensure cursor changed
-                        cursor = new_cursor
-                        logger.debug(f"🔑 Next cursor: {cursor[:50]}...")
-                    else:
-                        logger.info("✅ Cursor unchanged, reached last page")
-                        break
-                else:
-                    logger.info("✅ No more cursors found, fetching complete")
-                    break
-
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.info(
-                        "✅ Cursor page not found (404), reached end of timeline"
-                    )
-                else:
-                    logger.warning(
-                        f"⚠️  HTTP error getting cursor: "
-                        f"{e.response.status_code}"
-                    )
-                break
-            except Exception as e:
-                error_type = type(e).__name__
-                logger.warning(
-                    f"⚠️  Failed to get next cursor: {error_type}: {e}"
-                )
-                logger.info("✅ Stopping pagination due to cursor error")
+            if not next_cursor:
                 break
+            cursor = next_cursor
 
             page_num += 1
 
@@ -3,6 +3,7 @@
 from pathlib import Path
 from typing import Dict, Optional
 
+import httpx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
@@ -10,20 +11,25 @@ from readvideo.user_content.twitter.rss_fetcher import RSSFetcher
 from readvideo.user_content.twitter.utils import (filter_tweets_by_content_type, filter_tweets_by_date,
                     save_tweets_to_json, save_tweets_to_markdown)
 
-console = Console()
+console = Console(highlight=False)
 
 
 class TwitterHandler:
     """Handler for fetching Twitter content via RSS."""
 
-    def __init__(self, nitter_url: str = "http://10.144.0.3:42853"):
+    def __init__(
+        self,
+        nitter_url: str = "http://10.144.0.3:42853",
+        client: Optional[httpx.AsyncClient] = None,
+    ):
         """Initialize TwitterHandler.
 
         Args:
             nitter_url: Base URL of the Nitter instance
+            client: Shared HTTP client passed through to the RSS fetcher
         """
         self.nitter_url = nitter_url.rstrip("/")
-        self.fetcher = RSSFetcher(self.nitter_url)
+        self.fetcher = RSSFetcher(self.nitter_url, client=client)
 
     async def process_user(
         self,
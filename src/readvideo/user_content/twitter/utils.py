@@ -1,6 +1,5 @@
 """Utility functions for Twitter content processing."""
 
-import json
 import re
 from datetime import datetime
 from pathlib import Path
@@ -8,7 +7,9 @@ from typing import Dict, List, Optional
 
 from rich.console import Console
 
-console = Console()
+from readvideo.utils import write_json
+
+console = Console(highlight=False)
 
 
 def parse_twitter_date(date_str: str) -> Optional[datetime]:
@@ -314,8 +315,7 @@ def save_tweets_to_json(
     }
 
     try:
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(data, filename)
         console.print(f"💾 JSON saved: {filename}", style="green")
         return filename
     except Exception as e:
@@ -1,8 +1,53 @@
 """Utility functions for user content processing."""
 
+import asyncio
 import re
-from datetime import datetime
-from typing import Optional, Tuple
+from datetime import date, datetime
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+_DATE_RE = re.compile(r"(\d{4})-(\d{2})-(\d{2})")
+_WHITESPACE_RE = re.compile(r"\s+")
+# Characters that are invalid in filenames on common filesystems
+_INVALID_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', "_"))
+
+# Earliest accepted date (Bilibili wasn't around before 2005)
+_MIN_DATE = date(2005, 1, 1)
+
+_DATE_FORMAT_ERROR = (
+    "Invalid date format. Use YYYY-MM-DD format (e.g., 2024-01-15)"
+)
+
+
+def _parse_iso_date(date_string: str) -> Optional[date]:
+    """Parse an exact YYYY-MM-DD string without going through strptime.
+
+    Args:
+        date_string: Date string to parse
+
+    Returns:
+        Parsed date, or None if the string is not a valid calendar date
+    """
+    match = _DATE_RE.fullmatch(date_string)
+    if not match:
+        return None
+    try:
+        # The date constructor rejects out-of-range months and days
+        return date(*map(int, match.groups()))
+    except ValueError:
+        return None
 
 
 def validate_date_format(date_string: str) -> bool:
@@ -17,17 +62,7 @@ def validate_date_format(date_string: str) -> bool:
     if not date_string:
         return False
 
-    # Check exact format first (must be exactly YYYY-MM-DD)
-    import re
-
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_string):
-        return False
-
-    try:
-        datetime.strptime(date_string, "%Y-%m-%d")
-        return True
-    except ValueError:
-        return False
+    return _parse_iso_date(date_string) is not None
 
 
 def validate_date_with_range_check(date_string: str) -> Tuple[bool, str]:
@@ -42,44 +77,24 @@ def validate_date_with_range_check(date_string: str) -> Tuple[bool, str]:
     if not date_string:
         return False, "Date string is empty"
 
-    # Check exact format first (must be exactly YYYY-MM-DD)
-    import re
-
-    if not re.match(r"^\d{4}-\d{2}-\d{2}$", date_string):
-        return (
-            False,
-            "Invalid date format. Use YYYY-MM-DD format (e.g., 2024-01-15)",
-        )
-
-    # Check basic format
-    try:
-        parsed_date = datetime.strptime(date_string, "%Y-%m-%d")
-    except ValueError:
-        return (
-            False,
-            "Invalid date format. Use YYYY-MM-DD format (e.g., 2024-01-15)",
-        )
+    parsed_date = _parse_iso_date(date_string)
+    if parsed_date is None:
+        return False, _DATE_FORMAT_ERROR
 
-    # Check if date is in reasonable range
-    current_date = datetime.now()
-
-    # Don't allow dates too far in the past (before 2005 when Bilibili wasn't around)
-    min_date = datetime(2005, 1, 1)
-    if parsed_date < min_date:
+    # Don't allow dates too far in the past
+    if parsed_date < _MIN_DATE:
         return (
             False,
             f"Date too early. Bilibili videos start from "
-            f"{min_date.strftime('%Y-%m-%d')}",
+            f"{_MIN_DATE.isoformat()}",
         )
 
-    # Don't allow future dates (with 1 day buffer for timezone differences)
-    max_date = current_date.replace(
-        hour=23, minute=59, second=59, microsecond=999999
-    )
-    if parsed_date.date() > max_date.date():
+    # Don't allow future dates
+    today = date.today()
+    if parsed_date > today:
         return (
             False,
-            f"Future dates not allowed. Latest date: {max_date.strftime('%Y-%m-%d')}",
+            f"Future dates not allowed. Latest date: {today.isoformat()}",
         )
 
     return True, ""
@@ -131,10 +146,9 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename safe for filesystem
     """
     # Remove or replace invalid characters
-    sanitized = re.sub(r'[<>:"/\\|?*]', "_", filename)
+    sanitized = filename.translate(_INVALID_FILENAME_TABLE)
     # Remove extra spaces and dots
-    sanitized = re.sub(r"\s+", "_", sanitized.strip())
-    sanitized = re.sub(r"\.+$", "", sanitized)
+    sanitized = _WHITESPACE_RE.sub("_", sanitized.strip()).rstrip(".")
 
     # Truncate if too long (keep under 200 chars for safety)
     if len(sanitized) > 200:
@@ -165,6 +179,105 @@ def format_duration(seconds: int) -> str:
         return f"{minutes:02d}:{seconds:02d}"
 
 
+def compact_video_result(
+    result: Dict[str, Any], video_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Reduce a per-video processing result to what batch summaries need.
+
+    The transcript text is already written to ``output_file``, so it is
+    dropped here to keep batch runs from holding every transcript in memory.
+
+    Args:
+        result: Result dict returned by a platform handler
+        video_info: Video metadata to attach to the record
+
+    Returns:
+        Result dict without the transcript text, with ``video_info`` set
+    """
+    record = {key: value for key, value in result.items() if key != "text"}
+    record["video_info"] = video_info
+    return record
+
+
+async def pipeline_batches(
+    batches: Sequence[T],
+    prepare: Callable[[T], Any],
+    transcribe: Callable[[Any], List[Dict[str, Any]]],
+    depth: int = 2,
+    jobs: int = 1,
+) -> AsyncIterator[Tuple[T, List[Dict[str, Any]]]]:
+    """Overlap preparing upcoming batches with transcribing earlier ones.
+
+    A producer task runs ``prepare`` (downloads, conversion) for each batch
+    in a worker thread and queues the output; ``jobs`` consumer tasks run
+    ``transcribe`` on queued batches, also in threads. At most ``depth``
+    prepared batches wait in the queue, which bounds the disk used by
+    audio files.
+
+    Args:
+        batches: Batches to process, in order
+        prepare: Blocking callable that prepares one batch
+        transcribe: Blocking callable that transcribes a prepared batch
+        depth: Maximum number of prepared batches buffered ahead
+        jobs: Number of batches transcribed concurrently
+
+    Yields:
+        Tuples of (batch, results); in input order when ``jobs`` is 1,
+        otherwise in completion order
+    """
+    prepared_queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+    # Results and finished tasks, in the order they happen
+    done_queue: asyncio.Queue = asyncio.Queue()
+
+    async def producer() -> None:
+        error: Optional[Exception] = None
+        try:
+            for batch in batches:
+                prepared = await asyncio.to_thread(prepare, batch)
+                await prepared_queue.put((batch, prepared))
+        except Exception as e:
+            error = e
+        # Skipped on cancellation, when no consumer may be left to drain
+        # the queue and the put would block forever
+        for _ in range(jobs):
+            await prepared_queue.put(None)
+        if error is not None:
+            raise error
+
+    async def consumer() -> None:
+        while (entry := await prepared_queue.get()) is not None:
+            batch, prepared = entry
+            results = await asyncio.to_thread(transcribe, prepared)
+            await done_queue.put((batch, results))
+
+    producer_task = asyncio.create_task(producer())
+    tasks = [producer_task]
+    tasks.extend(asyncio.create_task(consumer()) for _ in range(jobs))
+    for task in tasks:
+        task.add_done_callback(done_queue.put_nowait)
+    try:
+        running = len(tasks)
+        while running:
+            entry = await done_queue.get()
+            if not isinstance(entry, asyncio.Task):
+                yield entry
+                continue
+            running -= 1
+            error = None if entry.cancelled() else entry.exception()
+            # A failed consumer stops the pipeline at once, since the
+            # other tasks may be blocked on queues nobody drains any more.
+            # A failed producer still lets batches already queued finish.
+            if error is not None and entry is not producer_task:
+                raise error
+        producer_error = producer_task.exception()
+        if producer_error is not None:
+            raise producer_error
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
 def extract_video_id_from_url(url: str) -> Optional[str]:
     """Extract BV ID from Bilibili video URL.
 
@@ -1,5 +1,6 @@
 """YouTube channel content processing handler."""
 
+import asyncio
 import json
 import os
 import re
@@ -11,8 +12,11 @@ from rich.console import Console
 from rich.progress import Progress
 
 from readvideo.platforms.youtube import YouTubeHandler
+from readvideo.user_content.utils import (compact_video_result,
+                                          pipeline_batches)
+from readvideo.utils import write_json
 
-console = Console()
+console = Console(highlight=False)
 
 
 class YouTubeUserHandler:
@@ -21,17 +25,22 @@ class YouTubeUserHandler:
     def __init__(
         self, 
         whisper_model_path: str = "~/.whisper-models/ggml-large-v3.bin",
-        proxy: Optional[str] = None
+        proxy: Optional[str] = None,
+        whisper_backend: str = "whisper_cpp",
     ):
         """Initialize user handler.
 
         Args:
             whisper_model_path: Path to whisper model for transcription
             proxy: Proxy URL for network requests
+            whisper_backend: Transcription backend ('whisper_cpp' or
+                'faster_whisper')
         """
         self.whisper_model_path = whisper_model_path
         self.proxy = proxy
-        self.youtube_handler = YouTubeHandler(whisper_model_path, proxy=proxy)
+        self.youtube_handler = YouTubeHandler(
+            whisper_model_path, proxy=proxy, whisper_backend=whisper_backend
+        )
 
     def extract_channel_info(self, channel_input: str) -> Dict[str, str]:
         """Extract channel information from URL or username input.
@@ -105,7 +114,7 @@ class YouTubeUserHandler:
 
         raise ValueError(f"Cannot extract channel info from: {channel_input}")
 
-    def get_channel_videos(
+    async def get_channel_videos(
         self,
         channel_url: str,
         start_date: Optional[str] = None,
@@ -142,12 +151,23 @@ class YouTubeUserHandler:
             cmd.append(channel_url)
 
             console.print("🔍 Fetching channel videos...", style="cyan")
-            result = subprocess.run(
-                cmd, capture_output=True, text=True, check=True
+            # Run yt-dlp without blocking the event loop
+            process = await asyncio.create_subprocess_exec(
+                *cmd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
+            stdout, stderr = await process.communicate()
+            returncode = await process.wait()
+            if returncode != 0:
+                raise subprocess.CalledProcessError(
+                    returncode, cmd, output=stdout, stderr=stderr
+                )
+
+            output = stdout.decode("utf-8", errors="replace")
 
             videos = []
-            for line in result.stdout.strip().split("\n"):
+            for line in output.strip().split("\n"):
                 if not line:
                     continue
 
@@ -237,8 +257,7 @@ class YouTubeUserHandler:
             "generated_at": datetime.now().isoformat(),
         }
 
-        with open(video_list_file, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        write_json(data, video_list_file)
 
         console.print(
             f"💾 Saved video list to: {video_list_file}", style="dim"
@@ -313,8 +332,7 @@ class YouTubeUserHandler:
         cleaned_status = self.cleanup_processing_status(status)
 
         try:
-            with open(status_file, "w", encoding="utf-8") as f:
-                json.dump(cleaned_status, f, ensure_ascii=False, indent=2)
+            write_json(cleaned_status, status_file)
         except Exception as e:
             console.print(
                 f"⚠️ Error saving processing status: {e}", style="yellow"
@@ -352,8 +370,7 @@ class YouTubeUserHandler:
         # Save summary to file
         summary_file = os.path.join(channel_dir, "processing_summary.json")
         try:
-            with open(summary_file, "w", encoding="utf-8") as f:
-                json.dump(summary, f, ensure_ascii=False, indent=2)
+            write_json(summary, summary_file)
         except Exception as e:
             console.print(f"⚠️ Error saving summary: {e}", style="yellow")
 
@@ -365,6 +382,10 @@ class YouTubeUserHandler:
         output_dir: str,
         start_date: Optional[str] = None,
         max_videos: Optional[int] = None,
+        batch_size: int = 8,
+        pipeline_depth: int = 2,
+        jobs: int = 1,
+        download_workers: int = 1,
     ) -> Dict[str, Any]:
         """Process all videos from a YouTube channel.
 
@@ -373,6 +394,13 @@ class YouTubeUserHandler:
             output_dir: Output directory for transcripts
             start_date: Start date filter (YYYY-MM-DD format)
             max_videos: Maximum number of videos to process
+            batch_size: Number of videos transcribed per whisper-cli run
+            pipeline_depth: Number of prepared batches buffered ahead of
+                transcription
+            jobs: Number of batches transcribed concurrently, each by its
+                own whisper-cli process
+            download_workers: Number of videos prepared concurrently
+                within a batch
 
         Returns:
             Dictionary containing processing results and statistics
@@ -394,7 +422,7 @@ class YouTubeUserHandler:
             console.print(f"📁 Output directory: {channel_dir}", style="dim")
 
             # Get channel videos
-            videos = self.get_channel_videos(
+            videos = await self.get_channel_videos(
                 channel_info["url"], start_date, max_videos
             )
 
@@ -440,79 +468,106 @@ class YouTubeUserHandler:
                     total=len(videos),
                 )
 
+                pending = []
                 for i, video in enumerate(videos):
-                    video_id = video["video_id"]
-
                     # Skip if already processed
-                    if video_id in status["completed"]:
+                    if video["video_id"] in status["completed"]:
                         console.print(
                             f"⏭️ Skipping already processed: {video['title'][:50]}...",
                             style="dim",
+                            markup=False,
                         )
                         skipped_this_run += 1
                         progress.update(task, advance=1)
-                        continue
-
-                    attempted_this_run += 1
+                    else:
+                        pending.append((i, video))
+
+                # Transcribe in batches so whisper loads its model once per
+                # batch, downloading the next batches while one is transcribed
+                transcripts_dir = os.path.join(channel_dir, "transcripts")
+                batches = [
+                    pending[start:start + batch_size]
+                    for start in range(0, len(pending), batch_size)
+                ]
 
-                    try:
+                def prepare(batch):
+                    for i, video in batch:
                         console.print(
-                            f"\n🎬 Processing ({i+1}/{len(videos)}): {video['title'][:50]}...",
+                            f"\n🎬 Preparing ({i+1}/{len(videos)}): {video['title'][:50]}...",
                             style="cyan",
+                            markup=False,
                         )
+                    return self.youtube_handler.prepare_batch(
+                        [video["video_url"] for _, video in batch],
+                        transcripts_dir,
+                        max_workers=download_workers,
+                    )
+
+                def transcribe(items):
+                    return self.youtube_handler.transcribe_prepared(
+                        items,
+                        output_dir=transcripts_dir,
+                        cleanup=True,
+                    )
+
+                async for batch, batch_results in pipeline_batches(
+                    batches,
+                    prepare,
+                    transcribe,
+                    depth=pipeline_depth,
+                    jobs=jobs,
+                ):
+                    attempted_this_run += len(batch)
+
+                    for (_, video), result in zip(batch, batch_results):
+                        video_id = video["video_id"]
+
+                        if result.get("success", False):
+                            results.append(compact_video_result(result, video))
+
+                            # Add to completed and remove from failed if it was there
+                            if video_id not in status["completed"]:
+                                status["completed"].append(video_id)
+                            if video_id in status["failed"]:
+                                status["failed"].remove(video_id)
+
+                            successful_this_run += 1
+
+                            console.print(
+                                f"✅ Completed: {video['title'][:50]}...",
+                                style="green",
+                                markup=False,
+                            )
+                        else:
+                            console.print(
+                                f"❌ Failed to process {video['title'][:50]}...: "
+                                f"{result.get('error')}",
+                                style="red",
+                                markup=False,
+                            )
+
+                            # Add to failed only if not already completed
+                            if (
+                                video_id not in status["completed"]
+                                and video_id not in status["failed"]
+                            ):
+                                status["failed"].append(video_id)
+
+                            failed_this_run += 1
+
+                            results.append(
+                                {
+                                    "success": False,
+                                    "error": result.get("error"),
+                                    "video_info": video,
+                                }
+                            )
 
-                        # Process video using existing handler
-                        video_url = video["video_url"]
-                        result = self.youtube_handler.process(
-                            video_url,
-                            output_dir=os.path.join(
-                                channel_dir, "transcripts"
-                            ),
-                            cleanup=True,
-                        )
-
-                        result["video_info"] = video
-                        results.append(result)
-
-                        # Add to completed and remove from failed if it was there
-                        if video_id not in status["completed"]:
-                            status["completed"].append(video_id)
-                        if video_id in status["failed"]:
-                            status["failed"].remove(video_id)
-
-                        successful_this_run += 1
-
-                        console.print(
-                            f"✅ Completed: {video['title'][:50]}...",
-                            style="green",
-                        )
-
-                    except Exception as e:
-                        console.print(
-                            f"❌ Failed to process {video['title'][:50]}...: {e}",
-                            style="red",
-                        )
-
-                        # Add to failed only if not already completed
-                        if (
-                            video_id not in status["completed"]
-                            and video_id not in status["failed"]
-                        ):
-                            status["failed"].append(video_id)
-
-                        failed_this_run += 1
-
-                        results.append(
-                            {
-                                "success": False,
-                                "error": str(e),
-                                "video_info": video,
-                            }
-                        )
+                        progress.update(task, advance=1)
 
-                    # Save status after each video
-                    self.save_processing_status(channel_dir, status)
-                    progress.update(task, advance=1)
+                        # Save status after each video so an interruption
+                        # keeps every result already recorded
+                        self.save_processing_status(channel_dir, status)
 
             # Calculate statistics
             run_stats = {
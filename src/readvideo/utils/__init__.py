@@ -1,11 +1,73 @@
 """Simple utilities for ReadVideo application."""
 
+import errno
+import json
+import os
 import re
 import shutil
+import stat as stat_module
 import tempfile
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator, List, Optional, Union
+from typing import Any, Generator, Iterable, List, Optional, Tuple, Union
+
+from rich.console import Console
+
+orjson: Any
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One translate() pass: unsafe characters become '_', control chars go
+_FILENAME_TABLE = str.maketrans(
+    {**dict.fromkeys('<>:"/\\|?*', '_'),
+     **dict.fromkeys([*map(chr, range(0x20)), '\x7f'])}
+)
+_YOUTUBE_ID_RE = re.compile(
+    r"(?:youtube\.com\/watch\?v=|youtu\.be\/|youtube\.com\/.*[?&]v=)"
+    r"([a-zA-Z0-9_-]{11})"
+)
+# /video/BV... path first, else any standalone BV id (?bvid=, bare id)
+_BILIBILI_ID_RE = re.compile(r"(?:bilibili\.com\/video\/|\b)(BV[a-zA-Z0-9]+)")
+
+# Leading bytes of the audio containers downloaders hand us
+_AUDIO_MAGICS = {
+    b"ID3": "mp3",
+    b"\xff\xfb": "mp3",
+    b"\xff\xf3": "mp3",
+    b"\xff\xf2": "mp3",
+    b"\xff\xf1": "aac",
+    b"\xff\xf9": "aac",
+    b"OggS": "ogg",
+    b"fLaC": "flac",
+    b"RIFF": "wav",
+}
+# Error pages saved in place of the media (anti-bot blocks, API errors)
+_TEXT_PREFIXES = (b"<", b"{")
+
+console = Console(highlight=False)
+
+
+def print_status(
+    message: str, style: Optional[str] = None, silent: bool = False
+) -> None:
+    """Report progress.
+
+    Rendered with Rich on a terminal; otherwise written as a plain line,
+    which skips styling work for piped runs.
+
+    Args:
+        message: Plain-text status message (no markup)
+        style: Rich style used on a terminal
+        silent: Suppress the message (batch processing)
+    """
+    if silent:
+        return
+    if console.is_terminal:
+        console.print(message, style=style, markup=False)
+    else:
+        print(message)
 
 
 # File utilities
@@ -15,9 +77,7 @@ def sanitize_filename(filename: str, max_length: int = 100) -> str:
         return "untitled"
     
     # Replace problematic characters
-    safe_name = re.sub(r'[<>:"/\\|?*]', '_', filename)
-    safe_name = re.sub(r'[\x00-\x1f\x7f]', '', safe_name)
-    safe_name = safe_name.strip(' .')
+    safe_name = filename.translate(_FILENAME_TABLE).strip(' .')
     
     if len(safe_name) > max_length:
         safe_name = safe_name[:max_length].rstrip(' .')
@@ -30,6 +90,32 @@ def detect_file_format(file_path: Union[str, Path]) -> str:
     return Path(file_path).suffix.lower().lstrip('.') or "unknown"
 
 
+def detect_audio_format(file_path: Union[str, Path]) -> str:
+    """Identify an audio file from its first 12 bytes.
+
+    Files whose header is not a known audio magic fall back to the
+    extension, unless they start like an HTML/JSON document.
+    """
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return "unknown"
+    try:
+        header = os.read(fd, 12)
+    finally:
+        os.close(fd)
+
+    if header[4:8] == b"ftyp":
+        return "m4a"
+    for size in (4, 3, 2):
+        audio_format = _AUDIO_MAGICS.get(header[:size])
+        if audio_format:
+            return audio_format
+    if header.lstrip().startswith(_TEXT_PREFIXES):
+        return "unknown"
+    return detect_file_format(file_path)
+
+
 def cleanup_files(file_paths: List[Union[str, Path]]) -> None:
     """Delete multiple files safely."""
     for file_path in file_paths or []:
@@ -39,27 +125,66 @@ def cleanup_files(file_paths: List[Union[str, Path]]) -> None:
             pass
 
 
+def move_file(src: Union[str, Path], dst: Union[str, Path]) -> None:
+    """Move a file, replacing dst, across filesystems if needed.
+
+    Same-filesystem moves are a single rename. Otherwise the data is copied
+    with shutil.copyfile (in-kernel sendfile on Linux) and src removed, so
+    keep transcripts and audio on one filesystem for the fast path.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.copyfile(src, dst)
+        os.unlink(src)
+
+
 def validate_file_path(file_path: Union[str, Path]) -> Path:
     """Validate and normalize file path."""
     return Path(file_path).resolve()
 
 
 def get_file_info(file_path: Union[str, Path]):
-    """Get basic file information."""
+    """Get basic file information from a single stat() call."""
     path = Path(file_path)
-    if not path.exists():
+    try:
+        stat = path.stat()
+    except OSError:
         return {"exists": False, "path": str(path)}
-    
-    stat = path.stat()
+
     return {
         "exists": True,
         "path": str(path),
+        "name": path.name,
+        "stem": path.stem,
+        "extension": detect_file_format(path),
         "size": stat.st_size,
-        "is_file": path.is_file(),
+        "mtime_ns": stat.st_mtime_ns,
+        "is_file": stat_module.S_ISREG(stat.st_mode),
         "format": detect_file_format(path)
     }
 
 
+def write_json(data: Any, file_path: Union[str, Path]) -> None:
+    """Write data as indented UTF-8 JSON, using orjson when installed."""
+    if orjson is not None:
+        Path(file_path).write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        )
+        return
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def parse_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 def processing_context(temp_files: List[Union[str, Path]]):
     """Simple context for cleanup."""
     class ProcessingContext:
@@ -70,16 +195,24 @@ def processing_context(temp_files: List[Union[str, Path]]):
     return ProcessingContext()
 
 
-def cleanup_file_list(file_paths: List[Union[str, Path]], ignore_errors: bool = True) -> List[str]:
-    """Cleanup files and return failed paths."""
-    failed = []
+def cleanup_file_list(
+    file_paths: Iterable[Union[str, Path]], ignore_errors: bool = True
+) -> Tuple[List[str], List[str]]:
+    """Cleanup files and return (removed, failed) paths.
+
+    Paths that did not exist are in neither list.
+    """
+    removed, failed = [], []
     for file_path in file_paths or []:
         try:
-            Path(file_path).unlink(missing_ok=True)
+            Path(file_path).unlink()
+            removed.append(str(file_path))
+        except FileNotFoundError:
+            pass
         except (OSError, PermissionError):
             if not ignore_errors:
                 failed.append(str(file_path))
-    return failed
+    return removed, failed
 
 
 # Video utilities
@@ -87,22 +220,15 @@ def extract_youtube_video_id(url: str) -> Optional[str]:
     """Extract YouTube video ID from URL."""
     if not url:
         return None
-    patterns = [
-        r"(?:youtube\.com\/watch\?v=|youtu\.be\/)([a-zA-Z0-9_-]{11})",
-        r"youtube\.com\/.*[?&]v=([a-zA-Z0-9_-]{11})",
-    ]
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    match = _YOUTUBE_ID_RE.search(url)
+    return match.group(1) if match else None
 
 
 def extract_bilibili_video_id(url: str) -> Optional[str]:
     """Extract Bilibili video ID from URL."""
     if not url:
         return None
-    match = re.search(r"bilibili\.com\/video\/(BV[a-zA-Z0-9]+)", url)
+    match = _BILIBILI_ID_RE.search(url)
     return match.group(1) if match else None
 
 
@@ -128,22 +254,20 @@ def detect_video_platform(url: str) -> Optional[str]:
 
 # Resource management
 @contextmanager
-def managed_temp_directory(prefix: str = "readvideo_") -> Generator[str, None, None]:
+def managed_temp_directory(
+    prefix: str = "readvideo_", dir: Optional[Union[str, Path]] = None
+) -> Generator[str, None, None]:
     """Create temporary directory with auto cleanup."""
-    temp_dir = tempfile.mkdtemp(prefix=prefix)
-    try:
+    with tempfile.TemporaryDirectory(
+        prefix=prefix, dir=dir, ignore_cleanup_errors=True
+    ) as temp_dir:
         yield temp_dir
-    finally:
-        try:
-            shutil.rmtree(temp_dir, ignore_errors=True)
-        except:
-            pass
 
 
 __all__ = [
-    'sanitize_filename', 'detect_file_format', 'cleanup_files',
-    'validate_file_path', 'get_file_info', 'processing_context', 'cleanup_file_list',
+    'sanitize_filename', 'detect_file_format', 'detect_audio_format', 'cleanup_files', 'move_file',
+    'validate_file_path', 'get_file_info', 'write_json', 'parse_json', 'processing_context', 'cleanup_file_list',
     'extract_youtube_video_id', 'extract_bilibili_video_id',
     'is_youtube_url', 'is_bilibili_url', 'detect_video_platform',
-    'managed_temp_directory'
+    'managed_temp_directory', 'print_status'
 ]
\ No newline at end of file